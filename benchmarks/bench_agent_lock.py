@@ -0,0 +1,70 @@
+"""
+Agent lock benchmark against a local mock glz server.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_agent_lock --iterations 200 --latency 0.005
+"""
+import argparse
+import time
+
+from .mock_server import MockRiotServer, MockValClient, format_latency
+
+AGENT_ID = "e370fa57-4757-3604-3648-499e1f642d3f"
+
+
+def measure(server, iterations, operation, before=None):
+    samples = []
+    server.reset_counts()
+    for _ in range(iterations):
+        if before:
+            before()
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    # The pre-warm HEAD is not part of the lock itself
+    lock_requests = sum(count for name, count in server.counts.items() if not name.startswith("unrouted HEAD"))
+    return samples, lock_requests / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    with MockRiotServer(latency=args.latency) as server:
+        api = MockValClient(server)
+        pregame = api.pregame
+
+        def resolve_and_lock():
+            pregame.clear_session()
+            pregame.lock_pregame_agent(AGENT_ID)
+
+        def lock_from_session():
+            pregame.lock_pregame_agent(AGENT_ID)
+
+        def drop_connections():
+            api.session.close()
+
+        def drop_connections_and_prewarm():
+            api.session.close()
+            pregame.prewarm()
+
+        pregame.get_session()
+
+        rows = [
+            ("resolve MatchID + lock", *measure(server, args.iterations, resolve_and_lock)),
+            ("lock on cached session", *measure(server, args.iterations, lock_from_session)),
+            ("lock, cold connection", *measure(server, args.iterations, lock_from_session, drop_connections)),
+            ("lock, pre-warmed connection",
+             *measure(server, args.iterations, lock_from_session, drop_connections_and_prewarm)),
+        ]
+
+        print(f"{args.iterations} iterations, {args.latency * 1000:.1f} ms simulated latency")
+        for name, samples, requests_per_op in rows:
+            print(format_latency(name, samples, requests_per_op))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Serial vs batched lookups for a 10-player lobby against the local mock server.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch --iterations 20 --latency 0.02
+"""
+import argparse
+import time
+
+from . import fixtures
+from .mock_server import MockRiotServer, MockValClient, format_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated server latency in seconds")
+    parser.add_argument("--workers", type=int, default=10)
+    args = parser.parse_args()
+
+    puuids = fixtures.player_puuids("lobby")
+
+    with MockRiotServer(latency=args.latency) as server:
+        api = MockValClient(server)
+        pvp = api.pvp
+
+        def serial():
+            for puuid in puuids:
+                pvp.get_player_mmr(puuid)
+                pvp.get_competitive_updates(puuid)
+
+        def batched():
+            pvp.get_many_mmr(puuids, max_workers=args.workers)
+            pvp.get_many_competitive_updates(puuids, max_workers=args.workers)
+
+        print(f"{args.iterations} lobbies of {len(puuids)} players, {args.latency * 1000:.1f} ms simulated latency")
+        for name, operation in (("serial MMR + history", serial), ("batched MMR + history", batched)):
+            samples = []
+            server.reset_counts()
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                operation()
+                samples.append(time.perf_counter() - start)
+            print(format_latency(name, samples, server.total_requests / args.iterations))
+
+
+if __name__ == "__main__":
+    main()
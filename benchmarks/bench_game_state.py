@@ -0,0 +1,98 @@
+"""
+Game-state detection benchmark: polling glz every tick vs the presence-driven GameStateTracker.
+
+Replays MENUS -> PREGAME -> INGAME -> MENUS sessions one poll ("tick") at a time
+against the local stand-in and counts the glz requests each approach makes. With
+--events, also measures how long a presence event takes to reach wait_for().
+
+Run from the repository root:
+
+    python -m benchmarks.bench_game_state --matches 5 --latency 0.005
+"""
+import argparse
+import threading
+import time
+
+from valapiclient.events import event_name
+from valapiclient.game_state import INGAME, MENUS, PREGAME
+
+from . import fixtures
+from .mock_server import PUUID, MockRiotServer, MockValClient, format_latency
+
+# (state, ticks) of one session; at one poll per second, a short match
+SESSION = ((MENUS, 30), (PREGAME, 15), (INGAME, 60), (MENUS, 15))
+PRESENCES_URI = "/chat/v4/presences"
+GLZ_ROUTES = ("pregame/v1/players/{puuid}", "core-game/v1/players/{puuid}")
+
+
+def replay(server, matches, tick):
+    samples = []
+    server.reset_counts()
+    for _ in range(matches):
+        for state, ticks in SESSION:
+            server.set_game_state(state)
+            for _ in range(ticks):
+                start = time.perf_counter()
+                tick()
+                samples.append(time.perf_counter() - start)
+    glz = sum(server.counts[route] for route in GLZ_ROUTES)
+    return samples, glz, server.total_requests
+
+
+def measure_events(server, iterations):
+    from .mock_websocket import MockEventServer
+
+    with MockEventServer() as events:
+        api = MockValClient(server, event_server=events)
+        api.warm_up()
+        server.set_game_state(MENUS)
+        tracker = api.game_state.follow_events()
+        events.wait_for_subscribers(event_name(PRESENCES_URI))
+
+        samples = []
+        states = (PREGAME, INGAME, MENUS)
+        for index in range(iterations):
+            state = states[index % len(states)]
+            server.set_game_state(state)
+            presence = fixtures.presences([PUUID], session_loop_state=state)
+            start = time.perf_counter()
+            threading.Thread(target=events.publish, args=(PRESENCES_URI, presence)).start()
+            tracker.wait_for(state, timeout=5)
+            samples.append(time.perf_counter() - start)
+        tracker.stop()
+        api.events.stop()
+        return samples, tracker.lookups / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=5, help="sessions to replay")
+    parser.add_argument("--iterations", type=int, default=60, help="event-driven transitions to time")
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated server latency in seconds")
+    parser.add_argument("--events", action="store_true", help="also time event-driven transitions")
+    args = parser.parse_args()
+
+    with MockRiotServer(latency=args.latency) as server:
+        api = MockValClient(server)
+        api.warm_up()
+
+        def blind_poll():
+            api.pregame.get_current_pregame_id()
+            api.coregame.get_current_match_id()
+
+        blind = replay(server, args.matches, blind_poll)
+        tracked = replay(server, args.matches, api.game_state.update)
+
+        ticks = len(blind[0])
+        print(f"{args.matches} sessions, {ticks} ticks, {args.latency * 1000:.1f} ms simulated latency")
+        for name, (samples, glz, total) in (("poll pregame + core-game", blind), ("GameStateTracker.update", tracked)):
+            print(format_latency(name, samples, total / ticks) + f"   glz requests {glz:>5}")
+        print(f"transitions seen by the tracker: {api.game_state.transitions}")
+
+        if args.events:
+            samples, lookups = measure_events(server, args.iterations)
+            print(format_latency("presence event -> wait_for", samples, lookups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+JSON decode micro-benchmark: `response.json()` vs `decode_response` per backend.
+
+Responses are built in memory from fixture payloads for each endpoint group, with
+no charset in the Content-Type (as the Riot hosts send them). `response.json()`
+guesses the encoding and decodes the body to text before parsing; `decode_response`
+hands the bytes straight to the selected backend.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_json --iterations 200
+"""
+import argparse
+import json
+import time
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from valapiclient import json_decoder
+
+from . import fixtures
+
+PAYLOADS = [
+    ("pvp: match details", lambda: fixtures.match_details(fixtures.stable_uuid("match", 0))),
+    ("pvp: content", fixtures.content),
+    ("pvp: leaderboard page", lambda: fixtures.leaderboard("season", 0, 1000)),
+    ("pvp: mmr", lambda: fixtures.mmr(fixtures.stable_uuid("player", 0))),
+    ("coregame: match", lambda: fixtures.coregame_match("match")),
+    ("coregame: loadouts", lambda: fixtures.coregame_loadouts("match")),
+    ("party: party", lambda: fixtures.party("party")),
+    ("store: storefront", lambda: fixtures.storefront("player")),
+    ("local: presences", lambda: fixtures.presences(fixtures.player_puuids("lobby", 50))),
+]
+
+
+def make_response(content):
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response._content = content
+    return response
+
+
+def measure(iterations, decode, content):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(make_response(content))
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    backends = [name for name in json_decoder.PREFERRED if name in json_decoder.BACKENDS]
+    print(f"{args.iterations} iterations, times in µs per response")
+    print(f"{'payload':<24} {'bytes':>8} {'.json()':>9}" + "".join(f" {name:>9}" for name in backends))
+    try:
+        for name, build in PAYLOADS:
+            content = json.dumps(build()).encode("utf-8")
+            row = [measure(args.iterations, Response.json, content)]
+            for backend in backends:
+                json_decoder.set_backend(backend)
+                row.append(measure(args.iterations, json_decoder.decode_response, content))
+            print(f"{name:<24} {len(content):>8}" + "".join(f" {seconds * 1e6:>9.1f}" for seconds in row))
+    finally:
+        json_decoder.set_backend()
+
+
+if __name__ == "__main__":
+    main()
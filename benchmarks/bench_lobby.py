@@ -0,0 +1,75 @@
+"""
+Lobby snapshot benchmark: sequential per-player lookups vs coregame/pregame.get_lobby_snapshot().
+
+The sequential baseline is what an overlay does without the snapshot: the match,
+then each player's name, MMR and account XP one after another, then the loadouts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_lobby --iterations 20 --latency 0.02
+"""
+import argparse
+import time
+
+from .mock_server import MockRiotServer, MockValClient, format_latency
+
+
+def measure(server, iterations, operation, before=None):
+    samples = []
+    server.reset_counts()
+    for _ in range(iterations):
+        if before:
+            before()
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return samples, server.total_requests / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    with MockRiotServer(latency=args.latency) as server:
+        server.set_game_state("INGAME")
+        api = MockValClient(server)
+        api.warm_up()
+        coregame, pvp = api.coregame, api.pvp
+
+        def sequential():
+            match_id = coregame.get_current_match_id()
+            match = coregame.get_current_match_info(match_id)
+            for player in match["Players"]:
+                pvp.get_player_name(player["Subject"])
+                pvp.get_player_mmr(player["Subject"])
+                pvp.get_account_xp(player["Subject"])
+            coregame.get_current_match_loadout(match_id)
+
+        snapshot = coregame.get_lobby_snapshot()
+        assert snapshot.ok and len(snapshot.players) == 10, snapshot.errors
+        api.connections.stats.reset()
+
+        rows = [
+            ("sequential core-game lookups", *measure(server, args.iterations, sequential)),
+            ("core-game snapshot, cold names",
+             *measure(server, args.iterations, coregame.get_lobby_snapshot, api.names.invalidate)),
+            ("core-game snapshot, cached names", *measure(server, args.iterations, coregame.get_lobby_snapshot)),
+        ]
+        server.set_game_state("PREGAME")
+        api.pregame.get_session(refresh=True)
+        rows.append(("pregame snapshot, cached names", *measure(server, args.iterations, api.pregame.get_lobby_snapshot)))
+
+        print(f"{args.iterations} iterations, {args.latency * 1000:.1f} ms simulated latency")
+        for name, samples, requests_per_op in rows:
+            print(format_latency(name, samples, requests_per_op))
+
+        total = api.connections.stats.snapshot()["total"]
+        print(f"connections: {total['created']} opened, {total['reused']} requests on kept-alive connections")
+        slowest = sorted(snapshot.timings.items(), key=lambda item: -item[1])[:3]
+        print("slowest calls in one snapshot: " + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in slowest))
+
+
+if __name__ == "__main__":
+    main()
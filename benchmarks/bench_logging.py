@@ -0,0 +1,100 @@
+"""
+Logging overhead micro-benchmark: the old per-request prints vs level-gated logging.
+
+Times the diagnostics Request.get_json and handle_pvp_request emit for one
+response, built in memory from fixture payloads: printing the URL, status and
+whole body (as get_json used to), and the logging calls that replaced it with
+the "valapiclient" loggers disabled, enabled with truncated bodies, and enabled
+with whole bodies. Output goes to os.devnull, so only formatting and the write
+call are measured.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_logging --iterations 2000
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from datetime import timedelta
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from valapiclient import instrumentation
+from valapiclient.instrumentation import body, log_request
+
+from . import fixtures
+
+URL = f"https://pd.eu.a.pvp.net/match-details/v1/matches/{fixtures.stable_uuid('match', 0)}"
+PAYLOADS = [
+    ("pvp: match details", lambda: fixtures.match_details(fixtures.stable_uuid("match", 0))),
+    ("pvp: mmr", lambda: fixtures.mmr(fixtures.stable_uuid("player", 0))),
+    ("store: storefront", lambda: fixtures.storefront("player")),
+]
+
+
+def make_response(content):
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response._content = content
+    response.elapsed = timedelta(milliseconds=12)
+    return response
+
+
+def printed(response, out):
+    print(f"Request URL: {URL}", file=out)
+    print(f"Response Status Code: {response.status_code}", file=out)
+    print(f"Response Content: {response.text}", file=out)
+
+
+def logged(response, out):
+    instrumentation.logger.debug("GET %s -> %s: %s", URL, response.status_code, body(response))
+    log_request("GET", URL, response)
+
+
+def measure(iterations, emit, content, out):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        emit(make_response(content), out)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    root = logging.getLogger("valapiclient")
+    with open(os.devnull, "w") as out:
+        handler = logging.StreamHandler(out)
+        root.addHandler(handler)
+        root.propagate = False
+        modes = [
+            ("print", printed, None, None),
+            ("logging off", logged, logging.WARNING, 500),
+            ("DEBUG, 500 bytes", logged, logging.DEBUG, 500),
+            ("DEBUG, whole body", logged, logging.DEBUG, None),
+        ]
+        print(f"{args.iterations} iterations, times in µs per response")
+        print(f"{'payload':<22} {'bytes':>8}" + "".join(f" {name:>18}" for name, *_ in modes))
+        try:
+            for name, build in PAYLOADS:
+                content = json.dumps(build()).encode("utf-8")
+                row = []
+                for _, emit, level, limit in modes:
+                    root.setLevel(level or logging.WARNING)
+                    instrumentation.set_body_limit(limit)
+                    row.append(measure(args.iterations, emit, content, out))
+                print(f"{name:<22} {len(content):>8}" + "".join(f" {seconds * 1e6:>18.1f}" for seconds in row))
+        finally:
+            root.removeHandler(handler)
+            root.propagate = True
+            root.setLevel(logging.NOTSET)
+            instrumentation.set_body_limit(500)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Metrics overhead benchmark: the cost of RequestMetrics on every request.
+
+First times RequestMetrics.record() alone, on URLs of the MMR, account-XP and
+match-details endpoints for a pool of players and matches, from one thread and
+from several. Then sends the same MMR lookups through handle_pvp_request against
+the stand-in with metrics on and off (`metrics=False`) and compares p50/p99.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_metrics --iterations 2000
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from requests.models import Response
+
+from valapiclient.metrics import RequestMetrics
+
+from . import fixtures
+from .mock_server import MockRiotServer, MockValClient, format_latency
+
+PD = "https://pd.eu.a.pvp.net"
+
+
+def make_urls(players):
+    urls = []
+    for index, puuid in enumerate(fixtures.player_puuids("metrics", players)):
+        urls.append(f"{PD}/mmr/v1/players/{puuid}")
+        urls.append(f"{PD}/account-xp/v1/players/{puuid}")
+        urls.append(f"{PD}/match-details/v1/matches/{fixtures.stable_uuid('match', index)}")
+    return urls
+
+
+def make_response(status):
+    response = Response()
+    response.status_code = status
+    response._content = b'{"Subject": "x"}' * 50
+    response.elapsed = timedelta(milliseconds=20)
+    return response
+
+
+def time_record(metrics, urls, iterations):
+    responses = [make_response(200), make_response(200), make_response(404)]
+    start = time.perf_counter()
+    for index in range(iterations):
+        metrics.record("GET", urls[index % len(urls)], responses[index % 3], 0.02 + (index % 7) * 0.01)
+    return (time.perf_counter() - start) / iterations
+
+
+def measure_requests(server, iterations, metrics):
+    api = MockValClient(server, metrics=metrics)
+    api.warm_up()
+    puuids = fixtures.player_puuids("metrics", 50)
+    samples = []
+    for index in range(iterations):
+        start = time.perf_counter()
+        api.handle_pvp_request(f"mmr/v1/players/{puuids[index % len(puuids)]}", prefix=server.url)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=1000, help="distinct players in the recorded URLs")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    urls = make_urls(args.players)
+    metrics = RequestMetrics()
+    time_record(metrics, urls, len(urls))  # fill the endpoint template cache
+    single = time_record(metrics, urls, args.iterations * 10)
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        start = time.perf_counter()
+        for future in [executor.submit(time_record, metrics, urls, args.iterations) for _ in range(args.threads)]:
+            future.result()
+        threaded = (time.perf_counter() - start) / (args.iterations * args.threads)
+    print(f"RequestMetrics.record: {single * 1e6:.2f} µs per call, "
+          f"{threaded * 1e6:.2f} µs per call with {args.threads} threads ({len(metrics.snapshot())} series)")
+    exposition = RequestMetrics()
+    for url in urls:
+        exposition.record("GET", url, make_response(200), 0.02)
+    start = time.perf_counter()
+    text = exposition.to_prometheus()
+    print(f"to_prometheus: {(time.perf_counter() - start) * 1000:.2f} ms for {len(text)} bytes")
+
+    with MockRiotServer(latency=args.latency) as server:
+        print(f"{args.iterations} MMR requests, {args.latency * 1000:.1f} ms simulated latency")
+        for name, setting in (("metrics off", False), ("metrics on", True)):
+            samples = measure_requests(server, args.iterations, setting)
+            print(format_latency(f"handle_pvp_request, {name}", samples, 1.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Typed models vs raw dicts: decode time and retained memory.
+
+Each payload is decoded from JSON bytes, one commonly used field is read, and
+the result is kept; retained memory is measured with tracemalloc once the
+decoded dicts the models were built from have been released.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_models --count 500
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from valapiclient.models import SKIN_SOCKET, Loadout, Match, Party, Presence, Storefront, decode_private
+
+from . import fixtures
+
+WEAPON_ID = fixtures.stable_uuid("weapon", 0)
+
+PAYLOADS = [
+    # name, payload, dict access, model constructor, model access
+    ("core-game match", fixtures.coregame_match("match"),
+     lambda data: data["Players"][3]["PlayerIdentity"]["AccountLevel"],
+     Match, lambda match: match.players[3].identity.account_level),
+    ("core-game loadouts", fixtures.coregame_loadouts("match"),
+     lambda data: data["Loadouts"][0]["Loadout"]["Items"][WEAPON_ID]["Sockets"][SKIN_SOCKET]["Item"]["ID"],
+     Loadout.list_from_dict, lambda loadouts: loadouts[0].weapons[WEAPON_ID].skin_id),
+    ("party", fixtures.party("party"),
+     lambda data: data["MatchmakingData"]["QueueID"],
+     Party, lambda party: party.queue_id),
+    ("storefront", fixtures.storefront("player"),
+     lambda data: data["SkinsPanelLayout"]["SingleItemOffers"],
+     Storefront, lambda storefront: storefront.skins_panel["SingleItemOffers"]),
+    ("presences (50 players)", fixtures.presences(fixtures.player_puuids("lobby", 50)),
+     lambda data: [decode_private(entry["private"])["matchPresenceData"]["sessionLoopState"]
+                   for entry in data["presences"]],
+     lambda data: Presence.list_from_dict(data["presences"]),
+     lambda presences: [presence.details.session_loop_state for presence in presences]),
+]
+
+
+def measure(content, count, build, access):
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    start = time.perf_counter()
+    for _ in range(count):
+        value = build(json.loads(content))
+        access(value)
+        kept.append(value)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / count, retained / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500, help="responses decoded and kept per payload")
+    args = parser.parse_args()
+
+    print(f"{args.count} responses per payload")
+    print(f"{'payload':<26} {'bytes':>8} {'dict µs':>9} {'model µs':>9} {'dict KB':>9} {'model KB':>9}")
+    for name, payload, dict_access, model, model_access in PAYLOADS:
+        content = json.dumps(payload).encode("utf-8")
+        dict_time, dict_memory = measure(content, args.count, lambda data: data, dict_access)
+        model_time, model_memory = measure(content, args.count, model, model_access)
+        print(f"{name:<26} {len(content):>8} {dict_time * 1e6:>9.1f} {model_time * 1e6:>9.1f} "
+              f"{dict_memory / 1024:>9.1f} {model_memory / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Presence diffing benchmark: decoding every blob on every poll vs PresenceTracker.
+
+Replays polls of a friend list in which a few friends change per poll and
+measures the CPU time to turn each poll into the list of changed friends.
+No server is involved; the polls are pre-built presence lists.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_presence --friends 500 --polls 200 --changes 5
+"""
+import argparse
+import json
+import random
+import time
+
+from valapiclient.models import PresenceDetails, decode_private
+from valapiclient.presence import PresenceTracker, _changes
+
+from . import fixtures
+from .mock_server import format_latency
+
+STATES = ("MENUS", "PREGAME", "INGAME")
+
+
+def build_polls(friends, polls, changes_per_poll):
+    """Presence lists for each poll; every poll is a fresh JSON decode, like a real response."""
+    rng = random.Random(1)
+    puuids = fixtures.player_puuids("friends", friends)
+    states = {puuid: "MENUS" for puuid in puuids}
+    payloads = []
+    for _ in range(polls):
+        for puuid in rng.sample(puuids, changes_per_poll):
+            states[puuid] = rng.choice([state for state in STATES if state != states[puuid]])
+        entries = [fixtures.presences([puuid], session_loop_state=states[puuid])["presences"][0] for puuid in puuids]
+        payloads.append(json.dumps(entries))
+    return [json.loads(payload) for payload in payloads]
+
+
+def decode_everything(polls):
+    """What a consumer without the tracker does: decode every blob, then compare."""
+    previous = {}
+    samples, reported = [], 0
+    for presences in polls:
+        start = time.perf_counter()
+        current = {entry["puuid"]: PresenceDetails(decode_private(entry["private"])) for entry in presences}
+        changed = [puuid for puuid, details in current.items()
+                   if puuid not in previous or _changes(previous[puuid], details)]
+        previous = current
+        samples.append(time.perf_counter() - start)
+        reported += len(changed)
+    return samples, reported
+
+
+def tracked(polls):
+    tracker = PresenceTracker(api=None)
+    samples, reported = [], 0
+    for presences in polls:
+        start = time.perf_counter()
+        changes = tracker.update(presences)
+        samples.append(time.perf_counter() - start)
+        reported += len(changes)
+    return samples, reported, tracker.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--friends", type=int, default=500)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--changes", type=int, default=5, help="friends whose state changes per poll")
+    args = parser.parse_args()
+
+    polls = build_polls(args.friends, args.polls, args.changes)
+    naive_samples, naive_reported = decode_everything(polls)
+    tracker_samples, tracker_reported, stats = tracked(polls)
+
+    print(f"{args.friends} friends, {args.polls} polls, {args.changes} changes per poll")
+    print(format_latency("decode every blob + compare", naive_samples, 0) + f"   changes {naive_reported}")
+    print(format_latency("PresenceTracker.update", tracker_samples, 0) + f"   changes {tracker_reported}")
+    print(f"tracker: {stats['decodes']} decodes, {stats['cache_hits']} cache hits, {stats['unchanged']} unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+ValClient startup benchmark against local mock servers.
+
+Compares the time until a client is usable for a local-only call
+(`local.get_friends()`) and for a first PvP call (`pvp.get_player_mmr`), with
+lazy startup (the default) and with `eager=True`, which resolves the client
+version, tokens and region concurrently. "sequential" resolves the same three
+one after another, as the constructor used to.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --iterations 50 --latency 0.1
+"""
+import argparse
+import time
+
+from .mock_server import PUUID, MockRiotServer, MockValClient, format_latency
+
+
+def sequential_startup(server):
+    api = MockValClient(server)
+    api.client_version
+    api.auth_headers
+    api.region
+    return api
+
+
+def measure(server, iterations, operation):
+    samples = []
+    server.reset_counts()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return samples, server.total_requests / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    with MockRiotServer(latency=args.latency) as server:
+        rows = [
+            ("lazy: construct", *measure(server, args.iterations, lambda: MockValClient(server))),
+            ("lazy: construct + get_friends",
+             *measure(server, args.iterations, lambda: MockValClient(server).local.get_friends())),
+            ("lazy: construct + first PvP call",
+             *measure(server, args.iterations, lambda: MockValClient(server).pvp.get_player_mmr(PUUID))),
+            ("sequential: resolve all", *measure(server, args.iterations, lambda: sequential_startup(server))),
+            ("eager: resolve all", *measure(server, args.iterations, lambda: MockValClient(server, eager=True))),
+            ("eager: construct + first PvP call",
+             *measure(server, args.iterations, lambda: MockValClient(server, eager=True).pvp.get_player_mmr(PUUID))),
+        ]
+
+        print(f"{args.iterations} iterations, {args.latency * 1000:.1f} ms simulated latency")
+        for name, samples, requests_per_op in rows:
+            print(format_latency(name, samples, requests_per_op))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Check flatten_matches and player_summary on deathmatch-shaped match details (no server).
+
+In deathmatch every player is a team of one whose teamId is their PUUID, so
+team IDs are as long as PUUIDs. Flattens a mix of deathmatch and standard
+matches from benchmarks/fixtures.py and checks that:
+
+- players.team_id and rounds.winning_team keep the whole team ID
+- players.won is True for each deathmatch's winner only, and for the winning side of a standard match
+- player_summary counts one win per deathmatch winner
+
+Exits 1 if anything differs. Needs numpy.
+
+Run from the repository root:
+
+    python -m benchmarks.check_analytics
+"""
+import argparse
+
+import numpy as np
+
+from valapiclient.analytics import flatten_matches, player_summary
+
+from . import fixtures
+
+
+def check(matches, failures):
+    tables = flatten_matches(matches)
+    players, rounds = tables.players, tables.rounds
+
+    for match in matches:
+        match_id = match["matchInfo"]["matchId"]
+        rows = players["match_id"] == match_id
+        expected_teams = [player["teamId"] for player in match["players"]]
+        if list(players["team_id"][rows]) != expected_teams:
+            failures.append(f"{match_id}: team_id {list(players['team_id'][rows])[:2]}, expected {expected_teams[:2]}")
+
+        won = {team["teamId"]: team["won"] for team in match["teams"]}
+        expected_won = [won[player["teamId"]] for player in match["players"]]
+        if list(players["won"][rows]) != expected_won:
+            failures.append(f"{match_id}: won {list(players['won'][rows])}, expected {expected_won}")
+
+        expected_winners = [round_result["winningTeam"] for round_result in match["roundResults"]]
+        winners = list(rounds["winning_team"][rounds["match_id"] == match_id])
+        if winners != expected_winners:
+            failures.append(f"{match_id}: winning_team {winners[:2]}, expected {expected_winners[:2]}")
+
+    summary = player_summary(tables)
+    wins = dict(zip(summary["puuid"], summary["wins"]))
+    for match in matches:
+        if match["matchInfo"]["queueID"] != "deathmatch":
+            continue
+        winner = next(team["teamId"] for team in match["teams"] if team["won"])
+        if wins.get(winner) != 1:
+            failures.append(f"player_summary: {wins.get(winner)} wins for deathmatch winner {winner}")
+    expected_total = sum(sum(player["teamId"] == winner for player in match["players"])
+                         for match in matches for winner in (t["teamId"] for t in match["teams"] if t["won"]))
+    if int(np.sum(summary["wins"])) != expected_total:
+        failures.append(f"player_summary: {int(np.sum(summary['wins']))} wins in total, expected {expected_total}")
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=4, help="deathmatches to flatten, plus one standard match")
+    args = parser.parse_args()
+
+    matches = [fixtures.deathmatch_details(fixtures.stable_uuid("deathmatch", index)) for index in range(args.matches)]
+    matches.append(fixtures.match_details(fixtures.stable_uuid("match", "standard"), rounds=4))
+
+    failures = []
+    tables = check(matches, failures)
+    if failures:
+        print(f"FAILED: {len(failures)} problems")
+        for failure in failures:
+            print(f"  {failure}")
+        raise SystemExit(1)
+    print(f"OK: {len(tables.players)} player rows and {len(tables.rounds)} round rows kept their team IDs")
+
+
+if __name__ == "__main__":
+    main()
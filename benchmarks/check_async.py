@@ -0,0 +1,130 @@
+"""
+Check AsyncValClient against the stand-in: every async endpoint must return what its sync twin returns.
+
+Runs the PvP, core-game, pregame and local lookups through a MockValClient and
+through an AsyncValClient wrapping it and compares the results, then checks the
+behaviour both clients share beyond the payload:
+
+- match history filtered by `queue`
+- player names split into name-service requests of NAME_SERVICE_BATCH_SIZE
+- content served from the content cache on the second call
+- completed match details served from the match store on the second call
+
+Exits 1 if anything differs. Needs aiohttp.
+
+Run from the repository root:
+
+    python -m benchmarks.check_async
+"""
+import argparse
+import asyncio
+import math
+import tempfile
+
+from valapiclient.async_client import AsyncValClient
+from valapiclient.content_cache import ContentCache
+from valapiclient.endpoints.pvp import NAME_SERVICE_BATCH_SIZE
+from valapiclient.game_state import INGAME, PREGAME
+from valapiclient.match_store import SQLiteMatchStore
+
+from . import fixtures
+from .mock_server import PUUID, MockRiotServer, MockValClient
+
+MATCH_ID = fixtures.stable_uuid("match", PUUID, 0)
+
+
+def twin_calls(api, async_api):
+    """(name, sync call, async call) of lookups whose results must match."""
+    return [
+        ("pvp.get_player_mmr", lambda: api.pvp.get_player_mmr(PUUID), lambda: async_api.pvp.get_player_mmr(PUUID)),
+        ("pvp.get_account_xp", lambda: api.pvp.get_account_xp(PUUID), lambda: async_api.pvp.get_account_xp(PUUID)),
+        ("pvp.get_competitive_updates", lambda: api.pvp.get_competitive_updates(PUUID, 0, 15, queue="competitive"),
+         lambda: async_api.pvp.get_competitive_updates(PUUID, 0, 15, queue="competitive")),
+        ("pvp.get_match_history", lambda: api.pvp.get_match_history(PUUID, 5, 15, queue="unrated"),
+         lambda: async_api.pvp.get_match_history(PUUID, 5, 15, queue="unrated")),
+        ("pvp.get_leaderboard", lambda: api.pvp.get_leaderboard(fixtures.SEASON_ID, 0, 50),
+         lambda: async_api.pvp.get_leaderboard(fixtures.SEASON_ID, 0, 50)),
+        ("local.get_region", api.local.get_region, async_api.local.get_region),
+        ("local.get_friends", api.local.get_friends, async_api.local.get_friends),
+        ("local.get_presence", api.local.get_presence, async_api.local.get_presence),
+    ]
+
+
+def game_calls(api, async_api):
+    """(game state, name, sync call, async call) of glz lookups that need the player in a match."""
+    return [
+        (INGAME, "coregame.get_current_match_id", api.coregame.get_current_match_id,
+         async_api.coregame.get_current_match_id),
+        (INGAME, "coregame.get_current_match_loadout", lambda: api.coregame.get_current_match_loadout(MATCH_ID),
+         lambda: async_api.coregame.get_current_match_loadout(MATCH_ID)),
+        (PREGAME, "pregame.get_current_pregame", lambda: api.pregame.get_current_pregame(PUUID),
+         lambda: async_api.pregame.get_current_pregame(PUUID)),
+        (PREGAME, "pregame.lock_pregame_agent", lambda: api.pregame.lock_pregame_agent(fixtures.AGENT_IDS[0]),
+         lambda: async_api.pregame.lock_pregame_agent(fixtures.AGENT_IDS[0])),
+    ]
+
+
+async def run_checks(server, api, failures):
+    async with AsyncValClient(api) as async_api:
+        for name, sync_call, async_call in twin_calls(api, async_api):
+            expected, result = sync_call(), await async_call()
+            if expected is None or result != expected:
+                failures.append(f"{name}: async returned {str(result)[:80]}, sync {str(expected)[:80]}")
+
+        for state, name, sync_call, async_call in game_calls(api, async_api):
+            server.set_game_state(state)
+            expected, result = sync_call(), await async_call()
+            if expected is None or result != expected:
+                failures.append(f"{name}: async returned {str(result)[:80]}, sync {str(expected)[:80]}")
+
+        # Every token lookup issues new tokens, so only the shape can match
+        tokens = await async_api.local.get_auth_info()
+        if not tokens or len(tokens) != 2:
+            failures.append(f"local.get_auth_info: returned {tokens!r}")
+
+        history = await async_api.pvp.get_match_history(PUUID, queue="unrated")
+        queues = {entry["QueueID"] for entry in (history or {}).get("History", ())}
+        if queues != {"unrated"}:
+            failures.append(f"pvp.get_match_history(queue='unrated'): entries of queues {sorted(queues)}")
+
+        puuids = fixtures.player_puuids("check-async", NAME_SERVICE_BATCH_SIZE * 2 + 17)
+        server.reset_counts()
+        names = await async_api.pvp.get_player_name(puuids)
+        requests_sent = server.counts["name-service/v2/players"]
+        if [entry["Subject"] for entry in names or ()] != puuids:
+            failures.append(f"pvp.get_player_name: {len(names or ())} names for {len(puuids)} players")
+        if requests_sent != math.ceil(len(puuids) / NAME_SERVICE_BATCH_SIZE):
+            failures.append(f"pvp.get_player_name: {requests_sent} name-service requests for {len(puuids)} players")
+
+        for name, call, route in (("pvp.get_content", async_api.pvp.get_content, "content-service/v3/content"),
+                                  ("pvp.get_match_details", lambda: async_api.pvp.get_match_details(MATCH_ID),
+                                   "match-details/v1/matches/{match_id}")):
+            server.reset_counts()
+            first, second = await call(), await call()
+            if not first or second != first:
+                failures.append(f"{name}: second call returned {str(second)[:80]}")
+            if server.counts[route] != 1:
+                failures.append(f"{name}: {server.counts[route]} requests for two calls, expected 1 (cached)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    failures = []
+    with MockRiotServer(latency=args.latency) as server, tempfile.TemporaryDirectory() as workdir:
+        api = MockValClient(server, content_cache=ContentCache(f"{workdir}/content"),
+                            match_store=SQLiteMatchStore(f"{workdir}/matches"))
+        asyncio.run(run_checks(server, api, failures))
+
+    if failures:
+        print(f"FAILED: {len(failures)} problems")
+        for failure in failures:
+            print(f"  {failure}")
+        raise SystemExit(1)
+    print("OK: every async endpoint matched its sync twin")
+
+
+if __name__ == "__main__":
+    main()
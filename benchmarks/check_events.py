@@ -0,0 +1,145 @@
+"""
+Check EventStream against the stand-in event socket (`benchmarks/mock_websocket.py`).
+
+Subscribes to presences and friends and checks that:
+
+- the socket receives both subscriptions, and an unsubscribe removes one
+- each event reaches the callbacks of its kind and '*' callbacks, and no others
+- a callback that raises doesn't keep the event from the other callbacks
+- an `async for` consumer receives the events too
+- after the socket drops, the stream reconnects, resubscribes and delivers events again
+
+Exits 1 if anything differs.
+
+Run from the repository root:
+
+    python -m benchmarks.check_events
+"""
+import argparse
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+
+from valapiclient.events import event_name
+
+from .mock_server import MockRiotServer, MockValClient
+from .mock_websocket import MockEventServer
+
+PRESENCES_URI = "/chat/v4/presences"
+FRIENDS_URI = "/chat/v4/friends"
+MESSAGES_URI = "/chat/v6/messages"
+
+
+class Recorder:
+    """Callbacks that record the events they receive, per registered kind."""
+
+    def __init__(self):
+        self.events = defaultdict(list)
+        self.received = threading.Condition()
+
+    def callback(self, kind):
+        def record(event):
+            with self.received:
+                self.events[kind].append(event)
+                self.received.notify_all()
+        return record
+
+    def wait_for(self, kind, count, timeout):
+        with self.received:
+            return self.received.wait_for(lambda: len(self.events[kind]) >= count, timeout)
+
+
+def check(api, events, timeout, failures):
+    stream = api.events
+    recorder = Recorder()
+    for kind in ("presences", "friends", "*"):
+        stream.on(kind, recorder.callback(kind))
+
+    def broken(event):
+        raise RuntimeError("callback failure")
+    stream.on("presences", broken)
+
+    stream.subscribe("presences", "friends").start()
+    for uri in (PRESENCES_URI, FRIENDS_URI):
+        if not events.wait_for_subscribers(event_name(uri), timeout=timeout):
+            failures.append(f"subscribe: the socket never saw a subscription to {event_name(uri)}")
+
+    if events.publish(MESSAGES_URI, {"messages": []}):
+        failures.append("subscribe: an event nobody subscribed to was sent")
+
+    # Dispatch: each event reaches its own kind's callbacks and '*', even past a failing callback
+    logging.getLogger("valapiclient.events").disabled = True
+    events.publish(PRESENCES_URI, {"presences": [{"puuid": "a"}]})
+    events.publish(FRIENDS_URI, {"friends": []})
+    recorder.wait_for("*", 2, timeout)
+    logging.getLogger("valapiclient.events").disabled = False
+    kinds = {kind: [event.uri for event in received] for kind, received in recorder.events.items()}
+    expected = {"presences": [PRESENCES_URI], "friends": [FRIENDS_URI], "*": [PRESENCES_URI, FRIENDS_URI]}
+    if kinds != expected:
+        failures.append(f"dispatch: callbacks received {kinds}, expected {expected}")
+    presences = recorder.events["presences"]
+    if presences and presences[0].data != {"presences": [{"puuid": "a"}]}:
+        failures.append(f"dispatch: presences callback got data {presences[0].data!r}")
+    stream.off("presences", broken)
+
+    stream.unsubscribe("friends")
+    if not events.wait_for_unsubscribed(event_name(FRIENDS_URI), timeout=timeout) \
+            or events.publish(FRIENDS_URI, {"friends": []}):
+        failures.append("unsubscribe: friends events are still sent")
+
+    # async for
+    async def consume():
+        async def publish_when_ready():
+            await asyncio.sleep(0.1)
+            events.publish(PRESENCES_URI, {"presences": [{"puuid": "async"}]})
+        publisher = asyncio.create_task(publish_when_ready())
+        async for event in stream:
+            if event.kind == "presences":
+                await publisher
+                return event
+    try:
+        event = asyncio.run(asyncio.wait_for(consume(), timeout))
+        if event.data != {"presences": [{"puuid": "async"}]}:
+            failures.append(f"async for: received {event.data!r}")
+    except asyncio.TimeoutError:
+        failures.append("async for: no event received")
+
+    # Reconnect: the server drops the socket, the stream must come back subscribed
+    connections = stream.connections
+    delivered = len(recorder.events["presences"])
+    events.drop_connections()
+    if not events.wait_for_subscribers(event_name(PRESENCES_URI), timeout=timeout):
+        failures.append("reconnect: not resubscribed to presences after the socket dropped")
+    elif stream.connections != connections + 1:
+        failures.append(f"reconnect: {stream.connections - connections} new connections, expected 1")
+    events.publish(PRESENCES_URI, {"presences": [{"puuid": "b"}]})
+    if not recorder.wait_for("presences", delivered + 1, timeout):
+        failures.append("reconnect: no presences event delivered after reconnecting")
+    if events.publish(FRIENDS_URI, {"friends": []}):
+        failures.append("reconnect: resubscribed to friends after unsubscribing")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--timeout", type=float, default=10, help="seconds to wait for each delivery")
+    args = parser.parse_args()
+
+    failures = []
+    with MockRiotServer() as server, MockEventServer() as events:
+        api = MockValClient(server, event_server=events)
+        try:
+            check(api, events, args.timeout, failures)
+        finally:
+            api.events.stop()
+
+    if failures:
+        print(f"FAILED: {len(failures)} problems")
+        for failure in failures:
+            print(f"  {failure}")
+        raise SystemExit(1)
+    print("OK: subscriptions, dispatch, async iteration and reconnect behaved as expected")
+
+
+if __name__ == "__main__":
+    main()
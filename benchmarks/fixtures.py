@@ -0,0 +1,513 @@
+"""
+Deterministic payloads shaped like the Riot PvP responses, for the mock server.
+
+Payloads are generated from a seed instead of being checked in, so large
+responses (match details are several hundred KB) don't bloat the repository.
+"""
+import base64
+import json
+import random
+import uuid
+
+AGENT_IDS = [
+    "e370fa57-4757-3604-3648-499e1f642d3f", "5f8d3a7f-467b-97f3-062c-13acf203c006",
+    "f94c3b30-42be-e959-889c-5aa313dba261", "6f2a04ca-43e0-be17-7f36-b3908627744d",
+    "117ed9e3-49f3-6512-3ccf-0cada7e3823b", "320b2a48-4d9b-a075-30f1-1f93a9b638fa",
+]
+MAP_IDS = ["/Game/Maps/Ascent/Ascent", "/Game/Maps/Bonsai/Bonsai", "/Game/Maps/Triad/Triad"]
+SEASON_ID = "52e9749a-429b-7060-99fe-4595426a0cf7"
+
+
+def stable_uuid(*parts):
+    """A UUID derived from `parts`, so the same inputs always give the same ID."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "/".join(str(part) for part in parts)))
+
+
+def player_puuids(match_id, count=10):
+    return [stable_uuid("player", match_id, index) for index in range(count)]
+
+
+def mmr(puuid):
+    rng = random.Random(puuid)
+    tier = rng.randint(3, 27)
+    return {
+        "Version": 1,
+        "Subject": puuid,
+        "NewPlayerExperienceFinished": True,
+        "QueueSkills": {
+            "competitive": {
+                "TotalGamesNeededForRating": 0,
+                "TotalGamesNeededForLeaderboard": 0,
+                "CurrentSeasonGamesNeededForRating": 0,
+                "SeasonalInfoBySeasonID": {
+                    SEASON_ID: {
+                        "SeasonID": SEASON_ID,
+                        "NumberOfWins": rng.randint(0, 200),
+                        "NumberOfGames": rng.randint(200, 400),
+                        "Rank": tier,
+                        "CompetitiveTier": tier,
+                        "RankedRating": rng.randint(0, 99),
+                        "WinsByTier": {str(t): rng.randint(0, 20) for t in range(3, tier + 1)},
+                    }
+                },
+            }
+        },
+        "LatestCompetitiveUpdate": {
+            "MatchID": stable_uuid("match", puuid, 0),
+            "MapID": rng.choice(MAP_IDS),
+            "SeasonID": SEASON_ID,
+            "TierAfterUpdate": tier,
+            "TierBeforeUpdate": tier,
+            "RankedRatingAfterUpdate": 50,
+            "RankedRatingBeforeUpdate": 33,
+            "RankedRatingEarned": 17,
+        },
+        "IsLeaderboardAnonymized": False,
+        "IsActRankBadgeHidden": False,
+    }
+
+
+def account_xp(puuid):
+    rng = random.Random(f"xp/{puuid}")
+    return {
+        "Version": 1,
+        "Subject": puuid,
+        "Progress": {"Level": rng.randint(1, 500), "XP": rng.randint(0, 5000)},
+        "History": [],
+        "LastTimeGrantedFirstWin": "2026-10-01T12:00:00Z",
+    }
+
+
+def competitive_updates(puuid, start_index, end_index, total=60):
+    matches = [
+        {
+            "MatchID": stable_uuid("match", puuid, index),
+            "MapID": MAP_IDS[index % len(MAP_IDS)],
+            "SeasonID": SEASON_ID,
+            "MatchStartTime": 1790000000000 - index * 3600000,
+            "TierAfterUpdate": 20,
+            "TierBeforeUpdate": 20,
+            "RankedRatingAfterUpdate": 40,
+            "RankedRatingBeforeUpdate": 25,
+            "RankedRatingEarned": 15,
+            "CompetitiveMovement": "MOVEMENT_UNKNOWN",
+        }
+        for index in range(start_index, min(end_index, total))
+    ]
+    return {"Version": 1, "Subject": puuid, "Matches": matches}
+
+
+def match_history(puuid, start_index, end_index, total=60, queue_id="competitive"):
+    history = [
+        {
+            "MatchID": stable_uuid("match", puuid, index),
+            "GameStartTime": 1790000000000 - index * 3600000,
+            "QueueID": queue_id,
+        }
+        for index in range(start_index, min(end_index, total))
+    ]
+    return {"Subject": puuid, "BeginIndex": start_index, "EndIndex": start_index + len(history),
+            "Total": total, "History": history}
+
+
+def match_details(match_id, rounds=24):
+    rng = random.Random(match_id)
+    puuids = player_puuids(match_id)
+    teams = {puuid: ("Red" if index < 5 else "Blue") for index, puuid in enumerate(puuids)}
+    round_results = []
+    for round_num in range(rounds):
+        player_stats = []
+        for puuid in puuids:
+            kills = []
+            for _ in range(rng.randint(0, 2)):
+                victim = rng.choice([p for p in puuids if teams[p] != teams[puuid]])
+                kills.append({
+                    "gameTime": rng.randint(0, 3000000),
+                    "roundTime": rng.randint(0, 100000),
+                    "killer": puuid,
+                    "victim": victim,
+                    "victimLocation": {"x": rng.randint(-9000, 9000), "y": rng.randint(-9000, 9000)},
+                    "assistants": [],
+                    "playerLocations": [
+                        {"subject": p, "viewRadians": rng.random() * 6.28,
+                         "location": {"x": rng.randint(-9000, 9000), "y": rng.randint(-9000, 9000)}}
+                        for p in puuids
+                    ],
+                    "finishingDamage": {"damageType": "Weapon", "damageItem": stable_uuid("weapon", rng.randint(0, 17)),
+                                        "isSecondaryFireMode": False},
+                })
+            damage = [
+                {"receiver": victim["victim"], "damage": rng.randint(20, 150),
+                 "legshots": rng.randint(0, 1), "bodyshots": rng.randint(0, 3), "headshots": rng.randint(0, 2)}
+                for victim in kills
+            ]
+            player_stats.append({
+                "subject": puuid,
+                "kills": kills,
+                "damage": damage,
+                "score": sum(150 + d["damage"] for d in damage),
+                "economy": {"loadoutValue": rng.randint(800, 5000), "weapon": stable_uuid("weapon", 1),
+                            "armor": stable_uuid("armor", 1), "remaining": rng.randint(0, 9000),
+                            "spent": rng.randint(0, 5000)},
+                "ability": {},
+                "wasAfk": False,
+                "wasPenalized": False,
+                "stayedInSpawn": False,
+            })
+        round_results.append({
+            "roundNum": round_num,
+            "roundResult": "Eliminated",
+            "roundCeremony": "CeremonyDefault",
+            "winningTeam": rng.choice(["Red", "Blue"]),
+            "bombPlanter": None,
+            "plantRoundTime": 0,
+            "defuseRoundTime": 0,
+            "playerStats": player_stats,
+            "roundResultCode": "Elimination",
+        })
+
+    players = []
+    for puuid in puuids:
+        stats = [ps for rr in round_results for ps in rr["playerStats"] if ps["subject"] == puuid]
+        players.append({
+            "subject": puuid,
+            "gameName": f"Player{puuid[:6]}",
+            "tagLine": "EUW",
+            "teamId": teams[puuid],
+            "partyId": stable_uuid("party", puuid),
+            "characterId": rng.choice(AGENT_IDS),
+            "competitiveTier": rng.randint(3, 27),
+            "accountLevel": rng.randint(1, 500),
+            "stats": {
+                "score": sum(ps["score"] for ps in stats),
+                "roundsPlayed": rounds,
+                "kills": sum(len(ps["kills"]) for ps in stats),
+                "deaths": rng.randint(5, 25),
+                "assists": rng.randint(0, 15),
+                "playtimeMillis": 2400000,
+            },
+        })
+
+    return {
+        "matchInfo": {
+            "matchId": match_id,
+            "mapId": rng.choice(MAP_IDS),
+            "gameLengthMillis": 2400000,
+            "gameStartMillis": 1790000000000,
+            "isCompleted": True,
+            "queueID": "competitive",
+            "isRanked": True,
+            "seasonId": SEASON_ID,
+        },
+        "players": players,
+        "teams": [
+            {"teamId": "Red", "won": True, "roundsPlayed": rounds, "roundsWon": 13, "numPoints": 13},
+            {"teamId": "Blue", "won": False, "roundsPlayed": rounds, "roundsWon": rounds - 13, "numPoints": 11},
+        ],
+        "roundResults": round_results,
+        "kills": [kill for rr in round_results for ps in rr["playerStats"] for kill in ps["kills"]],
+    }
+
+
+def deathmatch_details(match_id, rounds=1):
+    """Match details shaped like a deathmatch: every player is a team of one, whose teamId is their PUUID."""
+    details = match_details(match_id, rounds)
+    winner = details["players"][0]["subject"]
+    for player in details["players"]:
+        player["teamId"] = player["subject"]
+    details["teams"] = [
+        {"teamId": player["subject"], "won": player["subject"] == winner, "roundsPlayed": rounds, "roundsWon": 0,
+         "numPoints": player["stats"]["kills"]}
+        for player in details["players"]
+    ]
+    for round_result in details["roundResults"]:
+        round_result["winningTeam"] = winner
+    details["matchInfo"].update(queueID="deathmatch", isRanked=False)
+    return details
+
+def content(seasons=40, characters=25, maps=15, skins=800):
+    """A content-service/v3/content payload; the real one lists every season, agent, map and cosmetic."""
+    def items(kind, count):
+        return [{"Name": f"{kind}{index}", "ID": stable_uuid(kind, index), "AssetName": f"{kind}_{index}_PrimaryAsset",
+                 "IsEnabled": True} for index in range(count)]
+
+    return {
+        "DisabledIDs": [],
+        "Seasons": [dict(item, StartTime="2020-06-02T00:00:00Z", EndTime="2021-01-12T00:00:00Z", IsActive=False,
+                         Type="act") for item in items("Season", seasons)],
+        "Events": items("Event", 10),
+        "Characters": items("Character", characters),
+        "Maps": [dict(item, AssetPath=f"/Game/Maps/Map{index}/Map{index}") for index, item in enumerate(items("Map", maps))],
+        "Chromas": items("Chroma", skins),
+        "Skins": items("Skin", skins),
+        "SkinLevels": items("SkinLevel", skins),
+        "Equips": items("Equip", 20),
+        "GameModes": items("GameMode", 12),
+        "Sprays": items("Spray", 300),
+        "SprayLevels": items("SprayLevel", 300),
+        "Charms": items("Charm", 300),
+        "CharmLevels": items("CharmLevel", 300),
+        "PlayerCards": items("PlayerCard", 400),
+        "PlayerTitles": items("PlayerTitle", 200),
+        "StorefrontItems": [],
+    }
+
+
+def leaderboard(season_id, start_index, end_index, total=25000):
+    players = []
+    for index in range(start_index, min(end_index, total)):
+        rng = random.Random(f"leaderboard/{season_id}/{index}")
+        puuid = stable_uuid("leaderboard", season_id, index)
+        players.append({
+            "PlayerCardID": stable_uuid("card", index % 50),
+            "TitleID": stable_uuid("title", index % 20),
+            "IsBanned": False,
+            "IsAnonymized": rng.random() < 0.1,
+            "puuid": puuid,
+            "gameName": f"Player{puuid[:6]}",
+            "tagLine": "EUW",
+            "leaderboardRank": index + 1,
+            "rankedRating": max(0, 1500 - index // 10),
+            "numberOfWins": rng.randint(50, 400),
+            "competitiveTier": 27 if index < 500 else 26 if index < 5000 else 25,
+        })
+    return {
+        "Deployment": "eu-prod",
+        "QueueID": "competitive",
+        "SeasonID": season_id,
+        "Players": players,
+        "totalPlayers": total,
+        "immortalStartingPage": 1,
+        "immortalStartingIndex": 500,
+        "topTierRRThreshold": 550,
+        "tierDetails": {},
+        "startIndex": start_index,
+        "query": "",
+    }
+
+
+def _identity(rng, puuid):
+    return {"Subject": puuid, "PlayerCardID": stable_uuid("card", rng.randint(0, 50)),
+            "PlayerTitleID": stable_uuid("title", rng.randint(0, 20)), "AccountLevel": rng.randint(1, 500),
+            "PreferredLevelBorderID": "", "Incognito": False, "HideAccountLevel": False}
+
+
+def coregame_match(match_id):
+    rng = random.Random(f"coregame/{match_id}")
+    return {
+        "MatchID": match_id,
+        "Version": 1790000000000,
+        "State": "IN_PROGRESS",
+        "MapID": rng.choice(MAP_IDS),
+        "ModeID": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+        "ProvisioningFlow": "Matchmaking",
+        "GamePodID": "aresriot.aws-rclusterprod-euc1-1.eu-gp-frankfurt-1",
+        "AllMUCName": f"{match_id}-all@ares-coregame.eu1.pvp.net",
+        "TeamMUCName": f"{match_id}-blue@ares-coregame.eu1.pvp.net",
+        "TeamVoiceID": f"{match_id}-blue",
+        "IsReconnectable": True,
+        "ConnectionDetails": {"GameServerHosts": ["1.2.3.4"], "GameServerHost": "1.2.3.4", "GameServerPort": 7000,
+                              "GameServerObfuscatedIP": 0, "GameClientHash": 0, "PlayerKey": "x" * 64},
+        "PostGameDetails": None,
+        "Players": [
+            {
+                "Subject": puuid,
+                "TeamID": "Red" if index < 5 else "Blue",
+                "CharacterID": rng.choice(AGENT_IDS),
+                "PlayerIdentity": _identity(rng, puuid),
+                "SeasonalBadgeInfo": {"SeasonID": SEASON_ID, "NumberOfWins": rng.randint(0, 100), "WinsByTier": None,
+                                      "Rank": rng.randint(3, 27), "LeaderboardRank": 0},
+                "IsCoach": False,
+                "IsAssociated": True,
+            }
+            for index, puuid in enumerate(player_puuids(match_id))
+        ],
+        "MatchmakingData": {"QueueID": "competitive", "IsRanked": True},
+    }
+
+
+def pregame_match(match_id, players=5):
+    rng = random.Random(f"pregame/{match_id}")
+    return {
+        "ID": match_id,
+        "Version": 1790000000000,
+        "Teams": [{"TeamID": "Red", "Players": None}],
+        "AllyTeam": {
+            "TeamID": "Red",
+            "Players": [
+                {"Subject": puuid, "CharacterID": rng.choice(AGENT_IDS), "CharacterSelectionState": "selected",
+                 "PregamePlayerState": "joined", "CompetitiveTier": rng.randint(3, 27),
+                 "PlayerIdentity": _identity(rng, puuid), "SeasonalBadgeInfo": None, "IsCaptain": index == 0}
+                for index, puuid in enumerate(player_puuids(match_id, players))
+            ],
+        },
+        "EnemyTeam": None,
+        "ObserverSubjects": [],
+        "MatchCoaches": [],
+        "EnemyTeamSize": 5,
+        "EnemyTeamLockCount": 0,
+        "PregameState": "character_select_active",
+        "LastUpdated": "2026-10-18T00:00:00Z",
+        "MapID": MAP_IDS[0],
+        "MapSelectPool": [],
+        "BannedMapIDs": [],
+        "CastedVotes": None,
+        "MapSelectSteps": [],
+        "MapSelectStep": 0,
+        "Team1": "Red",
+        "GamePodID": "aresriot.aws-rclusterprod-euc1-1.eu-gp-frankfurt-1",
+        "Mode": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+        "VoiceSessionID": f"{match_id}-red",
+        "MUCName": f"{match_id}-red@ares-pregame.eu1.pvp.net",
+        "QueueID": "competitive",
+        "ProvisioningFlowID": "Matchmaking",
+        "IsRanked": True,
+        "PhaseTimeRemainingNS": 80000000000,
+        "StepTimeRemainingNS": 0,
+        "altModesFlagADA": False,
+        "TournamentMetadata": None,
+        "RosterMetadata": None,
+    }
+
+
+def coregame_loadouts(match_id, weapons=18):
+    rng = random.Random(f"loadouts/{match_id}")
+    loadouts = []
+    for puuid in player_puuids(match_id):
+        items = {}
+        for weapon in range(weapons):
+            weapon_id = stable_uuid("weapon", weapon)
+            items[weapon_id] = {
+                "ID": weapon_id,
+                "TypeID": "e7c63390-eda7-46e0-bb7a-a6abdacd2433",
+                "Sockets": {
+                    socket: {"ID": socket, "Item": {"ID": stable_uuid(socket, weapon, rng.randint(0, 30)),
+                                                    "TypeID": stable_uuid("type", socket)}}
+                    for socket in ("bcef87d6-209b-46c6-8b19-fbe40bd95abc", "e7c63390-eda7-46e0-bb7a-a6abdacd2433",
+                                   "3ad1b2b2-acdb-4524-852f-954a76ddae0a", "77258665-71d1-4623-bc72-44db9bd5b3b3")
+                },
+            }
+        loadouts.append({
+            "CharacterID": rng.choice(AGENT_IDS),
+            "Loadout": {"Subject": puuid, "Sprays": {"SpraySelections": []}, "Items": items},
+        })
+    return {"Loadouts": loadouts, "LoadoutsVersion": 1}
+
+
+def party(party_id, size=5):
+    rng = random.Random(f"party/{party_id}")
+    return {
+        "ID": party_id,
+        "MUCName": f"{party_id}@ares-parties.eu1.pvp.net",
+        "VoiceRoomID": party_id,
+        "Version": 1790000000000,
+        "ClientVersion": "release-09.08-shipping-9-2868341",
+        "Members": [
+            {"Subject": puuid, "CompetitiveTier": rng.randint(3, 27), "PlayerIdentity": _identity(rng, puuid),
+             "SeasonalBadgeInfo": None, "IsOwner": index == 0, "QueueEligibleRemainingAccountLevels": 0,
+             "Pings": [{"Ping": rng.randint(10, 60), "GamePodID": f"pod-{pod}"} for pod in range(8)],
+             "IsReady": True, "IsModerator": False, "UseBroadcastHUD": False, "PlatformType": "PC"}
+            for index, puuid in enumerate(player_puuids(party_id, size))
+        ],
+        "State": "DEFAULT",
+        "PreviousState": "MATCHMADE_GAME_STARTING",
+        "StateTransitionReason": "",
+        "Accessibility": "CLOSED",
+        "CustomGameData": {"Settings": {"Map": MAP_IDS[0], "Mode": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+                                        "GamePod": "pod-0", "GameRules": None},
+                           "Membership": {"teamOne": None, "teamTwo": None, "teamSpectate": None,
+                                          "teamOneCoaches": None, "teamTwoCoaches": None},
+                           "MaxPartySize": 12, "AutobalanceEnabled": True, "AutobalanceMinPlayers": 4},
+        "MatchmakingData": {"QueueID": "competitive", "PreferredGamePods": [f"pod-{pod}" for pod in range(8)],
+                            "SkillDisparityRRPenalty": 0},
+        "Invites": None,
+        "Requests": [],
+        "QueueEntryTime": "0001-01-01T00:00:00Z",
+        "EligibleQueues": ["competitive", "unrated", "deathmatch", "spikerush", "swiftplay"],
+        "QueueIneligibilities": [],
+    }
+
+
+def _offer(rng, item_id, vp):
+    return {"OfferID": item_id, "IsDirectPurchase": True, "StartDate": "2026-10-18T00:00:00Z",
+            "Cost": {"85ad13f7-3d1b-5128-9eb2-7cd8ee0b5741": vp},
+            "Rewards": [{"ItemTypeID": "e7c63390-eda7-46e0-bb7a-a6abdacd2433", "ItemID": item_id, "Quantity": 1}]}
+
+
+def storefront(puuid):
+    rng = random.Random(f"storefront/{puuid}")
+    daily = [stable_uuid("skin", rng.randint(0, 800)) for _ in range(4)]
+    bundle_items = [
+        {"Item": {"ItemTypeID": stable_uuid("type", index), "ItemID": stable_uuid("bundle-item", index), "Amount": 1},
+         "BasePrice": 1775, "CurrencyID": "85ad13f7-3d1b-5128-9eb2-7cd8ee0b5741", "DiscountPercent": 0.33,
+         "DiscountedPrice": 1189, "IsPromoItem": False}
+        for index in range(12)
+    ]
+    bundle = {"ID": stable_uuid("bundle", 1), "DataAssetID": stable_uuid("bundle-asset", 1),
+              "CurrencyID": "85ad13f7-3d1b-5128-9eb2-7cd8ee0b5741", "Items": bundle_items, "ItemOffers": None,
+              "TotalBaseCost": None, "TotalDiscountedCost": None, "TotalDiscountPercent": 0,
+              "DurationRemainingInSeconds": 400000, "WholesaleOnly": False}
+    return {
+        "FeaturedBundle": {"Bundle": bundle, "Bundles": [bundle, dict(bundle, ID=stable_uuid("bundle", 2))],
+                           "BundleRemainingDurationInSeconds": 400000},
+        "SkinsPanelLayout": {
+            "SingleItemOffers": daily,
+            "SingleItemStoreOffers": [_offer(rng, item_id, rng.choice([875, 1275, 1775])) for item_id in daily],
+            "SingleItemOffersRemainingDurationInSeconds": 40000,
+        },
+        "UpgradeCurrencyStore": {"UpgradeCurrencyOffers": []},
+        "AccessoryStore": {
+            "AccessoryStoreOffers": [{"Offer": _offer(rng, stable_uuid("accessory", index), 4000),
+                                      "ContractID": stable_uuid("contract", 1)} for index in range(4)],
+            "AccessoryStoreRemainingDurationInSeconds": 300000,
+            "StorefrontID": stable_uuid("storefront", 1),
+        },
+        "BonusStore": {
+            "BonusStoreOffers": [{"BonusOfferID": stable_uuid("bonus", index),
+                                  "Offer": _offer(rng, stable_uuid("skin", index), 1775),
+                                  "DiscountPercent": rng.randint(10, 50), "DiscountCosts": {}, "IsSeen": False}
+                                 for index in range(6)],
+            "BonusStoreRemainingDurationInSeconds": 500000,
+        },
+    }
+
+
+def presence_private(puuid, session_loop_state="MENUS", party_id=None, party_size=1, queue_id="competitive",
+                     match_map=""):
+    rng = random.Random(f"presence/{puuid}")
+    private = {
+        "isValid": True,
+        "partyOwnerMatchScoreAllyTeam": 0,
+        "partyOwnerMatchScoreEnemyTeam": 0,
+        "matchPresenceData": {"sessionLoopState": session_loop_state, "provisioningFlow": "Matchmaking",
+                              "matchMap": match_map, "queueId": queue_id},
+        "partyPresenceData": {"partyId": party_id or stable_uuid("party", puuid), "isPartyOwner": True,
+                              "partyState": "DEFAULT", "partyAccessibility": "CLOSED", "partyLFM": False,
+                              "partyClientVersion": "release-09.08-shipping-9-2868341", "partySize": party_size,
+                              "maxPartySize": 5, "queueEntryTime": "0001.01.01-00.00.00",
+                              "customGameName": "", "customGameTeam": "", "partyOwnerSessionLoopState":
+                                  session_loop_state},
+        "playerPresenceData": {"playerCardId": stable_uuid("card", 1), "playerTitleId": stable_uuid("title", 1),
+                               "preferredLevelBorderId": "", "accountLevel": rng.randint(1, 500),
+                               "competitiveTier": rng.randint(3, 27), "leaderboardPosition": 0},
+        "premierPresenceData": {"rosterId": "", "rosterName": "", "rosterTag": "", "division": 0, "score": 0},
+        "isIdle": False,
+    }
+    return base64.b64encode(json.dumps(private).encode("utf-8")).decode("ascii")
+
+
+def presences(puuids, **private):
+    return {"presences": [
+        {"actor": "", "basic": "", "details": "", "game_name": f"Player{puuid[:6]}", "game_tag": "EUW",
+         "location": "", "msg": "", "name": "", "patchline": None, "pid": f"{puuid}@eu1.pvp.net", "platform": None,
+         "private": presence_private(puuid, **private), "privateJwt": None, "product": "valorant",
+         "puuid": puuid, "region": "eu", "resource": "RC-1234", "state": "chat", "summary": "", "time": 1790000000000}
+        for puuid in puuids
+    ]}
+
+
+def player_names(puuids):
+    return [
+        {"DisplayName": "", "Subject": puuid, "GameName": f"Player{puuid[:6]}", "TagLine": "EUW"}
+        for puuid in puuids
+    ]
@@ -0,0 +1,465 @@
+"""
+Local HTTPS stand-in for the Riot client API and the pd/glz/shared hosts.
+
+All hosts are served by one server and requests are routed by path, so a
+MockValClient only has to point its base URLs at `MockRiotServer.url`. PvP
+base URLs carry the host class and the client's region as their first path
+segment (`<url>/pd.eu`, `<url>/glz.eu`, `<url>/shared.eu`), which the server
+strips before routing and `mock_host_class` reads. So the client's per-host
+rate limits apply, and building a PvP URL resolves the region as it does
+against Riot's hosts. Local
+client routes check the lockfile password like the real client; PvP routes can
+be made to answer 429 to exercise rate-limit handling. Payloads are generated by
+`fixtures`, or read from a directory of responses recorded from a live client
+(see benchmarks/record_fixtures.py).
+"""
+import base64
+import json
+import os
+import re
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter, namedtuple
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from valapiclient.events import EventStream
+from valapiclient.local_api import ValClient
+from valapiclient.rate_limit import host_class
+
+from . import fixtures
+
+PUUID = "a1b2c3d4-0000-4000-8000-000000000001"
+PREGAME_MATCH_ID = "b2c3d4e5-0000-4000-8000-000000000002"
+COREGAME_MATCH_ID = "c3d4e5f6-0000-4000-8000-000000000003"
+CLIENT_VERSION = "release-09.08-shipping-9-2868341"
+PASSWORD = "mock-password"
+# Host classes of the PvP hosts, served under <url>/<host class>.<region>
+PVP_HOSTS = ("pd", "glz", "shared")
+_HOST_PREFIX = re.compile(r"^/(?:%s)\.[^/]+" % "|".join(PVP_HOSTS))
+# rate_limits leaving every PvP host unlimited
+UNLIMITED = {host: None for host in PVP_HOSTS}
+
+# requests prefers these over `Session.verify = False`, which would reject the self-signed certificate
+for _variable in ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE"):
+    os.environ.pop(_variable, None)
+
+
+def make_jwt(claims):
+    """Build an unsigned JWT carrying `claims`."""
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode("utf-8")).decode("utf-8").rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+def generate_certificate(directory):
+    """Create a self-signed certificate for 127.0.0.1 with the openssl CLI."""
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1", "-keyout", key_path, "-out", cert_path],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return cert_path, key_path
+
+
+MockRequest = namedtuple("MockRequest", "method path query body headers")
+
+
+@lru_cache(maxsize=256)
+def _match_details(match_id):
+    """Match details are large; encode each one once."""
+    return json.dumps(fixtures.match_details(match_id)).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _content():
+    return json.dumps(fixtures.content()).encode("utf-8")
+
+
+def mock_host_class(url):
+    """host_class for MockValClient URLs: the PvP host class starts the first path segment ('pd.eu')."""
+    segment = urlsplit(url).path.lstrip("/").partition("/")[0]
+    host = segment.partition(".")[0]
+    return host if host in PVP_HOSTS else host_class(url)
+
+
+def fixture_filename(route_name):
+    """File name of a recorded response for a route: 'mmr/v1/players/{puuid}' -> 'mmr_v1_players_puuid.json'."""
+    return re.sub(r"[^A-Za-z0-9]+", "_", route_name).strip("_") + ".json"
+
+
+def _page(query, start_default, end_default):
+    params = parse_qs(query)
+    return (int(params.get("startIndex", [start_default])[0]),
+            int(params.get("endIndex", [end_default])[0]))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections when a benchmark opens dozens at once
+    request_queue_size = 256
+
+
+class MockRiotServer:
+    """
+    Threaded HTTPS server answering local-client and PvP routes with canned payloads.
+
+    Args:
+        latency (float): Seconds to sleep before answering each request.
+        throttle_every (int): Answer every Nth PvP request with 429 Too Many Requests; 0 never does.
+        retry_after (float): Retry-After seconds sent with those 429s; None sends no header.
+        recorded (str): Directory of recorded responses (see fixture_filename); a route with a
+            recording serves it instead of its generated payload whenever it would answer 200.
+    """
+
+    def __init__(self, latency=0.0, throttle_every=0, retry_after=0.05, recorded=None):
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.throttled = 0
+        self.recorded = {}
+        self.counts = Counter()
+        self.routes = []
+        self.pregame_match_id = PREGAME_MATCH_ID
+        self.coregame_match_id = None
+        self.session_loop_state = "MENUS"
+        self.friends = []
+        self.tokens_issued = 0
+        self._pvp_requests = 0
+        self._local_authorization = "Basic " + base64.b64encode(f"riot:{PASSWORD}".encode("utf-8")).decode("utf-8")
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._tempdir = None
+        self.cert_path = None
+        self.register_default_routes()
+        if recorded:
+            self.load_recorded(recorded)
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return f"https://127.0.0.1:{self.port}"
+
+    @property
+    def total_requests(self):
+        with self._lock:
+            return sum(self.counts.values())
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts.clear()
+            self.throttled = 0
+
+    def add_route(self, method, pattern, handler, name=None, local=False):
+        """
+        Register `handler(match, request)` for requests matching `pattern`.
+
+        The handler returns (status, payload) or (status, payload, headers); payload is
+        JSON-encoded unless it is bytes. `local` routes belong to the local client: they
+        need the lockfile password and are never throttled.
+        """
+        self.routes.append((method, re.compile(f"^{pattern}$"), handler, name or pattern, local))
+
+    def load_recorded(self, directory):
+        """Serve the recorded responses in `directory` for the routes that have one; returns their names."""
+        for _, _, _, name, _ in self.routes:
+            recorded_path = os.path.join(directory, fixture_filename(name))
+            if os.path.exists(recorded_path):
+                with open(recorded_path, "rb") as recording:
+                    self.recorded[name] = recording.read()
+        return sorted(self.recorded)
+
+    def write_lockfile(self, directory):
+        """Write a Riot client lockfile for this server into `directory` and return its path."""
+        lockfile_path = os.path.join(directory, "lockfile")
+        with open(lockfile_path, "w") as lockfile:
+            lockfile.write(f"Riot Client:{os.getpid()}:{self.port}:{PASSWORD}:https")
+        return lockfile_path
+
+    def set_game_state(self, state):
+        """Move the mock player to MENUS, PREGAME or INGAME: presence and glz match lookups follow."""
+        self.session_loop_state = state
+        self.pregame_match_id = PREGAME_MATCH_ID if state == "PREGAME" else None
+        self.coregame_match_id = COREGAME_MATCH_ID if state == "INGAME" else None
+
+    def presences(self):
+        """The `chat/v4/presences` payload: the player's own presence followed by `friends`."""
+        own = fixtures.presences([PUUID], session_loop_state=self.session_loop_state)["presences"]
+        return {"presences": own + list(self.friends)}
+
+    def register_default_routes(self):
+        self.add_route("GET", r"/entitlements/v1/token", self._entitlements_token, "entitlements/v1/token", local=True)
+        self.add_route("GET", r"/product-session/v1/external-sessions", self._external_sessions,
+                       "product-session/v1/external-sessions", local=True)
+        self.add_route("GET", r"/v1/version", self._version, "v1/version")
+        self.add_route("GET", r"/chat/v4/friends", lambda m, r: (200, {"friends": []}), "chat/v4/friends", local=True)
+        self.add_route("GET", r"/chat/v4/presences", lambda m, r: (200, self.presences()), "chat/v4/presences",
+                       local=True)
+        self.add_route("GET", r"/_mock/headers",
+                       lambda m, r: (200, {name.lower(): value for name, value in r.headers.items()}), "_mock/headers")
+        self.add_route("GET", r"/userinfo", lambda m, r: (200, {"sub": PUUID}), "userinfo")
+        self.add_route("GET", r"/pregame/v1/players/([^/]+)", self._pregame_player, "pregame/v1/players/{puuid}")
+        self.add_route("GET", r"/core-game/v1/players/([^/]+)", self._coregame_player, "core-game/v1/players/{puuid}")
+        self.add_route("GET", r"/core-game/v1/matches/([^/]+)", lambda m, r: (200, fixtures.coregame_match(m.group(1))),
+                       "core-game/v1/matches/{match_id}")
+        self.add_route("GET", r"/core-game/v1/matches/([^/]+)/loadouts",
+                       lambda m, r: (200, fixtures.coregame_loadouts(m.group(1))),
+                       "core-game/v1/matches/{match_id}/loadouts")
+        self.add_route("GET", r"/pregame/v1/matches/([^/]+)", lambda m, r: (200, fixtures.pregame_match(m.group(1))),
+                       "pregame/v1/matches/{match_id}")
+        self.add_route("GET", r"/pregame/v1/matches/([^/]+)/loadouts",
+                       lambda m, r: (200, fixtures.coregame_loadouts(m.group(1))),
+                       "pregame/v1/matches/{match_id}/loadouts")
+        self.add_route("POST", r"/pregame/v1/matches/([^/]+)/(select|lock)/([^/]+)", self._pregame_action,
+                       "pregame/v1/matches/{match_id}/{action}/{agent_id}")
+        self.add_route("POST", r"/pregame/v1/matches/([^/]+)/quit", self._pregame_quit,
+                       "pregame/v1/matches/{match_id}/quit")
+        self.add_route("GET", r"/mmr/v1/players/([^/]+)", lambda m, r: (200, fixtures.mmr(m.group(1))),
+                       "mmr/v1/players/{puuid}")
+        self.add_route("GET", r"/mmr/v1/players/([^/]+)/competitiveupdates", self._competitive_updates,
+                       "mmr/v1/players/{puuid}/competitiveupdates")
+        self.add_route("GET", r"/account-xp/v1/players/([^/]+)", lambda m, r: (200, fixtures.account_xp(m.group(1))),
+                       "account-xp/v1/players/{puuid}")
+        self.add_route("GET", r"/match-history/v1/history/([^/]+)", self._match_history,
+                       "match-history/v1/history/{puuid}")
+        self.add_route("GET", r"/match-details/v1/matches/([^/]+)", lambda m, r: (200, _match_details(m.group(1))),
+                       "match-details/v1/matches/{match_id}")
+        self.add_route("GET", r"/leaderboards/v2/([^/]+)", self._leaderboard, "leaderboards/v2/{season_id}")
+        self.add_route("GET", r"/content-service/v3/content", self._content, "content-service/v3/content")
+        self.add_route("PUT", r"/name-service/v2/players", lambda m, r: (200, fixtures.player_names(json.loads(r.body))),
+                       "name-service/v2/players")
+
+    def _content(self, match, request):
+        etag = f'"{CLIENT_VERSION}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, b"", {"ETag": etag}
+        return 200, _content(), {"ETag": etag}
+
+    def _competitive_updates(self, match, request):
+        start, end = _page(request.query, 0, 10)
+        return 200, fixtures.competitive_updates(match.group(1), start, end)
+
+    def _match_history(self, match, request):
+        start, end = _page(request.query, 0, 20)
+        queue = parse_qs(request.query).get("queue", ["competitive"])[0]
+        return 200, fixtures.match_history(match.group(1), start, end, queue_id=queue)
+
+    def _leaderboard(self, match, request):
+        start, end = _page(request.query, 0, 20)
+        return 200, fixtures.leaderboard(match.group(1), start, end)
+
+    def _entitlements_token(self, match, request):
+        expires = int(time.time()) + 3600
+        with self._lock:
+            self.tokens_issued += 1
+            issued = self.tokens_issued
+        # Both tokens of one issue carry the same "n", so a request mixing two issues can be detected
+        return 200, {
+            "accessToken": make_jwt({"sub": PUUID, "exp": expires, "n": issued}),
+            "token": make_jwt({"sub": PUUID, "exp": expires, "n": issued}),
+            "subject": PUUID,
+        }
+
+    def _external_sessions(self, match, request):
+        return 200, {
+            "host_app": {"launchConfiguration": {"arguments": []}},
+            "valorant": {"launchConfiguration": {"arguments": ["-ares-deployment=eu", "-config-endpoint=x"]}},
+        }
+
+    def _version(self, match, request):
+        etag = f'"{CLIENT_VERSION}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, b"", {"ETag": etag}
+        return 200, {"status": 200, "data": {"riotClientVersion": CLIENT_VERSION, "version": "09.08.00.2868341"}}, \
+            {"ETag": etag}
+
+    def _pregame_player(self, match, request):
+        if not self.pregame_match_id:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        return 200, {"Subject": match.group(1), "MatchID": self.pregame_match_id, "Version": 1}
+
+    def _coregame_player(self, match, request):
+        if not self.coregame_match_id:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        return 200, {"Subject": match.group(1), "MatchID": self.coregame_match_id, "Version": 1}
+
+    def _pregame_action(self, match, request):
+        if match.group(1) != self.pregame_match_id:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        state = "locked" if match.group(2) == "lock" else "selected"
+        return 200, {
+            "ID": match.group(1),
+            "AllyTeam": {"Players": [{"Subject": PUUID, "CharacterID": match.group(3),
+                                      "CharacterSelectionState": state}]},
+        }
+
+    def _pregame_quit(self, match, request):
+        if match.group(1) != self.pregame_match_id:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        return 200, {}
+
+    def _throttle(self):
+        """Whether to answer this PvP request with 429; every `throttle_every`th one is."""
+        if not self.throttle_every:
+            return False
+        with self._lock:
+            self._pvp_requests += 1
+            if self._pvp_requests % self.throttle_every:
+                return False
+            self.throttled += 1
+        return True
+
+    def dispatch(self, method, path, body, headers=None):
+        route_path, _, query = path.partition("?")
+        # Like http.server does for the whole path, collapse the leading slashes left by base URLs ending in '/'
+        route_path = "/" + _HOST_PREFIX.sub("", route_path).lstrip("/")
+        headers = headers or {}
+        request = MockRequest(method, route_path, query, body, headers)
+        for route_method, pattern, handler, name, local in self.routes:
+            if route_method != method:
+                continue
+            match = pattern.match(route_path)
+            if match:
+                with self._lock:
+                    self.counts[name] += 1
+                if local and headers.get("Authorization") != self._local_authorization:
+                    return 401, {"errorCode": "UNAUTHORIZED"}
+                if not local and self._throttle():
+                    retry = {} if self.retry_after is None else {"Retry-After": str(self.retry_after)}
+                    return 429, {"errorCode": "RATE_LIMITED"}, retry
+                result = handler(match, request)
+                if result[0] == 200 and name in self.recorded:
+                    return (200, self.recorded[name]) + tuple(result[2:])
+                return result
+        with self._lock:
+            self.counts[f"unrouted {method} {route_path}"] += 1
+        return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; don't let Nagle hold the body back
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if server.latency:
+                    time.sleep(server.latency)
+                status, payload, *extra = server.dispatch(self.command, self.path, body, self.headers)
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+        return Handler
+
+    def start(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.cert_path, key_path = generate_certificate(self._tempdir.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert_path, key_path)
+
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._tempdir:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class MockValClient(ValClient):
+    """
+    ValClient whose pd, glz, shared and version URLs point at a MockRiotServer.
+
+    Each PvP host gets its own base URL and the rate limiter classifies them with
+    mock_host_class, so `rate_limits` budgets apply as they do against Riot's hosts.
+    Unless `rate_limits` is passed, the hosts are unlimited.
+
+    Pass `lockfile` (see MockRiotServer.write_lockfile) to read the port and password
+    from a lockfile, as ValClient.init_from_lockFile does.
+    """
+
+    def __init__(self, server, event_server=None, lockfile=None, **kwargs):
+        self.mock_url = server.url
+        # Keep benchmarks out of the user's cache directory unless a cache is passed explicitly
+        kwargs.setdefault("content_cache", False)
+        # Benchmarks compare the client's request patterns; budgets are opted into with rate_limits
+        kwargs.setdefault("rate_limits", UNLIMITED)
+        lock_data = ValClient.parse_lockfile(lockfile) if lockfile else {"port": server.port, "password": PASSWORD}
+        super().__init__("127.0.0.1", lock_data["port"], "riot", lock_data["password"], **kwargs)
+        # Verify against the mock's certificate so the forced-cipher TLSAdapter stays in use
+        self.session.verify = server.cert_path
+        self.rate_limiter.classify = mock_host_class
+        if event_server is not None:
+            self.events = EventStream(self, url=f"wss://127.0.0.1:{event_server.port}")
+
+    def _fetch_version(self, headers):
+        # Called during __init__ with eager=True, before the session trusts the mock's certificate
+        return self.local_session.get(f"{self.mock_url}/v1/version", headers=headers, verify=False,
+                                      timeout=self.connections.timeout)
+
+    # Like ValClient's, these read self.region, so the first PvP call resolves it
+    def get_glz_url(self):
+        return f"{self.mock_url}/glz.{self.region}"
+
+    def get_shared_url(self):
+        return f"{self.mock_url}/shared.{self.region}"
+
+    def get_pd_url(self):
+        return f"{self.mock_url}/pd.{self.region}"
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def format_latency(name, samples, requests_per_op):
+    """Format one benchmark row: requests per operation, p50 and p99 in milliseconds."""
+    return (f"{name:<36} {requests_per_op:>6.2f} req/op   "
+            f"p50 {percentile(samples, 50) * 1000:>8.2f} ms   p99 {percentile(samples, 99) * 1000:>8.2f} ms")
@@ -0,0 +1,234 @@
+"""
+Local stand-in for the Riot client's WAMP-over-WebSocket event socket.
+
+Accepts `[5, name]` subscriptions and `[6, name]` unsubscriptions, and
+`publish()` sends `[8, name, {"data", "eventType", "uri"}]` to every client
+subscribed to the event's name or to the `OnJsonApiEvent` prefix. Only the parts
+of RFC 6455 the client uses are implemented: text, ping and close frames.
+"""
+import base64
+import hashlib
+import json
+import socket
+import ssl
+import struct
+import tempfile
+import threading
+
+from valapiclient.events import ALL_EVENTS, EVENT, SUBSCRIBE, UNSUBSCRIBE, event_name
+
+from .mock_server import generate_certificate
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_TEXT = 0x1
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class _Connection:
+    def __init__(self, sock):
+        self.sock = sock
+        self.subscriptions = set()
+        self.lock = threading.Lock()
+
+    def send_frame(self, opcode, payload=b""):
+        header = bytes([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header += bytes([length])
+        elif length < 1 << 16:
+            header += bytes([126]) + struct.pack("!H", length)
+        else:
+            header += bytes([127]) + struct.pack("!Q", length)
+        with self.lock:
+            self.sock.sendall(header + payload)
+
+    def _read_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("client closed the connection")
+            data += chunk
+        return data
+
+    def read_frame(self):
+        first, second = self._read_exact(2)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self._read_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self._read_exact(8))[0]
+        mask = self._read_exact(4) if second & 0x80 else None
+        payload = self._read_exact(length)
+        if mask:
+            payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return opcode, payload
+
+    def wants(self, name):
+        return name in self.subscriptions or ALL_EVENTS in self.subscriptions
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class MockEventServer:
+    """
+    Args:
+        password (str): Expected password for the `riot` user in the Basic auth header.
+    """
+
+    def __init__(self, password="mock-password"):
+        self.password = password
+        self.connections_accepted = 0
+        self.rejected = 0
+        self._connections = []
+        self._lock = threading.Lock()
+        self._listener = None
+        self._tempdir = None
+        self._subscribed = threading.Condition(self._lock)
+
+    @property
+    def port(self):
+        return self._listener.getsockname()[1]
+
+    @property
+    def clients(self):
+        with self._lock:
+            return len(self._connections)
+
+    def start(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        cert_path, key_path = generate_certificate(self._tempdir.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+        listener = socket.create_server(("127.0.0.1", 0))
+        self._listener = context.wrap_socket(listener, server_side=True)
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.drop_connections()
+        if self._listener:
+            self._listener.close()
+            self._listener = None
+        if self._tempdir:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _accept(self):
+        while self._listener is not None:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _handshake(self, sock):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return False
+            request += chunk
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {name.strip().lower(): value.strip()
+                   for name, _, value in (line.partition(":") for line in lines[1:] if line)}
+
+        expected = "Basic " + base64.b64encode(f"riot:{self.password}".encode("utf-8")).decode("utf-8")
+        if headers.get("authorization") != expected:
+            sock.sendall(b"HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\n\r\n")
+            return False
+
+        accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + _GUID).encode()).digest()).decode()
+        sock.sendall((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode("utf-8"))
+        return True
+
+    def _serve(self, sock):
+        if not self._handshake(sock):
+            with self._lock:
+                self.rejected += 1
+            sock.close()
+            return
+
+        connection = _Connection(sock)
+        with self._lock:
+            self._connections.append(connection)
+            self.connections_accepted += 1
+        try:
+            while True:
+                opcode, payload = connection.read_frame()
+                if opcode == OP_CLOSE:
+                    connection.send_frame(OP_CLOSE, payload[:2])
+                    return
+                if opcode == OP_PING:
+                    connection.send_frame(OP_PONG, payload)
+                elif opcode == OP_TEXT:
+                    self._handle_message(connection, json.loads(payload))
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            connection.close()
+
+    def _handle_message(self, connection, message):
+        with self._lock:
+            if message[0] == SUBSCRIBE:
+                connection.subscriptions.add(message[1])
+                self._subscribed.notify_all()
+            elif message[0] == UNSUBSCRIBE:
+                connection.subscriptions.discard(message[1])
+                self._subscribed.notify_all()
+
+    def wait_for_subscribers(self, name=ALL_EVENTS, count=1, timeout=5):
+        """Block until `count` clients are subscribed to `name` (or to every event)."""
+        with self._lock:
+            return self._subscribed.wait_for(
+                lambda: sum(connection.wants(name) for connection in self._connections) >= count, timeout
+            )
+
+    def wait_for_unsubscribed(self, name, timeout=5):
+        """Block until no client is subscribed to `name` (or to every event)."""
+        with self._lock:
+            return self._subscribed.wait_for(
+                lambda: not any(connection.wants(name) for connection in self._connections), timeout
+            )
+
+    def publish(self, uri, data, event_type="Update"):
+        """Send an event for `uri` to every subscribed client. Returns the number of clients it was sent to."""
+        name = event_name(uri)
+        frame = json.dumps([EVENT, name, {"data": data, "eventType": event_type, "uri": uri}]).encode("utf-8")
+        with self._lock:
+            targets = [connection for connection in self._connections if connection.wants(name)]
+        for connection in targets:
+            try:
+                connection.send_frame(OP_TEXT, frame)
+            except OSError:
+                pass
+        return len(targets)
+
+    def drop_connections(self):
+        """Close every client connection without a close frame, as a crashing Riot client would."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,84 @@
+"""
+Record responses from a running Riot client and the live PvP hosts for the benchmark stand-in.
+
+Saves the raw body of every route below that answers 200, named by
+mock_server.fixture_filename, so `MockRiotServer(recorded=directory)` (or
+`python -m benchmarks.suite --recorded directory`) serves real payloads
+instead of generated ones. Pregame and core-game matches are only recorded
+while the player is in agent select or a match.
+
+Recordings hold account data (names, PUUIDs, match history); keep them out of
+the repository.
+
+Run from the repository root while VALORANT is running:
+
+    python -m benchmarks.record_fixtures recorded/
+"""
+import argparse
+import os
+
+from valapiclient.local_api import ValClient
+from valapiclient.endpoints.pvp import HISTORY_PAGE_SIZE
+
+from .mock_server import fixture_filename
+
+
+def record(name, call, directory):
+    response = call()
+    if response is None or response.status_code != 200:
+        print(f"skipped {name}: {response.status_code if response is not None else 'no response'}")
+        return None
+    with open(os.path.join(directory, fixture_filename(name)), "wb") as file:
+        file.write(response.content)
+    print(f"recorded {name} ({len(response.content)} bytes)")
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="where to write the recordings")
+    parser.add_argument("--lockfile", help="lockfile path, if not in the default location")
+    args = parser.parse_args()
+    os.makedirs(args.directory, exist_ok=True)
+
+    api = ValClient.init_from_lockFile(lockfile_path=args.lockfile, eager=True)
+    puuid = api.get_current_player_puuid()
+    pd, glz, shared = api.get_pd_url(), api.get_glz_url(), api.get_shared_url()
+
+    def pvp(suffix, prefix, **kwargs):
+        return lambda: api.handle_pvp_request(suffix, prefix=prefix, **kwargs)
+
+    # Routes whose answer depends on the request body or the stand-in's game state (presences,
+    # name-service, pregame/core-game player lookups) are left to the stand-in
+    routes = [
+        ("product-session/v1/external-sessions", lambda: api.handle_local_request("product-session/v1/external-sessions")),
+        ("chat/v4/friends", lambda: api.handle_local_request("chat/v4/friends")),
+        ("mmr/v1/players/{puuid}", pvp(f"mmr/v1/players/{puuid}", pd)),
+        ("mmr/v1/players/{puuid}/competitiveupdates",
+         pvp(f"mmr/v1/players/{puuid}/competitiveupdates?startIndex=0&endIndex={HISTORY_PAGE_SIZE}", pd)),
+        ("account-xp/v1/players/{puuid}", pvp(f"account-xp/v1/players/{puuid}", shared)),
+        ("content-service/v3/content", pvp("content-service/v3/content", shared)),
+    ]
+    for name, call in routes:
+        record(name, call, args.directory)
+
+    history = record("match-history/v1/history/{puuid}",
+                     pvp(f"match-history/v1/history/{puuid}?startIndex=0&endIndex={HISTORY_PAGE_SIZE}", pd),
+                     args.directory)
+    if history is not None and history.json().get("History"):
+        match_id = history.json()["History"][0]["MatchID"]
+        record("match-details/v1/matches/{match_id}", pvp(f"match-details/v1/matches/{match_id}", pd),
+               args.directory)
+
+    for stage in ("pregame", "core-game"):
+        player = api.handle_pvp_request(f"{stage}/v1/players/{puuid}", prefix=glz)
+        if player is None or player.status_code != 200:
+            continue
+        match_id = player.json()["MatchID"]
+        record(f"{stage}/v1/matches/{{match_id}}", pvp(f"{stage}/v1/matches/{match_id}", glz), args.directory)
+        record(f"{stage}/v1/matches/{{match_id}}/loadouts", pvp(f"{stage}/v1/matches/{match_id}/loadouts", glz),
+               args.directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Multithreaded stress test of per-request headers on one shared session.
+
+Threads send PvP requests (through handle_pvp_request with per-request extra
+headers, and through Request with their own header mapping) on the single
+ValClient.session while another thread keeps forcing token refreshes. The
+stand-in echoes the headers it received, and every response is checked:
+
+- the per-request header is the one this thread sent
+- the access and entitlements tokens come from the same refresh
+- the shared session's headers and `verify` are never modified
+
+Run from the repository root:
+
+    python -m benchmarks.stress_headers --threads 16 --requests 200
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from valapiclient.request_class import Request
+from valapiclient.token_manager import decode_jwt_claims
+
+from .mock_server import MockRiotServer, MockValClient
+
+
+def issue(header_value):
+    return decode_jwt_claims(header_value.replace("Bearer ", "", 1)).get("n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per thread")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    with MockRiotServer(latency=args.latency) as server:
+        api = MockValClient(server)
+        api.warm_up()
+        session_headers = dict(api.session.headers)
+        session_verify = api.session.verify
+        url = f"{server.url}/_mock/headers"
+        failures = []
+        stop = threading.Event()
+
+        def refresher():
+            while not stop.is_set():
+                api.tokens.force_refresh()
+                time.sleep(0.005)
+
+        def worker(thread):
+            for index in range(args.requests):
+                tag = f"{thread}-{index}"
+                if index % 2:
+                    echoed = Request(url, api.request_headers({"X-Stress": tag}), session=api.session).get_json()
+                else:
+                    response = api.handle_pvp_request("_mock/headers", prefix=server.url,
+                                                      header=api.request_headers({"X-Stress": tag}))
+                    echoed = response.json()
+                if echoed.get("x-stress") != tag:
+                    failures.append(f"{tag}: received X-Stress {echoed.get('x-stress')!r}")
+                access, entitlements = issue(echoed["authorization"]), issue(echoed["x-riot-entitlements-jwt"])
+                if access != entitlements:
+                    failures.append(f"{tag}: access token from refresh {access}, entitlements from {entitlements}")
+
+        refresh_thread = threading.Thread(target=refresher, daemon=True)
+        refresh_thread.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            for future in [executor.submit(worker, thread) for thread in range(args.threads)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        refresh_thread.join()
+
+        if dict(api.session.headers) != session_headers:
+            failures.append(f"session headers changed: {dict(api.session.headers)}")
+        if api.session.verify != session_verify:
+            failures.append(f"session verify changed to {api.session.verify!r}")
+
+        total = args.threads * args.requests
+        print(f"{total} requests on {args.threads} threads in {elapsed:.2f}s ({total / elapsed:.0f} req/s), "
+              f"{server.tokens_issued} token refreshes")
+        total_connections = api.connections.stats.snapshot()["total"]
+        print(f"connections opened: {total_connections['created']}")
+        if failures:
+            print(f"FAILED: {len(failures)} problems")
+            for failure in failures[:20]:
+                print(f"  {failure}")
+            raise SystemExit(1)
+        print("OK: every request carried its own headers and a matching token pair")
+
+
+if __name__ == "__main__":
+    main()
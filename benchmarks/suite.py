@@ -0,0 +1,248 @@
+"""
+Offline benchmark suite: the client's main workloads against the local stand-ins.
+
+Each scenario runs against MockRiotServer (the local client API and the
+pd/glz/shared hosts on one HTTPS server) and reports requests per operation,
+p50/p99 latency, throughput and requests per second, plus the 429s the server
+injected. PvP hosts are unlimited unless --budget sets their rate limits. Results can
+be saved and compared with an earlier run to catch regressions offline.
+
+Scenarios:
+    startup         read the lockfile, construct with eager=True, first PvP call
+    agent_lock      lock an agent on a cached pregame session
+    lobby_snapshot  core-game match, loadouts, names, MMR and XP of 10 players (names not cached)
+    history_crawl   full match history of a 10-player lobby, then the details of its newest matches
+    bulk_names      names of players not seen before, through the batching name resolver
+    rate_limited    MMR lookups from 10 threads under a tight pd budget; exits 1 if the
+                    requests outpace the budget
+
+Run from the repository root:
+
+    python -m benchmarks.suite --latency 0.02 --iterations 20
+    python -m benchmarks.suite --throttle-every 25 --scenarios lobby_snapshot,bulk_names
+    python -m benchmarks.suite --budget default --scenarios lobby_snapshot
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import itertools
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from valapiclient.batch import run_batch
+from valapiclient.game_state import INGAME, PREGAME
+
+from . import fixtures
+from .mock_server import PUUID, PVP_HOSTS, UNLIMITED, MockRiotServer, MockValClient, percentile
+
+AGENT_ID = fixtures.AGENT_IDS[0]
+# (requests per second, burst) of the pd host in the rate_limited scenario, and lookups per operation
+RATE_LIMITED_BUDGET = (50.0, 5)
+RATE_LIMITED_LOOKUPS = 10
+
+
+def client(server, args, **kwargs):
+    """MockValClient with the --budget rate limits."""
+    return MockValClient(server, rate_limits=args.rate_limits, **kwargs)
+
+
+def prepare_startup(server, args, workdir):
+    lockfile = server.write_lockfile(workdir)
+
+    def startup():
+        client(server, args, lockfile=lockfile, eager=True).pvp.get_player_mmr(PUUID)
+    return startup
+
+
+def prepare_agent_lock(server, args, workdir):
+    server.set_game_state(PREGAME)
+    api = client(server, args)
+    api.pregame.get_session(refresh=True)
+    return lambda: api.pregame.lock_pregame_agent(AGENT_ID)
+
+
+def prepare_lobby_snapshot(server, args, workdir):
+    server.set_game_state(INGAME)
+    api = client(server, args)
+    api.warm_up()
+
+    def lobby_snapshot():
+        api.names.invalidate()
+        api.coregame.get_lobby_snapshot()
+    return lobby_snapshot
+
+
+def prepare_history_crawl(server, args, workdir):
+    api = client(server, args)
+    api.warm_up()
+    lobbies = itertools.count()
+
+    def crawl():
+        puuids = fixtures.player_puuids(f"crawl-{next(lobbies)}")
+        histories = run_batch(lambda puuid: list(api.pvp.iter_match_history(puuid)), puuids, max_workers=10)
+        newest = [result.value[0]["MatchID"] for result in histories if result.ok and result.value]
+        api.pvp.get_many_match_details(newest[:args.details], max_workers=8)
+    return crawl
+
+
+def prepare_bulk_names(server, args, workdir):
+    api = client(server, args)
+    api.warm_up()
+    batches = itertools.count()
+    return lambda: api.names.resolve(fixtures.player_puuids(f"names-{next(batches)}", args.names))
+
+
+def prepare_rate_limited(server, args, workdir):
+    api = MockValClient(server, rate_limits={"pd": RATE_LIMITED_BUDGET})
+    api.warm_up()
+    return lambda: run_batch(lambda _: api.pvp.get_player_mmr(PUUID), range(RATE_LIMITED_LOOKUPS), max_workers=10)
+
+
+# name -> prepare(server, args, workdir), which returns the operation to time
+SCENARIOS = {
+    "startup": prepare_startup,
+    "agent_lock": prepare_agent_lock,
+    "lobby_snapshot": prepare_lobby_snapshot,
+    "history_crawl": prepare_history_crawl,
+    "bulk_names": prepare_bulk_names,
+    "rate_limited": prepare_rate_limited,
+}
+
+
+def run_scenario(server, operation, iterations, concurrency):
+    """Time `iterations` operations, `concurrency` at a time; returns one result row."""
+    operation()  # warm connections and caches
+    server.reset_counts()
+
+    def timed(_):
+        start = time.perf_counter()
+        operation()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(timed, range(iterations)))
+    else:
+        samples = [timed(index) for index in range(iterations)]
+    wall = time.perf_counter() - start
+    return {
+        "requests_per_op": server.total_requests / iterations,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "ops_per_s": iterations / wall,
+        "requests_per_s": server.total_requests / wall,
+        "wall_s": wall,
+        "throttled": server.throttled,
+    }
+
+
+def format_row(name, result):
+    return (f"{name:<16} {result['requests_per_op']:>8.2f} {result['p50_ms']:>10.2f} {result['p99_ms']:>10.2f} "
+            f"{result['ops_per_s']:>9.1f} {result['requests_per_s']:>8.1f} {result['throttled']:>6}")
+
+
+def check_rate_limited(result):
+    """The problem with the rate_limited result, or None if its requests kept to the pd budget."""
+    rate, burst = RATE_LIMITED_BUDGET
+    # The warm-up operation spends the burst, but allow for it anyway; 10% covers timer slack
+    allowed = rate * 1.1 + burst / result["wall_s"]
+    if result["requests_per_s"] > allowed:
+        return (f"rate_limited: {result['requests_per_s']:.1f} requests/s against a pd budget of "
+                f"{rate:g}/s (burst {burst})")
+    return None
+
+
+def parse_budget(value):
+    """--budget value -> rate_limits: 'RATE,BURST' for every PvP host, or 'default' for the client's budgets."""
+    if value == "default":
+        return None
+    try:
+        rate, burst = (float(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected RATE,BURST or 'default', got {value!r}")
+    return {host: (rate, int(burst)) for host in PVP_HOSTS}
+
+
+def compare(results, baseline, tolerance):
+    """Print the change of every metric against `baseline`; returns the regressions beyond `tolerance`."""
+    regressions = []
+    print(f"\nagainst baseline (tolerance {tolerance:.0%}):")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<16} not in baseline")
+            continue
+        changes = []
+        # Higher is worse for every metric but throughput
+        for key, worse_if_higher in (("requests_per_op", True), ("p50_ms", True), ("p99_ms", True),
+                                     ("ops_per_s", False)):
+            if not before[key]:
+                continue
+            change = result[key] / before[key] - 1
+            changes.append(f"{key} {change:+.1%}")
+            if (change if worse_if_higher else -change) > tolerance:
+                regressions.append(f"{name} {key}: {before[key]:.2f} -> {result[key]:.2f}")
+        print(f"{name:<16} " + "   ".join(changes))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenarios to run")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1, help="operations run at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated server latency in seconds")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth PvP request with 429")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="Retry-After seconds of injected 429s")
+    parser.add_argument("--recorded", help="directory of recorded responses to serve (see record_fixtures)")
+    parser.add_argument("--details", type=int, default=10, help="match details downloaded per history crawl")
+    parser.add_argument("--names", type=int, default=500, help="players per bulk name lookup")
+    parser.add_argument("--budget", dest="rate_limits", type=parse_budget, default=UNLIMITED,
+                        help="RATE,BURST budget of each PvP host, or 'default' for the client's budgets; "
+                             "unlimited otherwise (the rate_limited scenario always uses its own)")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare with results saved by --save; exits 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="relative change reported as a regression")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    results = {}
+    with MockRiotServer(latency=args.latency, throttle_every=args.throttle_every, retry_after=args.retry_after,
+                        recorded=args.recorded) as server, tempfile.TemporaryDirectory() as workdir:
+        print(f"{args.iterations} iterations, concurrency {args.concurrency}, "
+              f"{args.latency * 1000:.1f} ms simulated latency, "
+              + (f"429 on every {args.throttle_every}th PvP request" if args.throttle_every else "no 429s")
+              + (f", recorded responses for {len(server.recorded)} routes" if args.recorded else ""))
+        print(f"{'scenario':<16} {'req/op':>8} {'p50 ms':>10} {'p99 ms':>10} {'ops/s':>9} {'req/s':>8} {'429s':>6}")
+        for name in names:
+            operation = SCENARIOS[name](server, args, workdir)
+            results[name] = run_scenario(server, operation, args.iterations, args.concurrency)
+            print(format_row(name, results[name]))
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"settings": vars(args), "results": results}, file, indent=2)
+    problem = check_rate_limited(results["rate_limited"]) if "rate_limited" in results else None
+    if problem:
+        print(f"FAILED: {problem}")
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file)["results"], args.tolerance)
+        if regressions:
+            print(f"REGRESSED: {len(regressions)}")
+            for regression in regressions:
+                print(f"  {regression}")
+            raise SystemExit(1)
+    if problem:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
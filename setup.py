@@ -11,12 +11,18 @@ setup(
     author_email="keanu.code@proton.me",
     description=DESCRIPTION,
     long_description=LONG_DESCRIPTION,
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[
         'requests',
         'pythonping',
         'urllib3'
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'analytics': ['numpy', 'pyarrow'],
+        'fast-json': ['orjson'],
+        'events': ['websocket-client'],
+    },
     keywords=[
         'valorant', 'api', 'valorant-api', 'valorant-client', 
         'insta-lock', 'valorant-python', 'stats', 'riot', 'riot-games'
@@ -0,0 +1,233 @@
+import os
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see `pip install valapiclient[analytics]`
+    np = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:  # optional dependency, see `pip install valapiclient[analytics]`
+    pyarrow = None
+
+# Column name -> NumPy dtype for every table built by flatten_matches
+SCHEMAS = {
+    "players": {
+        "match_id": "U36", "puuid": "U36", "team_id": "U36", "character_id": "U36", "competitive_tier": "i2",
+        "account_level": "i4", "score": "i4", "rounds_played": "i2", "kills": "i2", "deaths": "i2",
+        "assists": "i2", "playtime_millis": "i8", "won": "?",
+    },
+    "rounds": {
+        "match_id": "U36", "round_num": "i2", "winning_team": "U36", "result_code": "U16",
+        "plant_round_time": "i4", "defuse_round_time": "i4",
+    },
+    "kills": {
+        "match_id": "U36", "round_num": "i2", "game_time": "i8", "round_time": "i4", "killer": "U36",
+        "victim": "U36", "damage_type": "U16", "damage_item": "U36", "is_secondary_fire": "?",
+    },
+    "damage": {
+        "match_id": "U36", "round_num": "i2", "attacker": "U36", "receiver": "U36", "damage": "i4",
+        "headshots": "i2", "bodyshots": "i2", "legshots": "i2",
+    },
+}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("valapiclient.analytics requires numpy. Install it with `pip install valapiclient[analytics]`.")
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ImportError("Arrow output requires pyarrow. Install it with `pip install valapiclient[analytics]`.")
+
+
+class Table:
+    """
+    A set of equal-length NumPy columns.
+
+    Args:
+        columns (dict): Column name -> NumPy array.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __repr__(self):
+        return f"Table({len(self)} rows, columns={list(self.columns)})"
+
+    def filter(self, mask):
+        """Return the rows where the boolean array `mask` is True."""
+        return Table({name: column[mask] for name, column in self.columns.items()})
+
+    def to_arrow(self):
+        _require_pyarrow()
+        return pyarrow.table({name: pyarrow.array(column) for name, column in self.columns.items()})
+
+
+class MatchTables:
+    """The per-player, per-round, per-kill and per-damage tables of one or many matches."""
+
+    __slots__ = ("players", "rounds", "kills", "damage")
+
+    def __init__(self, players, rounds, kills, damage):
+        self.players = players
+        self.rounds = rounds
+        self.kills = kills
+        self.damage = damage
+
+    def tables(self):
+        return {"players": self.players, "rounds": self.rounds, "kills": self.kills, "damage": self.damage}
+
+    def __repr__(self):
+        sizes = ", ".join(f"{name}={len(table)}" for name, table in self.tables().items())
+        return f"MatchTables({sizes})"
+
+    def write_parquet(self, directory, compression="zstd"):
+        """Write `<directory>/<table>.parquet` for every table. Returns the paths written."""
+        _require_pyarrow()
+        return self._write(directory, "parquet",
+                           lambda table, target: pyarrow.parquet.write_table(table, target, compression=compression))
+
+    def write_feather(self, directory, compression="lz4"):
+        """Write `<directory>/<table>.feather` (Arrow IPC) for every table. Returns the paths written."""
+        _require_pyarrow()
+        return self._write(directory, "feather",
+                           lambda table, target: pyarrow.feather.write_feather(table, target, compression=compression))
+
+    def _write(self, directory, extension, write):
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name, table in self.tables().items():
+            target = os.path.join(directory, f"{name}.{extension}")
+            write(table.to_arrow(), target)
+            paths.append(target)
+        return paths
+
+
+def _columns(name, rows):
+    """Build a Table from a list of row tuples ordered like SCHEMAS[name]."""
+    schema = SCHEMAS[name]
+    columns = zip(*rows) if rows else [()] * len(schema)
+    return Table({column: np.array(values, dtype=dtype) for (column, dtype), values in zip(schema.items(), columns)})
+
+
+def flatten_matches(matches):
+    """
+    Flatten match-details responses into columnar tables.
+
+    Kills and damage are read from `roundResults[].playerStats[]`, so each event
+    appears once. None entries (failed lookups) are skipped.
+
+    Args:
+        matches (iterable): Match-details dicts, e.g. from `pvp.get_match_details`.
+
+    Returns:
+        MatchTables: Tables with the columns listed in SCHEMAS.
+    """
+    _require_numpy()
+    players, rounds, kills, damage = [], [], [], []
+
+    for match in matches:
+        if not match:
+            continue
+        match_id = match.get("matchInfo", {}).get("matchId", "")
+        won = {team.get("teamId"): bool(team.get("won")) for team in match.get("teams") or []}
+
+        for player in match.get("players") or []:
+            stats = player.get("stats") or {}
+            players.append((
+                match_id, player.get("subject", ""), player.get("teamId", ""), player.get("characterId", ""),
+                player.get("competitiveTier", 0), player.get("accountLevel", 0), stats.get("score", 0),
+                stats.get("roundsPlayed", 0), stats.get("kills", 0), stats.get("deaths", 0),
+                stats.get("assists", 0), stats.get("playtimeMillis", 0), won.get(player.get("teamId"), False),
+            ))
+
+        for round_result in match.get("roundResults") or []:
+            round_num = round_result.get("roundNum", 0)
+            rounds.append((
+                match_id, round_num, round_result.get("winningTeam", ""), round_result.get("roundResultCode", ""),
+                round_result.get("plantRoundTime") or 0, round_result.get("defuseRoundTime") or 0,
+            ))
+            for player_stats in round_result.get("playerStats") or []:
+                attacker = player_stats.get("subject", "")
+                for kill in player_stats.get("kills") or []:
+                    finishing = kill.get("finishingDamage") or {}
+                    kills.append((
+                        match_id, round_num, kill.get("gameTime", 0), kill.get("roundTime", 0),
+                        kill.get("killer", attacker), kill.get("victim", ""), finishing.get("damageType", ""),
+                        finishing.get("damageItem", ""), bool(finishing.get("isSecondaryFireMode")),
+                    ))
+                for event in player_stats.get("damage") or []:
+                    damage.append((
+                        match_id, round_num, attacker, event.get("receiver", ""), event.get("damage", 0),
+                        event.get("headshots", 0), event.get("bodyshots", 0), event.get("legshots", 0),
+                    ))
+
+    return MatchTables(_columns("players", players), _columns("rounds", rounds),
+                       _columns("kills", kills), _columns("damage", damage))
+
+
+def _group_sum(inverse, size, values):
+    return np.bincount(inverse, weights=values, minlength=size)
+
+
+def _ratio(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), np.nan)
+
+
+def player_summary(tables):
+    """
+    Per-player totals and rates over every match in `tables`.
+
+    Returns:
+        Table: Columns puuid, matches, wins, rounds, kills, deaths, assists,
+        acs (average combat score per round), kd, headshot_pct (share of hits
+        that were headshots) and damage_per_round. Rates are NaN when undefined.
+    """
+    _require_numpy()
+    players = tables.players
+    puuids, inverse = np.unique(players["puuid"], return_inverse=True)
+    size = len(puuids)
+
+    def total(column):
+        return _group_sum(inverse, size, players[column])
+
+    rounds = total("rounds_played")
+    kills = total("kills")
+    deaths = total("deaths")
+
+    # Hit and damage totals come from the damage table, grouped by the same PUUIDs
+    damage = tables.damage
+    hits = np.zeros((4, size))
+    if len(damage) and size:
+        attacker = np.searchsorted(puuids, damage["attacker"])
+        known = (attacker < size) & (puuids[np.minimum(attacker, size - 1)] == damage["attacker"])
+        attacker = attacker[known]
+        for row, column in enumerate(("headshots", "bodyshots", "legshots", "damage")):
+            hits[row] = _group_sum(attacker, size, damage[column][known])
+
+    return Table({
+        "puuid": puuids,
+        "matches": np.bincount(inverse, minlength=size),
+        "wins": _group_sum(inverse, size, players["won"]).astype("i4"),
+        "rounds": rounds.astype("i4"),
+        "kills": kills.astype("i4"),
+        "deaths": deaths.astype("i4"),
+        "assists": total("assists").astype("i4"),
+        "acs": _ratio(total("score"), rounds),
+        "kd": _ratio(kills, deaths),
+        "headshot_pct": _ratio(hits[0] * 100, hits[0] + hits[1] + hits[2]),
+        "damage_per_round": _ratio(hits[3], rounds),
+    })
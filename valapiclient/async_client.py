@@ -0,0 +1,294 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import timedelta
+
+import requests
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, see `pip install valapiclient[async]`
+    aiohttp = None
+
+from .instrumentation import body, log_request
+from .local_api import ValClient, create_tls_context
+from .rate_limit import backoff_delay, parse_retry_after
+from .endpoints.async_endpoints import (
+    AsyncCoreGameEndpoints,
+    AsyncLocalEndpoints,
+    AsyncPartyEndpoints,
+    AsyncPreGameEndpoints,
+    AsyncPvPEndpoints,
+    AsyncSessionsEndpoints,
+    AsyncStoreEndpoints,
+)
+
+logger = logging.getLogger(__name__)
+
+# aiohttp 3.10+ raises ConnectionTimeoutError for connect timeouts; older versions can't tell them from read timeouts
+_CONNECT_TIMEOUT = getattr(aiohttp, "ConnectionTimeoutError", ())
+
+
+def _client_timeout(timeout):
+    """An aiohttp.ClientTimeout for a requests-style timeout: seconds, (connect, read) or None."""
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+def _connection_trace(stats):
+    """An aiohttp.TraceConfig that counts requests and new connections per host in `stats` (a ConnectionStats)."""
+    async def on_request_start(session, context, params):
+        context.host = params.url.host
+        stats.record_request(context.host)
+
+    async def on_connection_create_end(session, context, params):
+        stats.record_created(context.host)
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(on_request_start)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    return trace
+
+
+def _to_response(raw, content):
+    """Wrap an aiohttp response in a requests.Response so endpoint code handles both clients alike."""
+    response = Response()
+    response.status_code = raw.status
+    response.reason = raw.reason
+    response.headers = CaseInsensitiveDict(raw.headers)
+    response.url = str(raw.url)
+    response.encoding = raw.charset
+    response._content = content
+    return response
+
+
+class AsyncValClient:
+    """
+    Asyncio twin of ValClient.
+
+    URLs, headers, tokens and the player identity come from the wrapped ValClient,
+    so both clients build requests the same way. At most `max_concurrency`
+    requests are in flight at once, which lets a single event loop fan out
+    thousands of calls with `asyncio.gather`.
+
+    Requests use the timeouts of the wrapped client's ConnectionManager and are
+    counted, with the connections they open, in its `connections.stats`.
+    """
+
+    def __init__(self, client, max_concurrency=64):
+        if aiohttp is None:
+            raise ImportError("AsyncValClient requires aiohttp. Install it with `pip install valapiclient[async]`.")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._session = None
+
+        # Initialize endpoint classes
+        self.coregame = AsyncCoreGameEndpoints(self)
+        self.local = AsyncLocalEndpoints(self)
+        self.party = AsyncPartyEndpoints(self)
+        self.pregame = AsyncPreGameEndpoints(self)
+        self.pvp = AsyncPvPEndpoints(self)
+        self.sessions = AsyncSessionsEndpoints(self)
+        self.store = AsyncStoreEndpoints(self)
+
+    @classmethod
+    async def init_from_lockFile(cls, max_concurrency=64, **kwargs):
+        # Resolve version, tokens and region up front so no lookup blocks the event loop later
+        kwargs.setdefault("eager", True)
+        client = await asyncio.to_thread(ValClient.init_from_lockFile, **kwargs)
+        return cls(client, max_concurrency=max_concurrency)
+
+    async def __aenter__(self):
+        await self.warm_up()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _ssl_context(self):
+        """Mirror the sync session's `verify` setting (True, False or a CA bundle path)."""
+        verify = self.client.session.verify
+        if verify is False:
+            return False
+        ctx = create_tls_context()
+        if isinstance(verify, str):
+            ctx.load_verify_locations(verify)
+        return ctx
+
+    def _get_session(self):
+        if self._session is None:
+            connections = self.client.connections
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, ssl=self._ssl_context())
+            self._session = aiohttp.ClientSession(connector=connector, timeout=_client_timeout(connections.timeout),
+                                                  trace_configs=[_connection_trace(connections.stats)])
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def warm_up(self):
+        """
+        Resolve the wrapped client's version, tokens and region off the event loop.
+
+        Endpoints build PvP URLs synchronously from the region, so it must be known before
+        the first call; `async with` and init_from_lockFile do this already.
+        """
+        if not self.client.is_ready():
+            await asyncio.to_thread(self.client.warm_up)
+
+    def _check_region(self):
+        if self.client._region is None:
+            logger.warning("Region not resolved yet; looking it up on the event loop. "
+                           "Use `async with` or await warm_up() before the first request.")
+
+    def get_glz_url(self):
+        self._check_region()
+        return self.client.get_glz_url()
+
+    def get_shared_url(self):
+        self._check_region()
+        return self.client.get_shared_url()
+
+    def get_pd_url(self):
+        self._check_region()
+        return self.client.get_pd_url()
+
+    async def _call_client(self, func, *args):
+        """Call a sync ValClient helper, off the event loop only when it may hit the network."""
+        if self.client.is_ready():
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    async def get_auth_headers(self):
+        if self.client.is_ready():
+            return self.client.auth_headers
+        # Resolves whichever of version, tokens and region are missing, off the event loop
+        return await asyncio.to_thread(self.client.warm_up)
+
+    async def get_current_player_puuid(self):
+        return await self._call_client(self.client.get_current_player_puuid)
+
+    async def _send(self, method, url, header=None, json_data=None, ssl=None, timeout=None):
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Invalid method {method}")
+
+        session = self._get_session()
+        kwargs = {"headers": header}
+        if method != "GET":
+            kwargs["json"] = json_data
+        if ssl is not None:
+            kwargs["ssl"] = ssl
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        async with self._semaphore:
+            try:
+                start = time.perf_counter()
+                async with session.request(method, url, **kwargs) as raw:
+                    response = _to_response(raw, await raw.read())
+                response.elapsed = timedelta(seconds=time.perf_counter() - start)
+                log_request(method, url, response)
+                return response
+            except _CONNECT_TIMEOUT as e:
+                raise requests.exceptions.ConnectTimeout(f"{method} {url} timed out connecting") from e
+            except aiohttp.ServerTimeoutError as e:
+                # Also a ClientConnectionError, but the request may have reached the server
+                raise requests.exceptions.ReadTimeout(f"{method} {url} timed out") from e
+            except aiohttp.ClientConnectionError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            except asyncio.TimeoutError as e:
+                raise requests.exceptions.ReadTimeout(f"{method} {url} timed out") from e
+
+    async def _acquire(self, url):
+        """Wait for a slot in the rate limiter shared with the sync client."""
+        wait = self.client.rate_limiter.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def handle_local_request(self, suffix, method="GET", json_data=None):
+        url = self.client.base_url + suffix
+        start = time.perf_counter()
+        try:
+            response = await self._send(method, url, self.client.local_header, json_data, ssl=False,
+                                        timeout=_client_timeout(self.client.connections.local_timeout))
+        except requests.exceptions.RequestException as e:
+            logger.warning("Error during local request to %s: %s", url, e)
+            response = None
+        self._record(method, url, response, start, json_data)
+        return response
+
+    def _record(self, method, url, response, start, json_data, attempts=1):
+        """Record a call in the wrapped client's metrics; aiohttp serializes bodies itself, so size them here."""
+        metrics = self.client.metrics
+        if metrics is None:
+            return
+        bytes_out = len(json.dumps(json_data)) if json_data is not None and method != "GET" else 0
+        metrics.record(method, url, response, time.perf_counter() - start, attempts, bytes_out)
+
+    async def handle_pvp_request(self, suffix, prefix=None, header=None, method="GET", json_data=None, retries=3):
+        if header is None:
+            header = await self.get_auth_headers()
+
+        if prefix and not prefix.startswith('https://'):
+            prefix = f"https://{prefix}"
+
+        url = f'{prefix}/{suffix}' if prefix else f'https://{self.client.pvp_base_url}/{suffix}'
+
+        token_refreshed = False
+        # One metrics entry per call, as in ValClient.handle_pvp_request
+        start = time.perf_counter()
+        attempts = 0
+        response = None
+
+        try:
+            for attempt in range(retries):
+                try:
+                    await self._acquire(url)
+                    attempts += 1
+                    response = await self._send(method, url, header, json_data)
+
+                    # An expired or revoked token gets exactly one forced refresh and retry
+                    if response.status_code == 401 and not token_refreshed:
+                        token_refreshed = True
+                        header = await asyncio.to_thread(self.client._refresh_auth_header, header)
+                        await self._acquire(url)
+                        attempts += 1
+                        response = await self._send(method, url, header, json_data)
+
+                    # Rate limited: hold back every caller of this host, then retry
+                    if response.status_code == 429 and attempt < retries - 1:
+                        delay = parse_retry_after(response.headers.get('Retry-After'))
+                        if delay is None:
+                            delay = backoff_delay(attempt)
+                        logger.info("Rate limited by %s, retrying in %.2fs", url, delay)
+                        self.client.rate_limiter.penalize(url, delay)
+                        continue
+
+                    if response.status_code >= 400:
+                        logger.log(logging.INFO if response.status_code == 404 else logging.WARNING,
+                                   "Request to %s failed with status code %s: %s", url, response.status_code, body(response))
+                    return response
+
+                except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as e:
+                    # As in ValClient.handle_pvp_request, a read timeout is only retried for GETs
+                    if isinstance(e, requests.exceptions.ReadTimeout) and method != "GET":
+                        raise
+                    logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
+                    if attempt < retries - 1:
+                        await asyncio.sleep(backoff_delay(attempt, base=1.0))
+                        continue
+                    else:
+                        raise
+        except BaseException:
+            response = None
+            raise
+        finally:
+            self._record(method, url, response, start, json_data, attempts)
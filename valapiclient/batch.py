@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class BatchResult:
+    """Outcome of one item in a batch: the input key and either a value or the error it raised."""
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(self, key, value=None, error=None):
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(key={self.key!r}, {status})"
+
+
+def _call(func, key):
+    try:
+        return BatchResult(key, value=func(key))
+    except Exception as e:
+        return BatchResult(key, error=e)
+
+
+def _stream(func, keys, max_workers):
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_call, func, key) for key in keys]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(func, keys, max_workers=8, stream=False):
+    """
+    Call `func(key)` for every key on a bounded thread pool.
+
+    A failing item doesn't abort the batch; its exception is stored on its BatchResult.
+
+    Args:
+        func (callable): Fetches one item. Exceptions it raises are captured per item.
+        keys (iterable): The inputs, e.g. match IDs or PUUIDs.
+        max_workers (int): Maximum number of concurrent calls.
+        stream (bool): Yield results as they complete instead of returning them in input order.
+
+    Returns:
+        list[BatchResult] in input order, or an iterator of BatchResult in completion order if `stream` is True.
+    """
+    keys = list(keys)
+    max_workers = max(1, min(max_workers, len(keys) or 1))
+    if stream:
+        return _stream(func, keys, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda key: _call(func, key), keys))
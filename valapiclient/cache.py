@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from os import path
+
+MISSING = object()
+
+
+def default_cache_dir():
+    """Per-user cache directory: %LOCALAPPDATA%\\valapiclient on Windows, ~/.cache/valapiclient elsewhere."""
+    base = os.environ.get("LOCALAPPDATA") or path.join(path.expanduser("~"), ".cache")
+    return path.join(base, "valapiclient")
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire `ttl` seconds after being stored.
+
+    Args:
+        maxsize (int): Maximum number of entries; the least recently used is evicted first.
+        ttl (float): Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            item = self._data.get(key, MISSING)
+            if item is MISSING:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, MISSING)
+            return default if item is MISSING else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,140 @@
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# (connect, read) timeouts in seconds for the PvP, auth and version hosts
+DEFAULT_TIMEOUT = (5, 15)
+# The local client answers fast or not at all
+DEFAULT_LOCAL_TIMEOUT = (2, 10)
+# Kept-alive connections per host; enough for a 10-player lobby snapshot (22 concurrent calls) on one host
+DEFAULT_POOL_MAXSIZE = 32
+# Hosts with a pool: pd, glz, shared, auth, the version API and the local client
+DEFAULT_POOL_CONNECTIONS = 8
+
+
+class ConnectionStats:
+    """
+    Per-host counts of requests sent and connections opened, shared by a ConnectionManager's sessions.
+
+    A request that didn't open a connection reused a kept-alive one, so `reused` is
+    requests - created; every created connection paid for a TCP (and TLS) handshake.
+    """
+
+    def __init__(self):
+        self._created = defaultdict(int)
+        self._requests = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record_created(self, host):
+        with self._lock:
+            self._created[host] += 1
+
+    def record_request(self, host):
+        with self._lock:
+            self._requests[host] += 1
+
+    def reset(self):
+        with self._lock:
+            self._created.clear()
+            self._requests.clear()
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: host -> {"requests", "created", "reused"}, plus a "total" entry.
+        """
+        with self._lock:
+            hosts = set(self._created) | set(self._requests)
+            counts = {host: (self._requests[host], self._created[host]) for host in hosts}
+        result = {}
+        for host, (sent, created) in counts.items():
+            result[host] = {"requests": sent, "created": created, "reused": max(0, sent - created)}
+        result["total"] = {key: sum(entry[key] for entry in result.values()) for key in ("requests", "created", "reused")}
+        return result
+
+
+def _counting_pool(base, stats):
+    """Subclass of a urllib3 pool class that reports every new connection to `stats`."""
+    def _new_conn(self):
+        stats.record_created(self.host)
+        return base._new_conn(self)
+    return type(f"Counting{base.__name__}", (base,), {"_new_conn": _new_conn})
+
+
+class PooledAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTPAdapter with sized keep-alive pools that counts requests and new connections.
+
+    Args:
+        stats (ConnectionStats): Counters to update.
+        pool_connections (int): Hosts to keep a pool for.
+        pool_maxsize (int): Connections kept alive per host. More concurrent requests
+            still go through, but their extra connections are closed afterwards.
+        ssl_context (ssl.SSLContext): Context for HTTPS connections, or None for urllib3's default.
+    """
+
+    def __init__(self, stats, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 ssl_context=None):
+        self.stats = stats
+        self.ssl_context = ssl_context
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, *args, **kwargs):
+        self.stats.record_request(urlsplit(request.url).hostname)
+        return super().send(request, *args, **kwargs)
+
+
+class ConnectionManager:
+    """
+    The HTTP sessions of a ValClient: one for the PvP, auth and version hosts and one for the local API.
+
+    Both keep connections alive between calls and mount a PooledAdapter, so
+    concurrent callers (batches, lobby snapshots, the name resolver) reuse up to
+    `pool_maxsize` connections per host instead of opening new ones, and every
+    new connection is counted in `stats`.
+
+    Args:
+        pool_maxsize (int): Connections kept alive per host.
+        pool_connections (int): Hosts to keep a pool for, per session.
+        timeout: Timeout for remote requests, seconds or (connect, read).
+        local_timeout: Timeout for local API requests.
+        ssl_context (ssl.SSLContext): Context for the remote hosts, e.g. with forced ciphers.
+    """
+
+    def __init__(self, pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 timeout=DEFAULT_TIMEOUT, local_timeout=DEFAULT_LOCAL_TIMEOUT, ssl_context=None):
+        self.pool_maxsize = pool_maxsize
+        self.pool_connections = pool_connections
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+        self.stats = ConnectionStats()
+
+        self.session = self._new_session(ssl_context)
+        # The local API's certificate is self-signed; requests to it pass verify=False themselves,
+        # since REQUESTS_CA_BUNDLE in the environment would override a session-level setting
+        self.local_session = self._new_session(None)
+        self.local_session.verify = False
+
+    def _new_session(self, ssl_context):
+        session = requests.Session()
+        adapter = PooledAdapter(self.stats, self.pool_connections, self.pool_maxsize, ssl_context)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """Close every kept-alive connection; the sessions reconnect on their next request."""
+        self.session.close()
+        self.local_session.close()
@@ -0,0 +1,111 @@
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from os import path
+
+from .cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+class ContentCache:
+    """
+    On-disk cache for the client version lookup and the content-service payload.
+
+    Both only change when a patch ships. The version is revalidated at most every
+    `revalidate_after` seconds (conditionally, with ETag / Last-Modified when the
+    server provided them) and content is keyed by `riotClientVersion`, so a client
+    whose cache is current starts and looks up content without touching the network.
+    The last known version also lets a client start offline.
+
+    Args:
+        directory (str): Cache directory. Defaults to default_cache_dir().
+        revalidate_after (float): Seconds before the cached version is checked again.
+        keep_versions (int): Content payloads of older versions beyond this count are deleted.
+    """
+
+    def __init__(self, directory=None, revalidate_after=3600, keep_versions=3):
+        self.directory = directory or default_cache_dir()
+        self.revalidate_after = revalidate_after
+        self.keep_versions = keep_versions
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return path.join(self.directory, f"{name}.json")
+
+    def load(self, name):
+        """
+        Return the cached entry {"data", "etag", "last_modified", "checked_at"}, or None.
+        """
+        try:
+            with open(self._path(name), "r", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, name, data, headers=None):
+        """Store `data` with the validators from the response `headers`. Write failures are ignored."""
+        headers = headers or {}
+        entry = {
+            "data": data,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        }
+        self._write(name, entry)
+        return entry
+
+    def touch(self, name, entry):
+        """Record that `entry` was revalidated (e.g. after a 304)."""
+        entry["checked_at"] = time.time()
+        self._write(name, entry)
+
+    def _write(self, name, entry):
+        target = self._path(name)
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp = f"{target}.{os.getpid()}.tmp"
+                with open(temp, "w", encoding="utf-8") as cache_file:
+                    json.dump(entry, cache_file, separators=(",", ":"))
+                os.replace(temp, target)
+            except OSError as e:
+                logger.warning("Could not write cache file %s: %s", target, e)
+
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry.get("checked_at", 0) < self.revalidate_after
+
+    @staticmethod
+    def conditional_headers(entry):
+        """If-None-Match / If-Modified-Since headers for revalidating `entry`."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def content_name(client_version):
+        return f"content-{client_version}"
+
+    def latest_content(self):
+        """The most recently written content entry of any version, used to revalidate after a patch."""
+        files = glob.glob(path.join(self.directory, "content-*.json"))
+        if not files:
+            return None
+        newest = max(files, key=path.getmtime)
+        return self.load(path.splitext(path.basename(newest))[0])
+
+    def prune_content(self):
+        """Delete content payloads of all but the `keep_versions` most recent versions."""
+        files = sorted(glob.glob(path.join(self.directory, "content-*.json")), key=path.getmtime, reverse=True)
+        for stale in files[self.keep_versions:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
@@ -1,3 +1,12 @@
+from .async_endpoints import (
+    AsyncCoreGameEndpoints,
+    AsyncLocalEndpoints,
+    AsyncPartyEndpoints,
+    AsyncPreGameEndpoints,
+    AsyncPvPEndpoints,
+    AsyncSessionsEndpoints,
+    AsyncStoreEndpoints,
+)
 from .coregame import CoreGameEndpoints
 from .local import LocalEndpoints
 from .party import PartyEndpoints
@@ -7,6 +16,13 @@ from .sessions import SessionsEndpoints
 from .store import StoreEndpoints
 
 __all__ = [
+    "AsyncCoreGameEndpoints",
+    "AsyncLocalEndpoints",
+    "AsyncPartyEndpoints",
+    "AsyncPreGameEndpoints",
+    "AsyncPvPEndpoints",
+    "AsyncSessionsEndpoints",
+    "AsyncStoreEndpoints",
     "CoreGameEndpoints",
     "LocalEndpoints",
     "PartyEndpoints",
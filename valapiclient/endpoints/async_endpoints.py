@@ -0,0 +1,419 @@
+"""
+Async twins of the endpoint classes, used by AsyncValClient.
+
+Each method mirrors its sync counterpart and awaits the request instead of
+blocking on it. Request paths, routes and response parsing come from the
+module-level helpers of the sync endpoint modules, so both clients build and
+read requests the same way; header construction is left to
+AsyncValClient.handle_pvp_request.
+"""
+import asyncio
+import logging
+from typing import Optional, Dict, List, Union
+
+import requests
+
+from ..content_cache import ContentCache
+from ..json_decoder import decode_ok, decode_response
+from . import coregame, local, party, pregame, pvp, sessions, store
+
+logger = logging.getLogger(__name__)
+
+
+def _ok(response):
+    return response.status_code == 200 if response is not None else False
+
+
+class AsyncCoreGameEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    def build_glz_url(self, endpoint):
+        return f"{self.api.get_glz_url()}/{endpoint}"
+
+    async def get_current_match_id(self):
+        """Fetch the current match ID for the logged-in player."""
+        puuid = await self.api.get_current_player_puuid()
+        data = decode_ok(await self.api.handle_pvp_request(coregame.player_path(puuid), prefix=self.build_glz_url("")))
+        return data.get("MatchID") if data else None
+
+    async def get_current_match_info(self, match_id):
+        """Fetch detailed information for a specific match."""
+        if not match_id:
+            logger.warning("Invalid match ID.")
+            return None
+
+        return decode_ok(await self.api.handle_pvp_request(coregame.match_path(match_id), prefix=self.build_glz_url("")))
+
+    async def get_current_match_loadout(self, match_id):
+        """Fetch loadout information for a specific match."""
+        if not match_id:
+            logger.warning("Invalid match ID.")
+            return None
+
+        return decode_ok(await self.api.handle_pvp_request(
+            coregame.match_path(match_id, "loadouts"),
+            prefix=self.build_glz_url("")
+        ))
+
+    async def leave_current_match(self):
+        """Leave the current match."""
+        puuid = await self.api.get_current_player_puuid()
+        match_id = await self.get_current_match_id()
+        if not match_id:
+            logger.info("No active match found.")
+            return False
+
+        response = await self.api.handle_pvp_request(
+            coregame.disassociate_path(puuid, match_id),
+            prefix=self.build_glz_url(""),
+            method="POST"
+        )
+        return _ok(response)
+
+
+class AsyncLocalEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    async def _get(self, suffix):
+        return decode_ok(await self.api.handle_local_request(suffix))
+
+    async def get_friends(self):
+        return await self._get("chat/v4/friends")
+
+    async def get_friend_requests(self):
+        return await self._get("chat/v4/friend_requests")
+
+    async def add_friend(self, game_name, tag_line):
+        data = {'game_name': game_name, 'game_tag': tag_line}
+        return _ok(await self.api.handle_local_request("chat/v4/friends", method="POST", json_data=data))
+
+    async def remove_friend(self, puuid):
+        data = {"puuid": puuid}
+        return _ok(await self.api.handle_local_request("chat/v4/friends", method="DELETE", json_data=data))
+
+    async def get_messages(self):
+        return await self._get("chat/v5/messages")
+
+    async def send_message(self, message, cid):
+        data = {"message": message, "cid": cid}
+        return _ok(await self.api.handle_local_request("chat/v5/messages", method="POST", json_data=data))
+
+    async def get_auth_info(self):
+        return local.auth_tokens(await self._get("entitlements/v1/token"))
+
+    async def get_player_settings(self):
+        return await self._get("player-preferences/v1/data-json/Ares.PlayerSettings")
+
+    async def get_presence(self):
+        response_json = await self._get("chat/v4/presences")
+        return response_json.get("presences", []) if response_json is not None else None
+
+    async def get_session(self):
+        return await self._get("session/v1/sessions")
+
+    async def get_region(self):
+        return local.region_from_sessions(await self._get("product-session/v1/external-sessions"))
+
+    async def get_voice_settings(self):
+        return await self._get("voice-chat/v1/settings")
+
+    async def update_voice_settings(self, settings):
+        return _ok(await self.api.handle_local_request("voice-chat/v1/settings", method="PUT", json_data=settings))
+
+    async def get_voice_token(self):
+        return await self._get("voice-chat/v1/token")
+
+    async def get_voice_state(self):
+        return await self._get("voice-chat/v1/state")
+
+    async def get_voice_participants(self):
+        return await self._get("voice-chat/v1/participants")
+
+    async def get_voice_devices(self):
+        return await self._get("voice-chat/v1/devices")
+
+    async def get_voice_connections(self):
+        return await self._get("voice-chat/v1/connections")
+
+
+class AsyncPartyEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    def build_glz_url(self, endpoint):
+        return f"{self.api.get_glz_url()}/{endpoint}"
+
+    async def get_current_party_id(self):
+        puuid = await self.api.get_current_player_puuid()
+        data = decode_ok(await self.api.handle_pvp_request(
+            party.player_path(puuid),
+            prefix=self.build_glz_url("")
+        ))
+        return data.get("CurrentPartyID") if data else None
+
+    async def get_current_party(self):
+        party_id = await self.get_current_party_id()
+        if not party_id:
+            return None
+
+        return decode_ok(await self.api.handle_pvp_request(party.party_path(party_id), prefix=self.build_glz_url("")))
+
+    async def _party_post(self, suffix, json_data=None, method="POST"):
+        """POST (or `method`) to parties/v1/parties/{party_id}/{suffix} for the current party."""
+        party_id = await self.get_current_party_id()
+        if not party_id:
+            return False
+
+        response = await self.api.handle_pvp_request(
+            party.party_path(party_id, suffix),
+            prefix=self.build_glz_url(""),
+            method=method,
+            json_data=json_data
+        )
+        return _ok(response)
+
+    async def kick_player_from_party(self, puuid):
+        return await self._party_post(f"members/{puuid}", method="DELETE")
+
+    async def set_player_ready(self, state=True):
+        puuid = await self.api.get_current_player_puuid()
+        return await self._party_post(f"members/{puuid}/setReady", json_data={"ready": state})
+
+    async def refresh_competitive_tier(self):
+        puuid = await self.api.get_current_player_puuid()
+        return await self._party_post(f"members/{puuid}/refreshCompetitiveTier")
+
+    async def refresh_player_identity(self):
+        puuid = await self.api.get_current_player_puuid()
+        return await self._party_post(f"members/{puuid}/refreshPlayerIdentity")
+
+    async def refresh_party_ping(self):
+        puuid = await self.api.get_current_player_puuid()
+        return await self._party_post(f"members/{puuid}/refreshPings")
+
+    async def join_queue(self):
+        return await self._party_post("matchmaking/join")
+
+    async def leave_queue(self):
+        return await self._party_post("matchmaking/leave")
+
+    async def set_party_accessibility(self, accessibility=True):
+        return await self._party_post("accessibility", json_data={"accessibility": party.ACCESSIBILITY[accessibility]})
+
+    async def invite_player(self, game_name, tag_line):
+        return await self._party_post(f"invites/name/{game_name}/tag/{tag_line}")
+
+    async def request_to_join_party(self, party_id):
+        response = await self.api.handle_pvp_request(
+            party.party_path(party_id, "request"),
+            prefix=self.build_glz_url(""),
+            method="POST"
+        )
+        return _ok(response)
+
+    async def decline_party_request(self, request_id):
+        return await self._party_post(f"request/{request_id}/decline")
+
+
+class AsyncPreGameEndpoints:
+    def __init__(self, api):
+        self.api = api
+        self._match_id = None
+
+    def build_glz_url(self, endpoint):
+        return f"{self.api.get_glz_url()}/{endpoint}"
+
+    async def get_current_pregame(self, puuid):
+        return decode_ok(await self.api.handle_pvp_request(pregame.player_path(puuid), prefix=self.build_glz_url("")))
+
+    async def get_current_pregame_id(self):
+        pregame_data = await self.get_current_pregame(await self.api.get_current_player_puuid())
+        return pregame_data.get("MatchID") if pregame_data else None
+
+    def clear_session(self):
+        """Forget the cached pregame MatchID."""
+        self._match_id = None
+
+    async def _match_action(self, action):
+        """POST pregame/v1/matches/{match_id}/{action}, re-resolving the cached MatchID once if it is stale."""
+        for refresh in (False, True):
+            if self._match_id is None or refresh:
+                self._match_id = await self.get_current_pregame_id()
+            if not self._match_id:
+                logger.info("No active pregame match found.")
+                return None
+
+            response = await self.api.handle_pvp_request(
+                pregame.match_path(self._match_id, action),
+                prefix=self.build_glz_url(""),
+                method="POST"
+            )
+            if response.status_code != 404:
+                break
+        return response
+
+    async def select_pregame_agent(self, agent_id):
+        response = await self._match_action(f"select/{agent_id}")
+        return decode_response(response) if response is not None else None
+
+    async def lock_pregame_agent(self, agent_id):
+        response = await self._match_action(f"lock/{agent_id}")
+        return decode_response(response) if response is not None else None
+
+    async def dodge_pregame_match(self):
+        response = await self._match_action("quit")
+        if response is not None and response.status_code == 200:
+            self.clear_session()
+        return decode_response(response) if response is not None else None
+
+
+class AsyncPvPEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    def _validate_puuid(self, puuid: str) -> bool:
+        if not puuid or not isinstance(puuid, str):
+            logger.warning("Invalid PUUID.")
+            return False
+        return True
+
+    async def _get_json(self, suffix, prefix, error_message, method="GET", json_data=None):
+        try:
+            return pvp.decode_or_raise(
+                await self.api.handle_pvp_request(suffix, prefix=prefix, method=method, json_data=json_data))
+        except requests.exceptions.RequestException as e:
+            logger.warning("%s: %s", error_message, e)
+            return None
+
+    async def get_content(self) -> Optional[Dict]:
+        client = self.api.client
+        # The content cache reads and writes whole payloads, so it runs off the event loop
+        data, name, cached = await asyncio.to_thread(pvp.cached_content, client)
+        if data is not None:
+            return data
+
+        try:
+            if not await self.api.get_auth_headers():
+                return None
+            header = client.request_headers(ContentCache.conditional_headers(cached))
+            suffix, prefix = pvp.content_route(self.api)
+            response = await self.api.handle_pvp_request(suffix, prefix=prefix, header=header)
+            return await asyncio.to_thread(pvp.content_from_response, client, response, name, cached)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Error fetching content: %s", e)
+            return None
+
+    async def get_account_xp(self, puuid: str) -> Optional[Dict]:
+        if not self._validate_puuid(puuid):
+            return None
+        return await self._get_json(*pvp.account_xp_route(self.api, puuid), "Error fetching account XP")
+
+    async def get_player_mmr(self, puuid: str) -> Optional[Dict]:
+        if not self._validate_puuid(puuid):
+            return None
+        return await self._get_json(*pvp.player_mmr_route(self.api, puuid), "Error fetching player MMR")
+
+    async def get_match_history(self, puuid: str, start_index: int = 0, end_index: int = 20,
+                                queue: Optional[str] = None) -> Optional[Dict]:
+        if not self._validate_puuid(puuid):
+            return None
+        return await self._get_json(*pvp.match_history_route(self.api, puuid, start_index, end_index, queue),
+                                    "Error fetching match history")
+
+    async def get_current_game(self, puuid: str) -> Optional[Dict]:
+        if not self._validate_puuid(puuid):
+            return None
+        return await self._get_json(*pvp.current_game_route(self.api, puuid), "Error fetching current game")
+
+    async def get_leaderboard(self, season_id: str, start_index: int = 0, end_index: int = 20) -> Optional[Dict]:
+        if not season_id or not isinstance(season_id, str):
+            logger.warning("Invalid season ID.")
+            return None
+        return await self._get_json(*pvp.leaderboard_route(self.api, season_id, start_index, end_index),
+                                    "Error fetching leaderboard")
+
+    async def get_competitive_updates(self, puuid: str, start_index: int = 0, end_index: int = 10,
+                                      queue: Optional[str] = None) -> Optional[Dict]:
+        if not self._validate_puuid(puuid):
+            return None
+        return await self._get_json(*pvp.competitive_updates_route(self.api, puuid, start_index, end_index, queue),
+                                    "Error fetching competitive updates")
+
+    async def get_player_name(self, puuids: Union[str, List[str]]) -> Optional[List[Dict]]:
+        if isinstance(puuids, str):
+            puuids = [puuids]
+
+        if not puuids or not isinstance(puuids, list) or not all(isinstance(p, str) for p in puuids):
+            logger.warning("Invalid PUUID(s).")
+            return None
+
+        suffix, prefix = pvp.player_names_route(self.api)
+        names = []
+        for batch in pvp.name_batches(puuids):
+            batch_names = await self._get_json(suffix, prefix, "Error fetching player names",
+                                               method="PUT", json_data=batch)
+            if batch_names is None:
+                return None
+            names.extend(batch_names)
+        return names
+
+    async def get_match_details(self, match_id: str) -> Optional[Dict]:
+        if not match_id or not isinstance(match_id, str):
+            logger.warning("Invalid Match ID.")
+            return None
+        # Store lookups hit SQLite and zlib, so they run off the event loop
+        match_store = self.api.client.match_store
+        if match_store is not None:
+            match_details = await asyncio.to_thread(match_store.get, match_id)
+            if match_details is not None:
+                return match_details
+
+        match_details = await self._get_json(*pvp.match_details_route(self.api, match_id),
+                                             f"Error fetching match details for match ID {match_id}")
+        if match_store is not None and match_details and pvp.is_storable_match(match_details):
+            await asyncio.to_thread(match_store.put, match_id, match_details)
+        return match_details
+
+
+class AsyncSessionsEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    async def get_session(self, puuid):
+        response = await self.api.handle_pvp_request(sessions.session_path(puuid), prefix=self.api.get_glz_url())
+        if response and response.status_code == 200:
+            return decode_response(response)
+        logger.warning("Failed to get session: %s", response.status_code if response else 'No response')
+        return None
+
+
+class AsyncStoreEndpoints:
+    def __init__(self, api):
+        self.api = api
+
+    async def _get(self, suffix, error_message):
+        response = await self.api.handle_pvp_request(suffix, prefix=self.api.get_pd_url())
+        if response and response.status_code == 200:
+            return decode_response(response)
+        logger.warning("%s: %s", error_message, response.status_code if response else 'No response')
+        return None
+
+    async def get_store_offers(self):
+        return await self._get(store.OFFERS_PATH, "Failed to get store offers")
+
+    async def get_storefront(self, puuid: str):
+        return await self._get(store.storefront_path(puuid), "Failed to get storefront")
+
+    async def get_wallet(self, puuid: str):
+        return await self._get(store.wallet_path(puuid), "Failed to get wallet")
+
+    async def get_order(self, orderID: str):
+        return await self._get(store.order_path(orderID), "Failed to get order")
+
+    async def get_store_entitlements(self, puuid: str, itemType: str):
+        if itemType not in store.ITEM_TYPES:
+            logger.warning("Invalid item type: %s", itemType)
+            return None
+        return await self._get(store.entitlements_path(puuid, itemType), "Failed to get store entitlements")
@@ -1,18 +1,37 @@
+import logging
+
+from ..game_state import INGAME
+from ..json_decoder import decode_ok
+from ..lobby import LobbySnapshot, build_snapshot, timed
+
+logger = logging.getLogger(__name__)
+
+
+# Request paths on the glz host, shared with AsyncCoreGameEndpoints
+def player_path(puuid):
+    return f"core-game/v1/players/{puuid}"
+
+
+def match_path(match_id, resource=None):
+    return f"core-game/v1/matches/{match_id}/{resource}" if resource else f"core-game/v1/matches/{match_id}"
+
+
+def disassociate_path(puuid, match_id):
+    return f"core-game/v1/players/{puuid}/disassociate/{match_id}"
+
+
 class CoreGameEndpoints:
     def __init__(self, api):
         self.api = api
 
     def build_glz_url(self, endpoint):
-        return f"https://glz-{self.api.region}-1.{self.api.region}.a.pvp.net/{endpoint}"
+        return f"{self.api.get_glz_url()}/{endpoint}"
 
     def get_current_match_id(self):
         """Fetch the current match ID for the logged-in player."""
         puuid = self.api.get_current_player_puuid()
-        response = self.api.handle_pvp_request(
-            f"core-game/v1/players/{puuid}",
-            prefix=self.build_glz_url("")
-        )
-        return response.json().get("MatchID") if response and response.status_code == 200 else None
+        data = decode_ok(self.api.handle_pvp_request(player_path(puuid), prefix=self.build_glz_url("")))
+        return data.get("MatchID") if data else None
 
     def get_current_match_info(self, match_id):
         """Fetch detailed information for a specific match.
@@ -24,14 +43,10 @@ class CoreGameEndpoints:
             dict: JSON response containing match details.
         """
         if not match_id:
-            print("Invalid match ID.")
+            logger.warning("Invalid match ID.")
             return None
 
-        response = self.api.handle_pvp_request(
-            f"core-game/v1/matches/{match_id}",
-            prefix=self.build_glz_url("")
-        )
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_pvp_request(match_path(match_id), prefix=self.build_glz_url("")))
 
     def get_current_match_loadout(self, match_id):
         """Fetch loadout information for a specific match.
@@ -43,26 +58,58 @@ class CoreGameEndpoints:
             dict: JSON response containing loadout details.
         """
         if not match_id:
-            print("Invalid match ID.")
+            logger.warning("Invalid match ID.")
             return None
 
-        response = self.api.handle_pvp_request(
-            f"core-game/v1/matches/{match_id}/loadouts",
-            prefix=self.build_glz_url("")
-        )
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_pvp_request(match_path(match_id, "loadouts"), prefix=self.build_glz_url("")))
 
     def leave_current_match(self):
         """Leave the current match."""
         puuid = self.api.get_current_player_puuid()
         match_id = self.get_current_match_id()
         if not match_id:
-            print("No active match found.")
+            logger.info("No active match found.")
             return False
 
         response = self.api.handle_pvp_request(
-            f"core-game/v1/players/{puuid}/disassociate/{match_id}",
+            disassociate_path(puuid, match_id),
             prefix=self.build_glz_url(""),
             method="POST"
         )
         return response.status_code == 200 if response else False
+
+    def _fetch_match(self, match_id):
+        return self.api.pvp.fetch_json(match_path(match_id), self.build_glz_url(""))
+
+    def _fetch_loadouts(self, match_id):
+        return self.api.pvp.fetch_json(match_path(match_id, "loadouts"), self.build_glz_url(""))
+
+    def get_lobby_snapshot(self, match_id=None, max_workers=16):
+        """
+        Fetch the current match with every player's name, MMR and account XP.
+
+        The match is fetched first; then the loadouts, one name-service request for all
+        players and each player's MMR and account XP run concurrently, so the snapshot
+        takes about two round trips instead of 20+ sequential ones.
+
+        Args:
+            match_id (str): The match. Defaults to the game-state tracker's match when it
+                is in a match, or else a core-game player lookup. A tracked match that
+                glz no longer knows (404) is replaced by a core-game player lookup.
+            max_workers (int): Maximum concurrent requests.
+
+        Returns:
+            LobbySnapshot: With per-call timings; `match` is None if the player isn't in a match.
+        """
+        snapshot = LobbySnapshot()
+        resolve_match_id = None
+        if not match_id:
+            tracker = self.api.game_state
+            match_id = tracker.match_id if tracker.state == INGAME else None
+            # The tracker may not have seen the match end yet
+            resolve_match_id = self.get_current_match_id if match_id else None
+        if not match_id:
+            match_id = timed(snapshot, "match_id", self.get_current_match_id)
+        return build_snapshot(self.api, match_id, self._fetch_match, self._fetch_loadouts,
+                              lambda match: match.get("Players"), max_workers=max_workers, snapshot=snapshot,
+                              resolve_match_id=resolve_match_id)
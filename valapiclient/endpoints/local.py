@@ -1,3 +1,23 @@
+from ..json_decoder import decode_ok
+
+
+# Parsing shared with AsyncLocalEndpoints
+def auth_tokens(data):
+    """[access_token, entitlements_token] from an entitlements/v1/token body, or None."""
+    return [data["accessToken"], data["token"]] if data else None
+
+
+def region_from_sessions(data):
+    """The -ares-deployment region in a product-session/v1/external-sessions body, or None."""
+    for key, region_info in (data or {}).items():
+        if key != 'host_app':
+            arguments = region_info.get("launchConfiguration", {}).get("arguments", [])
+            for arg in arguments:
+                if arg.startswith("-ares-deployment="):
+                    return arg.split('=')[1]
+    return None
+
+
 class LocalEndpoints:
     def __init__(self, api):
         self.api = api
@@ -9,8 +29,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of friends.
         """
-        response = self.api.handle_local_request("chat/v4/friends")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("chat/v4/friends"))
 
     def get_friend_requests(self):
         """
@@ -19,8 +38,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of friend requests.
         """
-        response = self.api.handle_local_request("chat/v4/friend_requests")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("chat/v4/friend_requests"))
 
     def add_friend(self, game_name, tag_line):
         """
@@ -58,8 +76,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of messages.
         """
-        response = self.api.handle_local_request("chat/v5/messages")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("chat/v5/messages"))
 
     def send_message(self, message, cid):
         """
@@ -83,11 +100,7 @@ class LocalEndpoints:
         Returns:
             list: [access_token, entitlements_token] if successful, None otherwise.
         """
-        response = self.api.handle_local_request("entitlements/v1/token")
-        if response and response.status_code == 200:
-            response_json = response.json()
-            return [response_json["accessToken"], response_json["token"]]
-        return None
+        return auth_tokens(decode_ok(self.api.handle_local_request("entitlements/v1/token")))
 
     def get_player_settings(self):
         """
@@ -96,8 +109,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the player's settings.
         """
-        response = self.api.handle_local_request("player-preferences/v1/data-json/Ares.PlayerSettings")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("player-preferences/v1/data-json/Ares.PlayerSettings"))
 
     def get_presence(self):
         """
@@ -106,8 +118,8 @@ class LocalEndpoints:
         Returns:
             list: JSON response containing the player's presence data.
         """
-        response = self.api.handle_local_request("chat/v4/presences")
-        return response.json().get("presences", []) if response and response.status_code == 200 else None
+        data = decode_ok(self.api.handle_local_request("chat/v4/presences"))
+        return data.get("presences", []) if data is not None else None
 
     def get_session(self):
         """
@@ -116,8 +128,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the session information.
         """
-        response = self.api.handle_local_request("session/v1/sessions")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("session/v1/sessions"))
 
     def get_region(self):
         """
@@ -126,16 +137,7 @@ class LocalEndpoints:
         Returns:
             str: The player's region if successful, None otherwise.
         """
-        response = self.api.handle_local_request("product-session/v1/external-sessions")
-        if response and response.status_code == 200:
-            response_json = response.json()
-            for key, region_info in response_json.items():
-                if key != 'host_app':
-                    arguments = region_info.get("launchConfiguration", {}).get("arguments", [])
-                    for arg in arguments:
-                        if arg.startswith("-ares-deployment="):
-                            return arg.split('=')[1]
-        return None
+        return region_from_sessions(decode_ok(self.api.handle_local_request("product-session/v1/external-sessions")))
 
     def get_voice_settings(self):
         """
@@ -144,8 +146,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the voice settings.
         """
-        response = self.api.handle_local_request("voice-chat/v1/settings")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/settings"))
 
     def update_voice_settings(self, settings):
         """
@@ -167,8 +168,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the voice token.
         """
-        response = self.api.handle_local_request("voice-chat/v1/token")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/token"))
 
     def get_voice_state(self):
         """
@@ -177,8 +177,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the voice state.
         """
-        response = self.api.handle_local_request("voice-chat/v1/state")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/state"))
 
     def get_voice_participants(self):
         """
@@ -187,8 +186,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of participants.
         """
-        response = self.api.handle_local_request("voice-chat/v1/participants")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/participants"))
 
     def get_voice_devices(self):
         """
@@ -197,8 +195,7 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of voice devices.
         """
-        response = self.api.handle_local_request("voice-chat/v1/devices")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/devices"))
 
     def get_voice_connections(self):
         """
@@ -207,5 +204,4 @@ class LocalEndpoints:
         Returns:
             dict: JSON response containing the list of voice connections.
         """
-        response = self.api.handle_local_request("voice-chat/v1/connections")
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_local_request("voice-chat/v1/connections"))
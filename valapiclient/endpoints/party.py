@@ -1,9 +1,23 @@
+from ..json_decoder import decode_ok
+
+ACCESSIBILITY = {True: "OPEN", False: "CLOSED"}
+
+
+# Request paths on the glz host, shared with AsyncPartyEndpoints
+def player_path(puuid):
+    return f"parties/v1/players/{puuid}"
+
+
+def party_path(party_id, resource=None):
+    return f"parties/v1/parties/{party_id}/{resource}" if resource else f"parties/v1/parties/{party_id}"
+
+
 class PartyEndpoints:
     def __init__(self, api):
         self.api = api
 
     def build_glz_url(self, endpoint):
-        return f"https://glz-{self.api.region}-1.{self.api.region}.a.pvp.net/{endpoint}"
+        return f"{self.api.get_glz_url()}/{endpoint}"
 
     def get_current_party_id(self):
         """
@@ -12,11 +26,11 @@ class PartyEndpoints:
         Returns:
             str: The current party ID if successful, None otherwise.
         """
-        response = self.api.handle_pvp_request(
-            f"parties/v1/players/{self.api.get_current_player_puuid()}",
+        data = decode_ok(self.api.handle_pvp_request(
+            player_path(self.api.get_current_player_puuid()),
             prefix=self.build_glz_url("")
-        )
-        return response.json().get("CurrentPartyID") if response and response.status_code == 200 else None
+        ))
+        return data.get("CurrentPartyID") if data else None
 
     def get_current_party(self):
         """
@@ -29,11 +43,7 @@ class PartyEndpoints:
         if not party_id:
             return None
 
-        response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}",
-            prefix=self.build_glz_url("")
-        )
-        return response.json() if response and response.status_code == 200 else None
+        return decode_ok(self.api.handle_pvp_request(party_path(party_id), prefix=self.build_glz_url("")))
 
     def kick_player_from_party(self, puuid):
         """
@@ -50,7 +60,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/members/{puuid}",
+            party_path(party_id, f"members/{puuid}"),
             prefix=self.build_glz_url(""),
             method="DELETE"
         )
@@ -72,7 +82,7 @@ class PartyEndpoints:
 
         data = {"ready": state}
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/members/{self.api.get_current_player_puuid()}/setReady",
+            party_path(party_id, f"members/{self.api.get_current_player_puuid()}/setReady"),
             prefix=self.build_glz_url(""),
             method="POST",
             json_data=data
@@ -91,7 +101,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/members/{self.api.get_current_player_puuid()}/refreshCompetitiveTier",
+            party_path(party_id, f"members/{self.api.get_current_player_puuid()}/refreshCompetitiveTier"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -109,7 +119,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/members/{self.api.get_current_player_puuid()}/refreshPlayerIdentity",
+            party_path(party_id, f"members/{self.api.get_current_player_puuid()}/refreshPlayerIdentity"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -127,7 +137,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/members/{self.api.get_current_player_puuid()}/refreshPings",
+            party_path(party_id, f"members/{self.api.get_current_player_puuid()}/refreshPings"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -145,7 +155,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/matchmaking/join",
+            party_path(party_id, "matchmaking/join"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -163,7 +173,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/matchmaking/leave",
+            party_path(party_id, "matchmaking/leave"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -183,10 +193,9 @@ class PartyEndpoints:
         if not party_id:
             return False
 
-        accessibility_dict = {True: "OPEN", False: "CLOSED"}
-        data = {"accessibility": accessibility_dict[accessibility]}
+        data = {"accessibility": ACCESSIBILITY[accessibility]}
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/accessibility",
+            party_path(party_id, "accessibility"),
             prefix=self.build_glz_url(""),
             method="POST",
             json_data=data
@@ -209,7 +218,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/invites/name/{game_name}/tag/{tag_line}",
+            party_path(party_id, f"invites/name/{game_name}/tag/{tag_line}"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -226,7 +235,7 @@ class PartyEndpoints:
             bool: True if the request was sent successfully, False otherwise.
         """
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/request",
+            party_path(party_id, "request"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
@@ -247,7 +256,7 @@ class PartyEndpoints:
             return False
 
         response = self.api.handle_pvp_request(
-            f"parties/v1/parties/{party_id}/request/{request_id}/decline",
+            party_path(party_id, f"request/{request_id}/decline"),
             prefix=self.build_glz_url(""),
             method="POST"
         )
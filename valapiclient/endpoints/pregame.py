@@ -1,9 +1,66 @@
+import logging
+import threading
+
+import requests
+
+from ..instrumentation import body
+from ..json_decoder import decode_response
+from ..lobby import LobbySnapshot, build_snapshot, timed
+
+logger = logging.getLogger(__name__)
+
+
+# Request paths on the glz host, shared with AsyncPreGameEndpoints
+def player_path(puuid):
+    return f"pregame/v1/players/{puuid}"
+
+
+def match_path(match_id, resource=None):
+    return f"pregame/v1/matches/{match_id}/{resource}" if resource else f"pregame/v1/matches/{match_id}"
+
+
+class PreGameSession:
+    """
+    A pregame match whose MatchID has already been resolved.
+
+    Every action is a single request against the cached match, which keeps agent
+    select to one round trip per call.
+    """
+
+    def __init__(self, endpoints, match_id):
+        self.endpoints = endpoints
+        self.api = endpoints.api
+        self.match_id = match_id
+
+    def _post(self, action):
+        return self.api.handle_pvp_request(
+            match_path(self.match_id, action),
+            prefix=self.endpoints.build_glz_url(""),
+            method="POST"
+        )
+
+    def select(self, agent_id):
+        """Select (hover) an agent. Returns the raw response."""
+        return self._post(f"select/{agent_id}")
+
+    def lock(self, agent_id):
+        """Lock in an agent. Returns the raw response."""
+        return self._post(f"lock/{agent_id}")
+
+    def dodge(self):
+        """Quit the pregame match. Returns the raw response."""
+        return self._post("quit")
+
+
 class PreGameEndpoints:
     def __init__(self, api):
         self.api = api
+        self._session = None
+        # Guards _session, so concurrent callers resolve the MatchID once
+        self._session_lock = threading.Lock()
 
     def build_glz_url(self, endpoint):
-        return f"https://glz-{self.api.region}-1.{self.api.region}.a.pvp.net/{endpoint}"
+        return f"{self.api.get_glz_url()}/{endpoint}"
 
     def get_current_pregame(self, puuid):
         """
@@ -17,16 +74,17 @@ class PreGameEndpoints:
         """
         try:
             response = self.api.handle_pvp_request(
-                f"pregame/v1/players/{puuid}",
+                player_path(puuid),
                 prefix=self.build_glz_url("")
             )
             if response and response.status_code == 200:
-                return response.json()
+                return decode_response(response)
             else:
-                print(f"Failed to fetch pregame data: {response.status_code} - {response.text}")
+                logger.log(logging.INFO if response.status_code == 404 else logging.WARNING,
+                           "Failed to fetch pregame data: %s - %s", response.status_code, body(response))
                 return None
         except Exception as e:
-            print(f"An error occurred: {e}")
+            logger.warning("An error occurred: %s", e)
             return None
 
     def get_current_pregame_id(self):
@@ -34,6 +92,66 @@ class PreGameEndpoints:
         pregame_data = self.get_current_pregame(self.api.get_current_player_puuid())
         return pregame_data.get("MatchID") if pregame_data else None
 
+    def get_session(self, refresh=False):
+        """
+        Return the session for the current pregame, resolving its MatchID only once.
+
+        Args:
+            refresh (bool): Resolve the MatchID again even if one is cached.
+
+        Returns:
+            PreGameSession: The current pregame session, or None if not in pregame.
+        """
+        with self._session_lock:
+            if self._session is None or refresh:
+                match_id = self.get_current_pregame_id()
+                self._session = PreGameSession(self, match_id) if match_id else None
+            return self._session
+
+    def clear_session(self):
+        """Forget the cached pregame MatchID."""
+        with self._session_lock:
+            self._session = None
+
+    def prewarm(self):
+        """
+        Prepare for agent select before it begins.
+
+        Refreshes the cached tokens and opens the TLS connection to the glz host,
+        so the first select/lock doesn't pay for the handshake. Any HTTP response
+        to the HEAD request counts as warmed up; it isn't rate limited, retried or
+        recorded in `api.metrics`. If agent select has already begun, its MatchID
+        is resolved and cached as well.
+
+        Returns:
+            bool: True if the connection to the glz host was opened, False otherwise.
+        """
+        self.api.get_current_player_puuid()
+        try:
+            self.api._send_pvp_request(f"{self.api.get_glz_url()}/", self.api.auth_headers, "HEAD", None)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Failed to pre-warm glz connection: %s", e)
+            return False
+        if self._session is None:
+            self.get_session()
+        return True
+
+    def _session_action(self, action, *args):
+        """Run a PreGameSession action, re-resolving the MatchID once if the cached one is stale."""
+        session = self.get_session()
+        if not session:
+            logger.info("No active pregame match found.")
+            return None
+
+        response = getattr(session, action)(*args)
+        if response is not None and response.status_code == 404:
+            session = self.get_session(refresh=True)
+            if not session:
+                logger.info("No active pregame match found.")
+                return None
+            response = getattr(session, action)(*args)
+        return response
+
     def select_pregame_agent(self, agent_id):
         """
         Select (hover) an agent in the pregame lobby.
@@ -44,47 +162,64 @@ class PreGameEndpoints:
         Returns:
             dict: JSON response from the API.
         """
-        match_id = self.get_current_pregame_id()
-        if not match_id:
-            print("No active pregame match found.")
-            return None
-
-        return self.api.handle_pvp_request(
-            f"pregame/v1/matches/{match_id}/select/{agent_id}",
-            prefix=self.build_glz_url(""),
-            method="POST"
-        ).json()
+        response = self._session_action("select", agent_id)
+        return decode_response(response) if response is not None else None
 
     def lock_pregame_agent(self, agent_id):
         """
         Lock in an agent in the pregame lobby.
 
+        The pregame MatchID is cached after the first lookup, so locking is a
+        single request when the session was resolved (or pre-warmed) beforehand.
+
         Args:
             agent_id (str): The ID of the agent to lock.
 
         Returns:
             dict: JSON response from the API.
         """
-        match_id = self.get_current_pregame_id()
-        if not match_id:
-            print("No active pregame match found.")
-            return None
-
-        return self.api.handle_pvp_request(
-            f"pregame/v1/matches/{match_id}/lock/{agent_id}",
-            prefix=self.build_glz_url(""),
-            method="POST"
-        ).json()
+        response = self._session_action("lock", agent_id)
+        return decode_response(response) if response is not None else None
 
     def dodge_pregame_match(self):
         """Quit the current pregame match."""
-        match_id = self.get_current_pregame_id()
+        response = self._session_action("dodge")
+        if response is not None and response.status_code == 200:
+            self.clear_session()
+        return decode_response(response) if response is not None else None
+
+    def _fetch_match(self, match_id):
+        return self.api.pvp.fetch_json(match_path(match_id), self.build_glz_url(""))
+
+    def _fetch_loadouts(self, match_id):
+        return self.api.pvp.fetch_json(match_path(match_id, "loadouts"), self.build_glz_url(""))
+
+    def get_lobby_snapshot(self, match_id=None, max_workers=16):
+        """
+        Fetch the current pregame match with every visible player's name, MMR and account XP.
+
+        Like `coregame.get_lobby_snapshot`, but for agent select, where only the ally
+        team is visible. The pregame MatchID is taken from the cached session.
+
+        Args:
+            match_id (str): The pregame match. Defaults to the current pregame session's.
+            max_workers (int): Maximum concurrent requests.
+
+        Returns:
+            LobbySnapshot: With per-call timings; `match` is None if the player isn't in pregame.
+        """
+        snapshot = LobbySnapshot()
         if not match_id:
-            print("No active pregame match found.")
-            return None
+            session = timed(snapshot, "match_id", self.get_session)
+            match_id = session.match_id if session else None
+        return build_snapshot(self.api, match_id, self._fetch_match, self._fetch_loadouts, _pregame_players,
+                              max_workers=max_workers, snapshot=snapshot)
 
-        return self.api.handle_pvp_request(
-            f"pregame/v1/matches/{match_id}/quit",
-            prefix=self.build_glz_url(""),
-            method="POST"
-        ).json()
+
+def _pregame_players(match):
+    """Players of both teams (the enemy team is normally hidden), tagged with their team's ID."""
+    players = []
+    for team in (match.get("AllyTeam"), match.get("EnemyTeam")):
+        if team:
+            players.extend(dict(player, TeamID=team.get("TeamID")) for player in team.get("Players") or ())
+    return players
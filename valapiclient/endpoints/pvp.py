@@ -1,40 +1,178 @@
+import logging
 import requests
-from typing import Optional, Dict, List, Union
+from typing import Callable, Optional, Dict, Iterable, Iterator, List, Union
 from urllib.parse import urlencode
 
+from ..batch import BatchResult, run_batch
+from ..content_cache import ContentCache
+from ..json_decoder import decode_response
+from ..pagination import iter_pages
+
+logger = logging.getLogger(__name__)
+
+# Largest PUUID list sent in one name-service request
+NAME_SERVICE_BATCH_SIZE = 100
+# Largest page the match-history and competitiveupdates endpoints return
+HISTORY_PAGE_SIZE = 20
+
+
+# The (suffix, prefix) of each PvP request and the parsing steps shared by PvPEndpoints
+# and AsyncPvPEndpoints, so both build and read requests the same way. `api` is a
+# ValClient or an AsyncValClient.
+
+def account_xp_route(api, puuid: str):
+    return f"account-xp/v1/players/{puuid}", api.get_shared_url()
+
+
+def player_mmr_route(api, puuid: str):
+    return f"mmr/v1/players/{puuid}", api.get_pd_url()
+
+
+def competitive_updates_route(api, puuid: str, start_index: int = 0, end_index: int = 10,
+                              queue: Optional[str] = None):
+    # Construct query parameters dictionary
+    query_params = {
+        "startIndex": start_index,
+        "endIndex": end_index,
+    }
+    if queue:
+        query_params["queue"] = queue
+
+    # Encode query parameters and append to the endpoint path (pd URL as per documentation)
+    return f"mmr/v1/players/{puuid}/competitiveupdates?{urlencode(query_params)}", api.get_pd_url()
+
+
+def match_history_route(api, puuid: str, start_index: int = 0, end_index: int = 20, queue: Optional[str] = None):
+    query_params = {"startIndex": start_index, "endIndex": end_index}
+    if queue:
+        query_params["queue"] = queue
+    return f"match-history/v1/history/{puuid}?{urlencode(query_params)}", api.get_shared_url()
+
+
+def current_game_route(api, puuid: str):
+    return f"current-game/v1/players/{puuid}", api.get_shared_url()
+
+
+def leaderboard_route(api, season_id: str, start_index: int = 0, end_index: int = 20):
+    return f"leaderboards/v2/{season_id}?startIndex={start_index}&endIndex={end_index}", api.get_shared_url()
+
+
+def player_names_route(api):
+    return "name-service/v2/players", api.get_pd_url()
+
+
+def match_details_route(api, match_id: str):
+    # The get_pd_url() method should construct the base URL including the shard
+    return f"match-details/v1/matches/{match_id}", api.get_pd_url()
+
+
+def content_route(api):
+    return "content-service/v3/content", api.get_shared_url()
+
+
+def decode_or_raise(response) -> Dict:
+    """Decode a PvP response, raising RequestException for a status of 400 or above."""
+    response.raise_for_status()
+    return decode_response(response)
+
+
+def name_batches(puuids: List[str]) -> Iterator[List[str]]:
+    """Split a PUUID list into name-service requests of at most NAME_SERVICE_BATCH_SIZE."""
+    for start in range(0, len(puuids), NAME_SERVICE_BATCH_SIZE):
+        yield puuids[start:start + NAME_SERVICE_BATCH_SIZE]
+
+
+def is_storable_match(match_details: Dict) -> bool:
+    """Whether match details belong in the match store: finished matches never change."""
+    return match_details.get("matchInfo", {}).get("isCompleted", True)
+
+
+def cached_content(client):
+    """
+    Look up the content of the client's version in its content cache.
+
+    Args:
+        client (ValClient): The sync client, which owns the cache and the client version.
+
+    Returns:
+        tuple: (data, name, cached). `data` is the payload when this version's content is
+        cached; otherwise None, with the cache name to save the payload under and the
+        newest cached entry to revalidate with its ETag. All None without a cache.
+    """
+    cache = client.content_cache
+    if not cache:
+        return None, None, None
+    name = cache.content_name(client.client_version["riotClientVersion"])
+    cached = cache.load(name)
+    if cached:
+        return cached["data"], name, cached
+    return None, name, cache.latest_content()
+
+
+def content_from_response(client, response, name, cached) -> Dict:
+    """
+    The payload of a content-service response, saved in the client's content cache.
+
+    A 304 re-keys the `cached` entry under the new version. Raises RequestException
+    for any other status of 400 or above.
+    """
+    if response.status_code == 304 and cached:
+        # Unchanged since the previous version: re-key the payload under the new one
+        data = cached["data"]
+        validators = {"ETag": cached.get("etag"), "Last-Modified": cached.get("last_modified")}
+    else:
+        data = decode_or_raise(response)
+        validators = response.headers
+    if client.content_cache:
+        client.content_cache.save(name, data, validators)
+        client.content_cache.prune_content()
+    return data
+
+
 class PvPEndpoints:
     def __init__(self, api):
         self.api = api
 
     def _get_auth_header(self) -> Optional[Dict[str, str]]:
-        """Helper function to fetch authentication headers."""
-        auth_info = self.api.get_auth_info()
-        if not auth_info:
-            print("Authentication info not available.")
-            return None
-        header = self.api.base_pvp_header.copy()
-        header["X-Riot-Entitlements-JWT"] = auth_info[1]
-        return header
+        """Helper function to fetch authentication headers (cached until the tokens are refreshed)."""
+        return self.api.auth_headers
 
     def _validate_puuid(self, puuid: str) -> bool:
         """Helper function to validate a PUUID."""
         if not puuid or not isinstance(puuid, str):
-            print("Invalid PUUID.")
+            logger.warning("Invalid PUUID.")
             return False
         return True
 
+    def fetch_json(self, suffix: str, prefix: str) -> Dict:
+        """GET a PvP resource and decode it. Raises RequestException on failure."""
+        return decode_or_raise(self.api.handle_pvp_request(suffix, prefix=prefix, header=self._get_auth_header()))
+
+    def _require_id(self, value: str, name: str = "PUUID") -> str:
+        """Helper function that raises instead of printing, for use inside batches."""
+        if not value or not isinstance(value, str):
+            raise ValueError(f"Invalid {name}: {value!r}")
+        return value
+
     def get_content(self) -> Optional[Dict]:
-        """Fetches the current content (e.g., maps, agents, etc.) from the Valorant API."""
+        """
+        Fetches the current content (e.g., maps, agents, etc.) from the Valorant API.
+
+        With a content cache on the client, content is stored per client version: a cached
+        version is returned without a request, and after a patch the previous payload is
+        revalidated with its ETag so an unchanged payload isn't downloaded again.
+        """
+        data, name, cached = cached_content(self.api)
+        if data is not None:
+            return data
+
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_shared_url()
-            response = self.api.handle_pvp_request("content-service/v3/content", prefix=prefix, header=header)
-            response.raise_for_status()  # Raise an exception for non-200 status codes
-            return response.json()
+            header = self.api.request_headers(ContentCache.conditional_headers(cached))
+            suffix, prefix = content_route(self.api)
+            response = self.api.handle_pvp_request(suffix, prefix=prefix, header=header)
+            return content_from_response(self.api, response, name, cached)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching content: {e}")
+            logger.warning("Error fetching content: %s", e)
             return None
 
     def get_account_xp(self, puuid: str) -> Optional[Dict]:
@@ -42,15 +180,9 @@ class PvPEndpoints:
         if not self._validate_puuid(puuid):
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_shared_url()
-            response = self.api.handle_pvp_request(f"account-xp/v1/players/{puuid}", prefix=prefix, header=header)
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_account_xp(puuid)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching account XP: {e}")
+            logger.warning("Error fetching account XP: %s", e)
             return None
 
     def get_player_mmr(self, puuid: str) -> Optional[Dict]:
@@ -58,35 +190,20 @@ class PvPEndpoints:
         if not self._validate_puuid(puuid):
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_pd_url()
-            response = self.api.handle_pvp_request(f"mmr/v1/players/{puuid}", prefix=prefix, header=header)
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_player_mmr(puuid)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching player MMR: {e}")
+            logger.warning("Error fetching player MMR: %s", e)
             return None
 
-    def get_match_history(self, puuid: str, start_index: int = 0, end_index: int = 20) -> Optional[Dict]:
-        """Fetches the match history for a given player (PUUID)."""
+    def get_match_history(self, puuid: str, start_index: int = 0, end_index: int = 20,
+                          queue: Optional[str] = None) -> Optional[Dict]:
+        """Fetches the match history for a given player (PUUID), optionally of one queue."""
         if not self._validate_puuid(puuid):
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_shared_url()
-            response = self.api.handle_pvp_request(
-                f"match-history/v1/history/{puuid}?startIndex={start_index}&endIndex={end_index}",
-                prefix=prefix,
-                header=header
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_match_history(puuid, start_index, end_index, queue)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching match history: {e}")
+            logger.warning("Error fetching match history: %s", e)
             return None
 
     def get_current_game(self, puuid: str) -> Optional[Dict]:
@@ -97,33 +214,21 @@ class PvPEndpoints:
             header = self._get_auth_header()
             if not header:
                 return None
-            prefix = self.api.get_shared_url()
-            response = self.api.handle_pvp_request(f"current-game/v1/players/{puuid}", prefix=prefix, header=header)
-            response.raise_for_status()
-            return response.json()
+            suffix, prefix = current_game_route(self.api, puuid)
+            return decode_or_raise(self.api.handle_pvp_request(suffix, prefix=prefix, header=header))
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching current game: {e}")
+            logger.warning("Error fetching current game: %s", e)
             return None
 
     def get_leaderboard(self, season_id: str, start_index: int = 0, end_index: int = 20) -> Optional[Dict]:
         """Fetches the leaderboard for a given season."""
         if not season_id or not isinstance(season_id, str):
-            print("Invalid season ID.")
+            logger.warning("Invalid season ID.")
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_shared_url()
-            response = self.api.handle_pvp_request(
-                f"leaderboards/v2/{season_id}?startIndex={start_index}&endIndex={end_index}",
-                prefix=prefix,
-                header=header
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_leaderboard(season_id, start_index, end_index)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching leaderboard: {e}")
+            logger.warning("Error fetching leaderboard: %s", e)
             return None
 
     def get_competitive_updates(self, puuid: str, start_index: int = 0, end_index: int = 10, queue: Optional[str] = None) -> Optional[Dict]:
@@ -142,38 +247,17 @@ class PvPEndpoints:
         if not self._validate_puuid(puuid):
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            prefix = self.api.get_pd_url() # Use pd URL as per documentation
-
-            # Construct query parameters dictionary
-            query_params = {
-                "startIndex": start_index,
-                "endIndex": end_index,
-            }
-            if queue:
-                query_params["queue"] = queue
-
-            # Encode query parameters and append to the endpoint path
-            query_string = urlencode(query_params)
-            endpoint_with_params = f"mmr/v1/players/{puuid}/competitiveupdates?{query_string}"
-
-            response = self.api.handle_pvp_request(
-                endpoint_with_params, # Pass the full path with query string
-                prefix=prefix,
-                header=header
-                # No 'params' argument here
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_competitive_updates(puuid, start_index, end_index, queue)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching competitive updates: {e}")
+            logger.warning("Error fetching competitive updates: %s", e)
             return None
 
     def get_player_name(self, puuids: Union[str, List[str]]) -> Optional[List[Dict]]:
         """
         Fetches player names and taglines by their PUUIDs.
+
+        Lists longer than NAME_SERVICE_BATCH_SIZE are split over several requests.
+        For repeated lookups, prefer the cached and batched `api.names` resolver.
         
         Args:
             puuids: Single UUID string or list of player UUIDs to look up
@@ -195,32 +279,25 @@ class PvPEndpoints:
             puuids = [puuids]
             
         if not puuids or not isinstance(puuids, list) or not all(isinstance(p, str) for p in puuids):
-            print("Invalid PUUID(s).")
+            logger.warning("Invalid PUUID(s).")
             return None
             
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-                
-            prefix = self.api.get_pd_url()
-            response = self.api.handle_pvp_request(
-                "name-service/v2/players",
-                method="PUT",
-                prefix=prefix,
-                header=header,
-                json_data=puuids
-            )
-            response.raise_for_status()
-            return response.json()
+            names = []
+            for batch in name_batches(puuids):
+                names.extend(self.fetch_player_names(batch))
+            return names
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching player names: {e}")
+            logger.warning("Error fetching player names: %s", e)
             return None
 
     def get_match_details(self, match_id: str) -> Optional[Dict]:
         """
         Fetches the details of a specific match by its ID.
 
+        If the client has a match store, completed matches are served from it
+        without a request.
+
         Args:
             match_id: The ID of the match to fetch details for.
 
@@ -228,21 +305,137 @@ class PvPEndpoints:
             A dictionary containing the match details, or None if an error occurs.
         """
         if not match_id or not isinstance(match_id, str):
-            print("Invalid Match ID.")
+            logger.warning("Invalid Match ID.")
             return None
         try:
-            header = self._get_auth_header()
-            if not header:
-                return None
-            # The get_pd_url() method should construct the base URL including the shard
-            prefix = self.api.get_pd_url() 
-            response = self.api.handle_pvp_request(
-                f"match-details/v1/matches/{match_id}",
-                prefix=prefix,
-                header=header
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.fetch_match_details(match_id)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching match details for match ID {match_id}: {e}")
+            logger.warning("Error fetching match details for match ID %s: %s", match_id, e)
             return None
+
+    """
+    FETCH HELPERS
+
+    The requests behind the get_* methods, without their validation and error
+    handling: they raise RequestException on failure. Batches, paginators and
+    the lobby, name resolver, history sync and leaderboard modules build on them.
+    """
+
+    def fetch_account_xp(self, puuid: str) -> Dict:
+        return self.fetch_json(*account_xp_route(self.api, puuid))
+
+    def fetch_player_mmr(self, puuid: str) -> Dict:
+        return self.fetch_json(*player_mmr_route(self.api, puuid))
+
+    def fetch_competitive_updates(self, puuid: str, start_index: int = 0, end_index: int = 10,
+                                  queue: Optional[str] = None) -> Dict:
+        return self.fetch_json(*competitive_updates_route(self.api, puuid, start_index, end_index, queue))
+
+    def fetch_match_history(self, puuid: str, start_index: int = 0, end_index: int = 20,
+                            queue: Optional[str] = None) -> Dict:
+        return self.fetch_json(*match_history_route(self.api, puuid, start_index, end_index, queue))
+
+    def fetch_leaderboard(self, season_id: str, start_index: int = 0, end_index: int = 20) -> Dict:
+        return self.fetch_json(*leaderboard_route(self.api, season_id, start_index, end_index))
+
+    def fetch_player_names(self, puuids: List[str]) -> List[Dict]:
+        suffix, prefix = player_names_route(self.api)
+        return decode_or_raise(self.api.handle_pvp_request(
+            suffix,
+            method="PUT",
+            prefix=prefix,
+            header=self._get_auth_header(),
+            json_data=puuids
+        ))
+
+    def fetch_match_details(self, match_id: str) -> Dict:
+        # Finished matches never change, so the match store is consulted before the network
+        store = self.api.match_store
+        if store is not None:
+            match_details = store.get(match_id)
+            if match_details is not None:
+                return match_details
+
+        match_details = self.fetch_json(*match_details_route(self.api, match_id))
+        if store is not None and is_storable_match(match_details):
+            store.put(match_id, match_details)
+        return match_details
+
+    """
+    PAGINATION
+
+    Generators that walk a player's full history, requesting the next page in
+    the background while the caller processes the current one. `until` stops
+    iteration before the first matching entry: pass a match ID to stop at the
+    newest match already synced, or any predicate on the entry. Request errors
+    are raised from the generator.
+    """
+
+    def iter_match_history(self, puuid: str, queue: Optional[str] = None,
+                           until: Union[str, Callable[[Dict], bool], None] = None,
+                           page_size: int = HISTORY_PAGE_SIZE, prefetch: bool = True) -> Iterator[Dict]:
+        """Yields the player's match history entries ({"MatchID", "GameStartTime", "QueueID"}), newest first."""
+        self._require_id(puuid)
+        return iter_pages(
+            lambda start, end: self.fetch_match_history(puuid, start, end, queue),
+            "History", page_size=page_size, total_key="Total", until=_match_id_predicate(until), prefetch=prefetch
+        )
+
+    def iter_competitive_updates(self, puuid: str, queue: Optional[str] = None,
+                                 until: Union[str, Callable[[Dict], bool], None] = None,
+                                 page_size: int = HISTORY_PAGE_SIZE, prefetch: bool = True) -> Iterator[Dict]:
+        """Yields the player's competitive updates (one dict per match), newest first."""
+        self._require_id(puuid)
+        return iter_pages(
+            lambda start, end: self.fetch_competitive_updates(puuid, start, end, queue),
+            "Matches", page_size=page_size, until=_match_id_predicate(until), prefetch=prefetch
+        )
+
+    """
+    BATCH REQUESTS
+
+    Each method runs its lookups on a bounded thread pool sharing ValClient.session.
+    A failed item doesn't abort the batch: it comes back as a BatchResult whose
+    `error` holds the exception. Results are returned in input order, or yielded
+    as they complete when `stream=True`.
+    """
+
+    def get_many_match_details(self, match_ids: Iterable[str], max_workers: int = 8,
+                               stream: bool = False) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """Fetches the details of many matches concurrently."""
+        return run_batch(
+            lambda match_id: self.fetch_match_details(self._require_id(match_id, "Match ID")),
+            match_ids, max_workers=max_workers, stream=stream
+        )
+
+    def get_many_mmr(self, puuids: Iterable[str], max_workers: int = 8,
+                     stream: bool = False) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """Fetches the MMR of many players concurrently."""
+        return run_batch(
+            lambda puuid: self.fetch_player_mmr(self._require_id(puuid)),
+            puuids, max_workers=max_workers, stream=stream
+        )
+
+    def get_many_account_xp(self, puuids: Iterable[str], max_workers: int = 8,
+                            stream: bool = False) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """Fetches the account XP of many players concurrently."""
+        return run_batch(
+            lambda puuid: self.fetch_account_xp(self._require_id(puuid)),
+            puuids, max_workers=max_workers, stream=stream
+        )
+
+    def get_many_competitive_updates(self, puuids: Iterable[str], start_index: int = 0, end_index: int = 10,
+                                     queue: Optional[str] = None, max_workers: int = 8,
+                                     stream: bool = False) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """Fetches the competitive updates of many players concurrently."""
+        return run_batch(
+            lambda puuid: self.fetch_competitive_updates(self._require_id(puuid), start_index, end_index, queue),
+            puuids, max_workers=max_workers, stream=stream
+        )
+
+
+def _match_id_predicate(until):
+    """Turn a match ID into a predicate on history entries; predicates and None pass through."""
+    if until is None or callable(until):
+        return until
+    return lambda entry: entry.get("MatchID") == until
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import logging
+import ssl
+import threading
+from collections import defaultdict
+
+try:
+    import websocket
+except ImportError:  # optional dependency, see `pip install valapiclient[events]`
+    websocket = None
+
+from .rate_limit import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# WAMP message types used by the Riot client's local WebSocket
+SUBSCRIBE = 5
+UNSUBSCRIBE = 6
+EVENT = 8
+
+# Prefix of every JSON API event; subscribing to it alone receives all of them
+ALL_EVENTS = "OnJsonApiEvent"
+
+# Shorthands accepted by EventStream.subscribe()
+EVENT_NAMES = {
+    "presences": "OnJsonApiEvent_chat_v4_presences",
+    "friends": "OnJsonApiEvent_chat_v4_friends",
+    "chat": "OnJsonApiEvent_chat_v6_messages",
+    "conversations": "OnJsonApiEvent_chat_v6_conversations",
+    "messaging": "OnJsonApiEvent_riot-messaging-service_v1_message",
+    "all": ALL_EVENTS,
+}
+
+# (URI prefix, kind) pairs; the first match names an event's kind
+_KINDS = (
+    ("/chat/v4/presences", "presences"),
+    ("/chat/v4/friends", "friends"),
+    ("/chat/v6/messages", "chat"),
+    ("/chat/v5/messages", "chat"),
+    ("/chat/v6/conversations", "conversations"),
+    ("/riot-messaging-service/v1/message/ares-parties", "party"),
+    ("/riot-messaging-service/v1/message/ares-pregame", "pregame"),
+    ("/riot-messaging-service/v1/message/ares-core-game", "coregame"),
+    ("/riot-messaging-service/v1/message", "messaging"),
+)
+
+
+def event_name(uri):
+    """WAMP event name of a local API URI, e.g. '/chat/v4/presences' -> 'OnJsonApiEvent_chat_v4_presences'."""
+    return f"{ALL_EVENTS}_{uri.strip('/').replace('/', '_')}"
+
+
+class Event:
+    """
+    One event from the local WebSocket.
+
+    Attributes:
+        name (str): WAMP event name it was delivered under.
+        kind (str): 'presences', 'friends', 'chat', 'conversations', 'party', 'pregame',
+            'coregame', 'messaging' or 'other', derived from the URI.
+        uri (str): Local API resource that changed.
+        event_type (str): 'Create', 'Update' or 'Delete'.
+        data: The resource's new JSON.
+    """
+
+    __slots__ = ("name", "kind", "uri", "event_type", "data")
+
+    def __init__(self, name, uri, event_type, data):
+        self.name = name
+        self.uri = uri
+        self.event_type = event_type
+        self.data = data
+        self.kind = next((kind for prefix, kind in _KINDS if uri.startswith(prefix)), "other")
+
+    @classmethod
+    def from_message(cls, message):
+        """Parse a raw `[8, name, payload]` message, or return None for any other message."""
+        if not isinstance(message, list) or len(message) < 3 or message[0] != EVENT:
+            return None
+        payload = message[2] or {}
+        return cls(message[1], payload.get("uri", ""), payload.get("eventType"), payload.get("data"))
+
+    def __repr__(self):
+        return f"Event(kind={self.kind!r}, event_type={self.event_type!r}, uri={self.uri!r})"
+
+
+class EventStream:
+    """
+    Subscription events from the Riot client's local WebSocket (`api.events`).
+
+    The socket is on the same host, port and password as the local API. Events are
+    read on a background thread and dispatched to callbacks registered with `on()`
+    and to every `async for event in api.events` consumer. Dropped connections are
+    re-established with backoff and the subscriptions are sent again.
+
+    Args:
+        api (ValClient): Client whose local API credentials are used.
+        url (str): Socket URL. Defaults to the local API's host and port.
+        reconnect (bool): Reconnect after the connection drops.
+        max_backoff (float): Cap on the delay between reconnect attempts, in seconds.
+    """
+
+    def __init__(self, api, url=None, reconnect=True, max_backoff=30):
+        self.api = api
+        self.url = url or api.base_url.replace("https://", "wss://", 1)
+        self.reconnect = reconnect
+        self.max_backoff = max_backoff
+        self.connected = threading.Event()
+        self.connections = 0
+        self._subscriptions = set()
+        self._callbacks = defaultdict(list)
+        self._consumers = set()
+        self._socket = None
+        self._thread = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if websocket is None:
+            raise ImportError("EventStream requires websocket-client. Install it with `pip install valapiclient[events]`.")
+        # The local API serves a self-signed certificate, like handle_local_request
+        ws = websocket.create_connection(self.url, header=[f"Authorization: Basic {self.api.auth_token}"],
+                                         sslopt={"cert_reqs": ssl.CERT_NONE, "check_hostname": False}, timeout=10)
+        ws.settimeout(1.0)
+        return ws
+
+    def subscribe(self, *names):
+        """
+        Subscribe to events by WAMP name or shorthand ('presences', 'chat', 'all', ... see EVENT_NAMES).
+
+        Takes effect immediately when connected, and is sent again after every reconnect.
+        """
+        names = [EVENT_NAMES.get(name, name) for name in names]
+        with self._lock:
+            new = [name for name in names if name not in self._subscriptions]
+            self._subscriptions.update(new)
+            socket = self._socket
+        if socket is not None:
+            for name in new:
+                self._send(socket, [SUBSCRIBE, name])
+        return self
+
+    def unsubscribe(self, *names):
+        names = [EVENT_NAMES.get(name, name) for name in names]
+        with self._lock:
+            self._subscriptions.difference_update(names)
+            socket = self._socket
+        if socket is not None:
+            for name in names:
+                self._send(socket, [UNSUBSCRIBE, name])
+        return self
+
+    def on(self, kind, callback):
+        """
+        Call `callback(event)` for events of `kind` ('presences', 'party', ...) or '*' for all.
+
+        Callbacks run on the reader thread; exceptions they raise are logged and ignored.
+        """
+        with self._lock:
+            self._callbacks[kind].append(callback)
+        return self
+
+    def off(self, kind, callback):
+        with self._lock:
+            if callback in self._callbacks.get(kind, ()):
+                self._callbacks[kind].remove(callback)
+        return self
+
+    def start(self):
+        """Connect on a background thread. Subscribes to all events if nothing was subscribed."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            if not self._subscriptions:
+                self._subscriptions.add(ALL_EVENTS)
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="valapiclient-events", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        self._stopping.set()
+        with self._lock:
+            socket, thread = self._socket, self._thread
+        if socket is not None:
+            try:
+                socket.close()
+            except Exception:
+                pass
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.connected.clear()
+
+    def wait_connected(self, timeout=None):
+        return self.connected.wait(timeout)
+
+    def _send(self, socket, message):
+        try:
+            socket.send(json.dumps(message))
+        except Exception as e:
+            logger.warning("Error sending to the local WebSocket: %s", e)
+
+    def _run(self):
+        attempt = 0
+        while not self._stopping.is_set():
+            try:
+                socket = self._connect()
+            except Exception as e:
+                if not self.reconnect:
+                    logger.warning("Could not connect to the local WebSocket: %s", e)
+                    return
+                delay = min(backoff_delay(attempt, base=0.5), self.max_backoff)
+                logger.info("Could not connect to the local WebSocket: %s, retrying in %.2fs", e, delay)
+                attempt += 1
+                self._stopping.wait(delay)
+                continue
+
+            attempt = 0
+            with self._lock:
+                self._socket = socket
+                subscriptions = list(self._subscriptions)
+            self.connections += 1
+            for name in subscriptions:
+                self._send(socket, [SUBSCRIBE, name])
+            self.connected.set()
+
+            try:
+                self._read(socket)
+            finally:
+                self.connected.clear()
+                with self._lock:
+                    self._socket = None
+                try:
+                    socket.close()
+                except Exception:
+                    pass
+
+            if not self.reconnect:
+                return
+
+    def _read(self, socket):
+        while not self._stopping.is_set():
+            try:
+                message = socket.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception as e:
+                if not self._stopping.is_set():
+                    logger.warning("Local WebSocket connection lost: %s", e)
+                return
+            if not message:
+                continue
+            try:
+                event = Event.from_message(json.loads(message))
+            except ValueError:
+                continue
+            if event is not None:
+                self._dispatch(event)
+
+    def _dispatch(self, event):
+        with self._lock:
+            callbacks = self._callbacks.get(event.kind, []) + self._callbacks.get("*", [])
+            consumers = list(self._consumers)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Error in event callback %r", callback)
+        for loop, queue in consumers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:  # the consumer's loop has closed
+                with self._lock:
+                    self._consumers.discard((loop, queue))
+
+    async def __aiter__(self):
+        """Yield every event as it arrives; starts the stream if needed."""
+        consumer = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._consumers.add(consumer)
+        self.start()
+        try:
+            while True:
+                yield await consumer[1].get()
+        finally:
+            with self._lock:
+                self._consumers.discard(consumer)
@@ -0,0 +1,215 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from .models import PresenceDetails, decode_private
+
+logger = logging.getLogger(__name__)
+
+# sessionLoopState values of a Valorant presence
+MENUS = "MENUS"
+PREGAME = "PREGAME"
+INGAME = "INGAME"
+STATES = (MENUS, PREGAME, INGAME)
+
+
+class Transition:
+    """
+    A change of the logged-in player's game state.
+
+    Attributes:
+        previous (str): State before the change, or None on the first update.
+        state (str): 'MENUS', 'PREGAME' or 'INGAME'.
+        match_id (str): Pregame or core-game MatchID for PREGAME and INGAME, None otherwise
+            or when the glz lookup failed.
+        details (PresenceDetails): The presence that triggered the change.
+        at (float): time.time() of the change.
+    """
+
+    __slots__ = ("previous", "state", "match_id", "details", "at")
+
+    def __init__(self, previous, state, match_id, details):
+        self.previous = previous
+        self.state = state
+        self.match_id = match_id
+        self.details = details
+        self.at = time.time()
+
+    def __repr__(self):
+        return f"Transition({self.previous!r} -> {self.state!r}, match_id={self.match_id!r})"
+
+
+class GameStateTracker:
+    """
+    Tracks MENUS -> PREGAME -> INGAME from the local presence instead of polling glz.
+
+    The player's own `chat/v4/presences` entry carries the session loop state, and
+    reading it is a local request. The glz pregame or core-game lookup that finds
+    the MatchID is made only when the state changes (or, while a lookup has failed,
+    when the presence changes again), so a tracker polled every second costs one
+    glz request per transition rather than one or two per second.
+
+    Args:
+        api (ValClient): Client used for the presence and glz requests.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.state = None
+        self.match_id = None
+        self.details = None
+        # Counters: state changes applied, and glz MatchID lookups made for them
+        self.transitions = 0
+        self.lookups = 0
+        self._private = None
+        self._puuid = None
+        self._callbacks = defaultdict(list)
+        self._thread = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._updating = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def puuid(self):
+        if self._puuid is None:
+            self._puuid = self.api.get_current_player_puuid()
+        return self._puuid
+
+    def on(self, state, callback):
+        """
+        Call `callback(transition)` when the state changes to `state`, or '*' for every change.
+
+        Callbacks run on the thread that called update(); exceptions they raise are logged and ignored.
+        """
+        with self._lock:
+            self._callbacks[state].append(callback)
+        return self
+
+    def off(self, state, callback):
+        with self._lock:
+            if callback in self._callbacks.get(state, ()):
+                self._callbacks[state].remove(callback)
+        return self
+
+    def _own_presence(self, presences):
+        puuid = self.puuid
+        return next((entry for entry in presences or () if entry.get("puuid") == puuid
+                     and entry.get("product") == "valorant"), None)
+
+    def _lookup_match_id(self, state):
+        if state == PREGAME:
+            self.lookups += 1
+            session = self.api.pregame.get_session(refresh=True)
+            return session.match_id if session else None
+        if state == INGAME:
+            self.lookups += 1
+            self.api.pregame.clear_session()
+            return self.api.coregame.get_current_match_id()
+        self.api.pregame.clear_session()
+        return None
+
+    def update(self, presences=None):
+        """
+        Read the player's presence and apply any state change.
+
+        Args:
+            presences (list): Presence entries to use instead of fetching `chat/v4/presences`,
+                e.g. the data of a presences event. Updates without the player's entry are ignored.
+
+        Returns:
+            Transition: The change that was applied, or None if the state didn't change.
+        """
+        if presences is None:
+            presences = self.api.local.get_presence()
+        entry = self._own_presence(presences)
+        if entry is None:
+            return None
+
+        # Polling and events may both update; one update is applied at a time
+        with self._updating:
+            # An unchanged blob can't change the state, so it isn't even decoded
+            private = entry.get("private")
+            if private == self._private:
+                return None
+            self._private = private
+            details = PresenceDetails(decode_private(private))
+            state = details.session_loop_state
+            if state not in STATES:
+                return None
+
+            previous = self.state
+            self.details = details
+            if state == previous and (self.match_id is not None or state == MENUS):
+                return None
+
+            match_id = self._lookup_match_id(state)
+            transition = Transition(previous, state, match_id, details)
+            changed = state != previous
+            with self._lock:
+                self.state, self.match_id = state, match_id
+                if changed:
+                    self.transitions += 1
+                self._changed.notify_all()
+                callbacks = self._callbacks.get(state, []) + self._callbacks.get("*", []) if changed else []
+        for callback in callbacks:
+            try:
+                callback(transition)
+            except Exception:
+                logger.exception("Error in game state callback %r", callback)
+        return transition
+
+    def wait_for(self, state, timeout=None):
+        """
+        Block until the tracked state is `state`.
+
+        Something must be updating the tracker meanwhile: start(), follow_events() or
+        another thread calling update().
+
+        Returns:
+            bool: True if the state was reached, False on timeout.
+        """
+        with self._lock:
+            return self._changed.wait_for(lambda: self.state == state, timeout)
+
+    def _handle_event(self, event):
+        if event.event_type != "Delete":
+            self.update((event.data or {}).get("presences") or [])
+
+    def follow_events(self):
+        """
+        Update from presence events on `api.events` instead of polling; starts the event stream.
+
+        Returns:
+            GameStateTracker: self, after one initial update from `chat/v4/presences`.
+        """
+        self.api.events.subscribe("presences").on("presences", self._handle_event).start()
+        self.update()
+        return self
+
+    def start(self, interval=1.0):
+        """Poll the local presence every `interval` seconds on a background thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="valapiclient-game-state",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        self._stopping.set()
+        self.api.events.off("presences", self._handle_event)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self, interval):
+        while not self._stopping.is_set():
+            try:
+                self.update()
+            except Exception as e:
+                logger.warning("Error updating game state: %s", e)
+            self._stopping.wait(interval)
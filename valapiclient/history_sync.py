@@ -0,0 +1,208 @@
+import json
+import logging
+import math
+import os
+import threading
+import time
+from os import path
+
+from .batch import run_batch
+from .cache import default_cache_dir
+from .endpoints.pvp import HISTORY_PAGE_SIZE, is_storable_match
+from .pagination import iter_pages
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryIndex:
+    """
+    JSON file recording, per PUUID, the newest match already synced and its start time.
+
+    Args:
+        filename (str): Index file. Defaults to history_index.json in default_cache_dir().
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename or path.join(default_cache_dir(), "history_index.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.filename, "r", encoding="utf-8") as index_file:
+                self._players = json.load(index_file)
+        except (OSError, ValueError):
+            self._players = {}
+
+    def get(self, puuid):
+        """Return {"last_match_id", "last_start_time", "synced_at"} for `puuid`, or None if never synced."""
+        with self._lock:
+            return self._players.get(puuid)
+
+    def update(self, puuid, match_id, start_time):
+        with self._lock:
+            self._players[puuid] = {"last_match_id": match_id, "last_start_time": start_time, "synced_at": time.time()}
+
+    def remove(self, puuid):
+        with self._lock:
+            self._players.pop(puuid, None)
+
+    def __contains__(self, puuid):
+        return self.get(puuid) is not None
+
+    def save(self):
+        """Write the index atomically. Write failures are ignored."""
+        with self._lock:
+            try:
+                os.makedirs(path.dirname(self.filename) or ".", exist_ok=True)
+                temp = f"{self.filename}.{os.getpid()}.tmp"
+                with open(temp, "w", encoding="utf-8") as index_file:
+                    json.dump(self._players, index_file, separators=(",", ":"))
+                os.replace(temp, self.filename)
+            except OSError as e:
+                logger.warning("Could not write history index %s: %s", self.filename, e)
+
+
+class SyncReport:
+    """
+    Outcome of one HistorySync.sync() run.
+
+    Attributes:
+        new_matches (dict): PUUID -> match IDs that are new since the previous run, newest first.
+        errors (dict): PUUID or match ID -> exception, for history walks and downloads that failed.
+        history_requests (int): Match-history pages requested.
+        history_requests_saved (int): Pages a full re-pull of every history would have needed on top.
+        details_downloaded (int): Match details downloaded.
+        details_cached (int): New matches already in the match store.
+        details_deduplicated (int): Downloads avoided because several players shared the match.
+    """
+
+    __slots__ = ("new_matches", "errors", "history_requests", "history_requests_saved",
+                 "details_downloaded", "details_cached", "details_deduplicated")
+
+    def __init__(self):
+        self.new_matches = {}
+        self.errors = {}
+        self.history_requests = 0
+        self.history_requests_saved = 0
+        self.details_downloaded = 0
+        self.details_cached = 0
+        self.details_deduplicated = 0
+
+    @property
+    def requests_sent(self):
+        return self.history_requests + self.details_downloaded
+
+    @property
+    def requests_saved(self):
+        return self.history_requests_saved + self.details_cached + self.details_deduplicated
+
+    def as_dict(self):
+        return {
+            "players": len(self.new_matches),
+            "new_matches": sum(len(match_ids) for match_ids in self.new_matches.values()),
+            "errors": len(self.errors),
+            "history_requests": self.history_requests,
+            "history_requests_saved": self.history_requests_saved,
+            "details_downloaded": self.details_downloaded,
+            "details_cached": self.details_cached,
+            "details_deduplicated": self.details_deduplicated,
+            "requests_sent": self.requests_sent,
+            "requests_saved": self.requests_saved,
+        }
+
+    def __repr__(self):
+        return f"SyncReport({self.as_dict()})"
+
+
+class HistorySync:
+    """
+    Incrementally syncs the match history and match details of tracked players.
+
+    Each run walks every player's history only back to the newest match seen on
+    the previous run, then downloads the details of new matches that aren't in
+    the match store yet. A match shared by several tracked players is downloaded
+    once. A player's index entry only advances once all of their new matches are
+    stored, so failed downloads are retried on the next run.
+
+    Args:
+        api (ValClient): Client used for the requests.
+        index (HistoryIndex): Per-player sync state. Defaults to HistoryIndex().
+        match_store (MatchStore): Where match details are kept. Defaults to `api.match_store`.
+        queue (str): Only sync matches of this queue (e.g. 'competitive').
+        max_workers (int): Concurrent history walks and downloads.
+    """
+
+    def __init__(self, api, index=None, match_store=None, queue=None, max_workers=8):
+        self.api = api
+        self.index = index if index is not None else HistoryIndex()
+        self.match_store = match_store if match_store is not None else api.match_store
+        if self.match_store is None:
+            raise ValueError("HistorySync needs a match store; pass one here or to ValClient(match_store=...).")
+        self.queue = queue
+        self.max_workers = max_workers
+
+    def _new_history(self, puuid):
+        """Walk `puuid`'s history back to the last synced match. Returns (entries, pages requested, total)."""
+        state = self.index.get(puuid)
+        pages = []
+
+        def fetch_page(start, end):
+            page = self.api.pvp.fetch_match_history(puuid, start, end, self.queue)
+            pages.append(page)
+            return page
+
+        def seen(entry):
+            return state is not None and (entry.get("MatchID") == state["last_match_id"]
+                                          or entry.get("GameStartTime", 0) < state["last_start_time"])
+
+        entries = list(iter_pages(fetch_page, "History", page_size=HISTORY_PAGE_SIZE, total_key="Total",
+                                  until=seen, prefetch=False))
+        total = pages[0].get("Total", 0) if pages else 0
+        return entries, len(pages), total
+
+    def sync(self, puuids):
+        """
+        Sync every player in `puuids` and save the index.
+
+        Returns:
+            SyncReport: New matches per player, errors and request counters for the run.
+        """
+        report = SyncReport()
+        histories = {}
+
+        for result in run_batch(self._new_history, dict.fromkeys(puuids), max_workers=self.max_workers):
+            if not result.ok:
+                report.errors[result.key] = result.error
+                continue
+            entries, pages, total = result.value
+            histories[result.key] = entries
+            report.new_matches[result.key] = [entry["MatchID"] for entry in entries]
+            report.history_requests += pages
+            report.history_requests_saved += max(0, math.ceil(total / HISTORY_PAGE_SIZE) - pages)
+
+        # Every new match, once, however many tracked players were in it
+        new_match_ids = [match_id for match_ids in report.new_matches.values() for match_id in match_ids]
+        unique_ids = list(dict.fromkeys(new_match_ids))
+        report.details_deduplicated = len(new_match_ids) - len(unique_ids)
+
+        missing = [match_id for match_id in unique_ids if match_id not in self.match_store]
+        report.details_cached = len(unique_ids) - len(missing)
+
+        failed = set()
+        for result in run_batch(self._download, missing, max_workers=self.max_workers):
+            if result.ok:
+                report.details_downloaded += 1
+            else:
+                failed.add(result.key)
+                report.errors[result.key] = result.error
+
+        for puuid, entries in histories.items():
+            if entries and not failed.intersection(report.new_matches[puuid]):
+                self.index.update(puuid, entries[0]["MatchID"], entries[0].get("GameStartTime", 0))
+        self.index.save()
+        return report
+
+    def _download(self, match_id):
+        # Goes through the client's match store too, which fills it when it is this sync's store
+        match_details = self.api.pvp.fetch_match_details(match_id)
+        if self.match_store is not self.api.match_store and is_storable_match(match_details):
+            self.match_store.put(match_id, match_details)
+        return match_id
@@ -0,0 +1,53 @@
+import threading
+
+
+class IdentityCache:
+    """
+    Caches the logged-in player's identity.
+
+    The userinfo payload is fetched at most once per access-token subject and is
+    only invalidated when the subject changes (i.e. a different account logs in).
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._player = None
+        self._subject = None
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._player = None
+            self._subject = None
+
+    def get_player(self):
+        """
+        Return the cached userinfo payload, fetching it if the token subject changed.
+
+        Returns:
+            dict: The userinfo payload of the logged-in player.
+        """
+        subject = self.api.tokens.get_subject()
+        player = self._player
+        if player is not None and self._subject == subject:
+            return player
+
+        with self._lock:
+            if self._player is None or self._subject != subject:
+                self._player = self.api.fetch_current_player()
+                self._subject = subject
+            return self._player
+
+    @property
+    def puuid(self):
+        """
+        The logged-in player's PUUID.
+
+        The access token's `sub` claim is the PUUID, so userinfo is only fetched
+        when the token doesn't carry one.
+        """
+        subject = self.api.tokens.get_subject()
+        if subject:
+            return subject
+        player = self.get_player()
+        return player["sub"] if player else None
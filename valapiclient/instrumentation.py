@@ -0,0 +1,114 @@
+"""
+Logging helpers shared by the request paths.
+
+Every module logs to a child of the "valapiclient" logger. Messages use %-style
+arguments, so a disabled level costs one isEnabledFor() check. Per-request
+records are logged at DEBUG on "valapiclient.requests" with structured fields
+(host, endpoint, method, status, bytes, latency_ms) in the record's extras.
+"""
+import logging
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("valapiclient")
+request_logger = logging.getLogger("valapiclient.requests")
+
+# Bytes of a response body included in log messages; None logs whole bodies
+_body_limit = 500
+
+_UUID = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+# Placeholder for an ID path segment, by the segment before it
+_PLACEHOLDERS = {
+    "players": "{puuid}",
+    "history": "{puuid}",
+    "storefront": "{puuid}",
+    "wallet": "{puuid}",
+    "sessions": "{puuid}",
+    "entitlements": "{puuid}",
+    "matches": "{match_id}",
+    "parties": "{party_id}",
+    "select": "{agent_id}",
+    "lock": "{agent_id}",
+    "disassociate": "{match_id}",
+    "order": "{order_id}",
+    "leaderboards": "{season_id}",
+}
+
+_VERSION = re.compile(r"^v\d+$")
+
+
+def set_body_limit(limit):
+    """Truncate logged response bodies to `limit` bytes (None for no limit)."""
+    global _body_limit
+    _body_limit = limit
+
+
+class _Body:
+    """A response body decoded and truncated only if a log message actually includes it."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response):
+        self.response = response
+
+    def __str__(self):
+        content = self.response.content or b""
+        if _body_limit is not None and len(content) > _body_limit:
+            # Decode only the logged prefix, not a whole match-details payload
+            text = content[:_body_limit].decode(self.response.encoding or "utf-8", errors="replace")
+            return f"{text}... ({len(content)} bytes)"
+        return self.response.text
+
+
+def body(response):
+    """Lazy, truncated `response.text` for use as a logging argument."""
+    return _Body(response)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path):
+    """
+    The endpoint of a URL path with its IDs replaced by placeholders.
+
+    'mmr/v1/players/<uuid>/competitiveupdates?startIndex=0' -> 'mmr/v1/players/{puuid}/competitiveupdates'.
+    UUID segments are named after the segment before them, skipping a version segment
+    like 'v2' (see _PLACEHOLDERS), or '{id}'.
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    for index, segment in enumerate(segments):
+        if _UUID.match(segment):
+            before = index - 1
+            if before > 0 and _VERSION.match(segments[before]):
+                before -= 1
+            segments[index] = _PLACEHOLDERS.get(segments[before], "{id}") if before >= 0 else "{id}"
+    return "/".join(segments)
+
+
+def url_endpoint(url):
+    """endpoint_template() of a full URL; cheaper than urlsplit() on URLs that vary by ID."""
+    scheme = url.find("://")
+    if scheme >= 0:
+        path_start = url.find("/", scheme + 3)
+        url = url[path_start:] if path_start >= 0 else ""
+    return endpoint_template(url)
+
+
+def log_request(method, url, response):
+    """
+    Log one request at DEBUG on "valapiclient.requests", if enabled.
+
+    Latency is `response.elapsed`, the time until the response headers arrived.
+    """
+    if not request_logger.isEnabledFor(logging.DEBUG):
+        return
+    parts = urlsplit(url)
+    endpoint = endpoint_template(parts.path)
+    size = len(response.content or b"")
+    latency_ms = response.elapsed.total_seconds() * 1000
+    request_logger.debug(
+        "%s %s -> %s in %.1f ms (%d bytes)", method, endpoint, response.status_code, latency_ms, size,
+        extra={"host": parts.hostname, "endpoint": endpoint, "method": method, "status": response.status_code,
+               "bytes": size, "latency_ms": latency_ms},
+    )
@@ -0,0 +1,85 @@
+import json
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see `pip install valapiclient[fast-json]`
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+def _stdlib_loads(data):
+    # json.loads detects the UTF-8/16/32 encoding of bytes itself
+    return json.loads(data)
+
+
+BACKENDS = {"json": _stdlib_loads}
+if msgspec is not None:
+    BACKENDS["msgspec"] = msgspec.json.decode
+if orjson is not None:
+    BACKENDS["orjson"] = orjson.loads
+
+# Tried in order by set_backend() when no backend is named
+PREFERRED = ("orjson", "msgspec", "json")
+
+# orjson's error subclasses ValueError; msgspec's may not
+_DECODE_ERRORS = (ValueError,) + ((msgspec.DecodeError,) if msgspec is not None else ())
+
+_loads = _stdlib_loads
+_backend = "json"
+
+
+def set_backend(name=None):
+    """
+    Select the JSON decoder used for every response.
+
+    Args:
+        name (str): "orjson", "msgspec" or "json", or None for the fastest one installed.
+
+    Returns:
+        str: The backend now in use.
+    """
+    global _loads, _backend
+    if name is None:
+        name = next(candidate for candidate in PREFERRED if candidate in BACKENDS)
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available; installed: {sorted(BACKENDS)}")
+    _loads, _backend = BACKENDS[name], name
+    return name
+
+
+def get_backend():
+    return _backend
+
+
+def loads(data):
+    """Decode JSON from bytes or str with the selected backend."""
+    return _loads(data)
+
+
+def decode_response(response):
+    """
+    Decode a response body straight from `response.content`.
+
+    A drop-in for `response.json()` that skips the text decode and charset
+    detection. Invalid JSON raises requests.exceptions.JSONDecodeError, like
+    `response.json()` does.
+    """
+    content = response.content
+    try:
+        return _loads(content)
+    except _DECODE_ERRORS as e:
+        raise requests.exceptions.JSONDecodeError(str(e), content.decode("utf-8", "replace"), 0) from e
+
+
+def decode_ok(response):
+    """The decoded body of a 200 response; None for any other status or no response at all."""
+    return decode_response(response) if response is not None and response.status_code == 200 else None
+
+
+set_backend()
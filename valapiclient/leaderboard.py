@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Columns written by LeaderboardCrawler.to_csv unless others are given
+CSV_FIELDS = ("leaderboardRank", "puuid", "gameName", "tagLine", "rankedRating", "numberOfWins",
+              "competitiveTier", "IsAnonymized", "IsBanned")
+
+
+class LeaderboardCrawler:
+    """
+    Crawls a full season leaderboard page by page.
+
+    The first page reports `totalPlayers`; the remaining pages are then fetched on
+    `max_workers` threads, each request going through the client's rate limiter.
+    Pages are yielded in rank order and at most `2 * max_workers` pages are held
+    in memory, so a board of any size can be streamed to a file.
+
+    The file exports record the last completed page in a checkpoint file next to
+    the output and resume from it after an interruption.
+
+    Args:
+        api (ValClient): Client used for the requests.
+        season_id (str): Season (act) UUID.
+        page_size (int): Players per request.
+        max_workers (int): Concurrent page requests.
+    """
+
+    def __init__(self, api, season_id, page_size=200, max_workers=4):
+        if not season_id or not isinstance(season_id, str):
+            raise ValueError(f"Invalid season ID: {season_id!r}")
+        self.api = api
+        self.season_id = season_id
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.total_players = None
+
+    def _fetch_page(self, page):
+        start = page * self.page_size
+        return self.api.pvp.fetch_leaderboard(self.season_id, start, start + self.page_size)
+
+    def iter_pages(self, start_page=0):
+        """
+        Yield (page number, Players list) in rank order, starting at `start_page`.
+
+        Request errors are raised; pages yielded before the error are complete.
+        """
+        first = self._fetch_page(start_page)
+        self.total_players = first.get("totalPlayers", 0)
+        yield start_page, first.get("Players") or []
+
+        page_count = math.ceil(self.total_players / self.page_size)
+        pages = iter(range(start_page + 1, page_count))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            window = deque()
+            try:
+                for page in pages:
+                    window.append((page, executor.submit(self._fetch_page, page)))
+                    if len(window) >= 2 * self.max_workers:
+                        break
+                while window:
+                    page, future = window.popleft()
+                    players = future.result().get("Players") or []
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        window.append((next_page, executor.submit(self._fetch_page, next_page)))
+                    yield page, players
+            finally:
+                for _, future in window:
+                    future.cancel()
+
+    def iter_players(self, start_page=0):
+        """Yield leaderboard entries ({"puuid", "gameName", "leaderboardRank", "rankedRating", ...}) in rank order."""
+        for _, players in self.iter_pages(start_page):
+            yield from players
+
+    def to_ndjson(self, filename, resume=True):
+        """
+        Write one JSON entry per line to `filename`.
+
+        Returns:
+            int: Players written by this call.
+        """
+        return self._export(filename, resume, lambda out, players: out.writelines(
+            json.dumps(player, separators=(",", ":")) + "\n" for player in players
+        ))
+
+    def to_csv(self, filename, fields=CSV_FIELDS, resume=True):
+        """
+        Write the `fields` columns of every entry to `filename`, with a header row.
+
+        Returns:
+            int: Players written by this call.
+        """
+        def write(out, players):
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+            if out.tell() == 0:
+                writer.writeheader()
+            writer.writerows(players)
+            out.write(buffer.getvalue())
+
+        return self._export(filename, resume, write)
+
+    def _checkpoint_path(self, filename):
+        return f"{filename}.checkpoint.json"
+
+    def _load_checkpoint(self, filename):
+        try:
+            with open(self._checkpoint_path(filename), "r", encoding="utf-8") as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get("season_id") != self.season_id or checkpoint.get("page_size") != self.page_size:
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, filename, next_page, offset):
+        target = self._checkpoint_path(filename)
+        temp = f"{target}.tmp"
+        with open(temp, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({"season_id": self.season_id, "page_size": self.page_size, "next_page": next_page,
+                       "offset": offset, "total_players": self.total_players}, checkpoint_file)
+        os.replace(temp, target)
+
+    def _export(self, filename, resume, write):
+        checkpoint = self._load_checkpoint(filename) if resume and os.path.exists(filename) else None
+        start_page = checkpoint["next_page"] if checkpoint else 0
+
+        written = 0
+        with open(filename, "r+" if checkpoint else "w", encoding="utf-8", newline="") as out:
+            if checkpoint:
+                # Drop anything written after the last checkpoint, e.g. half a page before a crash
+                out.seek(checkpoint["offset"])
+                out.truncate()
+
+            for page, players in self.iter_pages(start_page):
+                write(out, players)
+                out.flush()
+                written += len(players)
+                self._save_checkpoint(filename, page + 1, out.tell())
+
+        os.remove(self._checkpoint_path(filename))
+        return written
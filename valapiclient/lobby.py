@@ -0,0 +1,124 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+class LobbySnapshot:
+    """
+    A pregame or core-game match with every player's name, MMR and account XP.
+
+    Attributes:
+        match_id (str): The match, or None if the player isn't in one.
+        match (dict): The pregame or core-game match response.
+        loadouts (dict): The match's loadouts response.
+        players (dict): PUUID -> {"puuid", "team_id", "character_id", "name", "mmr", "account_xp"}, in match
+            order; "name" is the name-service entry. Lookups that failed are None.
+        timings (dict): Seconds spent in each call, keyed "match_id", "match", "loadouts", "names",
+            "mmr/<puuid>" and "account_xp/<puuid>".
+        errors (dict): The exception raised by each call that failed, with the same keys, plus
+            "name/<puuid>" for each player the name service returned no entry for.
+        elapsed (float): Seconds for the whole snapshot.
+    """
+
+    __slots__ = ("match_id", "match", "loadouts", "players", "timings", "errors", "elapsed")
+
+    def __init__(self, match_id=None):
+        self.match_id = match_id
+        self.match = None
+        self.loadouts = None
+        self.players = {}
+        self.timings = {}
+        self.errors = {}
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return self.match is not None and not self.errors
+
+    def __repr__(self):
+        return (f"LobbySnapshot(match_id={self.match_id!r}, players={len(self.players)}, errors={len(self.errors)}, "
+                f"elapsed={self.elapsed:.3f}s)")
+
+
+def timed(snapshot, name, func, *args):
+    """Call `func(*args)`, recording its duration and any exception under `name` in `snapshot`."""
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    except Exception as e:
+        snapshot.errors[name] = e
+        return None
+    finally:
+        snapshot.timings[name] = time.perf_counter() - start
+
+
+def _not_found(error):
+    return isinstance(error, requests.exceptions.HTTPError) and getattr(error.response, "status_code", None) == 404
+
+
+def build_snapshot(api, match_id, fetch_match, fetch_loadouts, players_of, max_workers=16, snapshot=None,
+                   resolve_match_id=None):
+    """
+    Fetch a match, then its loadouts, the players' names and every player's MMR and XP concurrently.
+
+    Args:
+        api (ValClient): Client used for the requests.
+        match_id (str): The match, or None to return an empty snapshot.
+        fetch_match (callable): match_id -> match response; raises on failure.
+        fetch_loadouts (callable): match_id -> loadouts response; raises on failure.
+        players_of (callable): match response -> list of player dicts with "Subject".
+        max_workers (int): Maximum concurrent requests after the match is fetched.
+        snapshot (LobbySnapshot): Snapshot to fill in, e.g. one already holding the match ID lookup's timing.
+        resolve_match_id (callable): Looks up the current match ID when fetching `match_id` answers
+            404, i.e. when `match_id` came from a cache and the match is over.
+
+    Returns:
+        LobbySnapshot
+    """
+    start = time.perf_counter()
+    snapshot = snapshot or LobbySnapshot()
+    # Time already spent looking up the match ID before this call
+    lookup = snapshot.timings.get("match_id", 0.0)
+    snapshot.match_id = match_id
+    if match_id:
+        snapshot.match = timed(snapshot, "match", fetch_match, match_id)
+    if snapshot.match is None and resolve_match_id is not None and _not_found(snapshot.errors.get("match")):
+        del snapshot.errors["match"]
+        match_id = snapshot.match_id = timed(snapshot, "match_id", resolve_match_id)
+        if match_id:
+            snapshot.match = timed(snapshot, "match", fetch_match, match_id)
+    if snapshot.match is None:
+        snapshot.elapsed = time.perf_counter() - start + lookup
+        return snapshot
+
+    players = [player for player in players_of(snapshot.match) or () if player.get("Subject")]
+    puuids = [player["Subject"] for player in players]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, 2 + 2 * len(puuids)))) as executor:
+        loadouts = executor.submit(timed, snapshot, "loadouts", fetch_loadouts, match_id)
+        # Through the resolver, so its cache, stats and in-flight deduplication apply to snapshots too
+        names = executor.submit(timed, snapshot, "names", api.names.resolve, puuids) if puuids else None
+        mmr = {puuid: executor.submit(timed, snapshot, f"mmr/{puuid}", api.pvp.fetch_player_mmr, puuid)
+               for puuid in puuids}
+        xp = {puuid: executor.submit(timed, snapshot, f"account_xp/{puuid}", api.pvp.fetch_account_xp, puuid)
+              for puuid in puuids}
+
+        snapshot.loadouts = loadouts.result()
+        name_entries = names.result() if names else None
+        for player in players:
+            puuid = player["Subject"]
+            # A failed "names" call is already in errors; otherwise flag each player left without a name
+            if name_entries is not None and name_entries.get(puuid) is None:
+                snapshot.errors[f"name/{puuid}"] = LookupError(f"No name-service entry for {puuid}")
+            snapshot.players[puuid] = {
+                "puuid": puuid,
+                "team_id": player.get("TeamID"),
+                "character_id": player.get("CharacterID"),
+                "name": (name_entries or {}).get(puuid),
+                "mmr": mmr[puuid].result(),
+                "account_xp": xp[puuid].result(),
+            }
+
+    snapshot.elapsed = time.perf_counter() - start + lookup
+    return snapshot
@@ -1,15 +1,32 @@
 import requests
 import base64
 import json
+import logging
 import ssl
 import re
 import os
 from os import path
+import threading
 import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from pythonping import ping
 from urllib3.exceptions import InsecureRequestWarning
 from .request_class import Request
+from .connections import ConnectionManager, ConnectionStats, PooledAdapter
+from .content_cache import ContentCache
+from .events import EventStream
+from .game_state import GameStateTracker
+from .identity import IdentityCache
+from .instrumentation import body, log_request
+from .json_decoder import decode_response
+from .metrics import RequestMetrics
+from .name_resolver import NameResolver
+from .presence import PresenceTracker
+from .rate_limit import RateLimiter, backoff_delay, parse_retry_after
+from .token_manager import TokenManager
 
 from .endpoints import (
     CoreGameEndpoints,
@@ -20,10 +37,16 @@ from .endpoints import (
     SessionsEndpoints,
     StoreEndpoints,
 )
+from .endpoints.local import region_from_sessions
 
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
-class TLSAdapter(requests.adapters.HTTPAdapter):
+logger = logging.getLogger(__name__)
+
+
+class TLSAdapter(PooledAdapter):
+    """PooledAdapter using the cipher list the Riot PvP hosts expect."""
+
     FORCED_CIPHERS = [
         'ECDHE-ECDSA-AES128-GCM-SHA256',
         'ECDHE-ECDSA-CHACHA20-POLY1305',
@@ -37,36 +60,54 @@ class TLSAdapter(requests.adapters.HTTPAdapter):
         'RSA+3DES'
     ]
 
-    def init_poolmanager(self, *args, **kwargs):
-        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        ctx.set_ciphers(':'.join(self.FORCED_CIPHERS))
-        kwargs['ssl_context'] = ctx
-        return super(TLSAdapter, self).init_poolmanager(*args, **kwargs)
+    def __init__(self, stats=None, **kwargs):
+        kwargs.setdefault('ssl_context', create_tls_context())
+        super().__init__(stats or ConnectionStats(), **kwargs)
+
+def create_tls_context():
+    """SSL context with the cipher list the Riot PvP hosts expect. Shared by the sync and async clients."""
+    ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    ctx.set_ciphers(':'.join(TLSAdapter.FORCED_CIPHERS))
+    return ctx
 
 def gen_pvp_base_url(prefix="pd", region="eu"):
     return f"{prefix}.{region}.a.pvp.net"
 
 class ValClient:
-    def __init__(self, ip, port, username, password):
+    VERSION_URL = "https://valorant-api.com/v1/version"
+
+    def __init__(self, ip, port, username, password, rate_limits=None, match_store=None, content_cache=True,
+                 eager=False, connections=None, metrics=True):
         self.base_url = f"https://{ip}:{port}/"  # Changed to 'http' assuming local API
-        self.pvp_base_url = gen_pvp_base_url()
         self.auth_token = base64.b64encode(f"{username}:{password}".encode('utf-8')).decode("utf-8")
         self.local_header = {'Authorization': f"Basic {self.auth_token}"}
 
-        self.session = requests.Session()
-        self.session.mount('https://', TLSAdapter())
-
-        self.local_session = requests.Session()
-        self.local_session.verify = False
+        # Keep-alive pools, timeouts and connection counters for every request path
+        self.connections = connections or ConnectionManager(ssl_context=create_tls_context())
+        self.session = self.connections.session
+        # Per-endpoint counts, latency histograms and bytes; False disables them
+        self.metrics = RequestMetrics() if metrics is True else (metrics or None)
+        # Shared by every thread using this client; see rate_limit.DEFAULT_BUDGETS
+        self.rate_limiter = RateLimiter(rate_limits)
+        # Optional MatchStore consulted by pvp.get_match_details before the network
+        self.match_store = match_store
+        # Version and content-service payloads persisted across runs; False disables it
+        self.content_cache = ContentCache() if content_cache is True else (content_cache or None)
+
+        self.local_session = self.connections.local_session
         self.local_session.headers.update(self.local_header)
 
-        # Obtain clientVersion and clientPlatform
-        self.client_version = self.get_current_version()
+        # clientVersion, tokens and region are resolved on first use; see warm_up()
+        self._client_version = None
+        self._region = None
+        self._version_lock = threading.Lock()
+        self._region_lock = threading.Lock()
         self.client_platform = self.get_client_platform()
 
-        # Authenticate and set up the headers
-        self.auth_headers = self.get_auth_headers()
-        self.base_pvp_header = self.auth_headers.copy()
+        self.tokens = TokenManager(self.fetch_auth_info)
+        # (token generation, read-only headers); replaced as a whole so readers never see a mixed pair
+        self._auth_headers = None
+        self.identity = IdentityCache(self)
 
         # Initialize endpoint classes
         self.coregame = CoreGameEndpoints(self)
@@ -77,16 +118,77 @@ class ValClient:
         self.sessions = SessionsEndpoints(self)
         self.store = StoreEndpoints(self)
 
-        try:
-            self.region = self.get_region()
-        except Exception as e:
-            print(f"Error getting region: {e}, using default 'eu'.")
-            self.region = "eu"
-
-        # Now initialize base URLs without 'https://'
-        self.pvp_base_url = f"pd.{self.region}.a.pvp.net"
-        self.glz_base_url = f"glz-{self.region}-1.{self.region}.a.pvp.net"
-        self.shared_base_url = f"shared.{self.region}.a.pvp.net"
+        # Cached, batched PUUID -> name lookups shared by every thread
+        self.names = NameResolver(self.pvp)
+        # Local WebSocket subscriptions; connects on events.start()
+        self.events = EventStream(self)
+        # MENUS/PREGAME/INGAME from the local presence; glz is asked for the MatchID only on changes
+        self.game_state = GameStateTracker(self)
+        # Decoded friend presences, reported as diffs between updates
+        self.presences = PresenceTracker(self)
+
+        if eager:
+            self.warm_up()
+
+    @property
+    def client_version(self):
+        """Version info from get_current_version(), looked up on first use."""
+        if self._client_version is None:
+            with self._version_lock:
+                if self._client_version is None:
+                    self._client_version = self.get_current_version()
+        return self._client_version
+
+    @client_version.setter
+    def client_version(self, value):
+        self._client_version = value
+
+    @property
+    def region(self):
+        """Region from get_region(), looked up on first use. Falls back to 'eu'."""
+        if self._region is None:
+            with self._region_lock:
+                if self._region is None:
+                    try:
+                        self._region = self.get_region()
+                    except Exception as e:
+                        logger.warning("Error getting region: %s, using default 'eu'.", e)
+                        self._region = "eu"
+        return self._region
+
+    @region.setter
+    def region(self, value):
+        self._region = value
+
+    # Base URLs without 'https://'
+    @property
+    def pvp_base_url(self):
+        return gen_pvp_base_url("pd", self.region)
+
+    @property
+    def glz_base_url(self):
+        return f"glz-{self.region}-1.{self.region}.a.pvp.net"
+
+    @property
+    def shared_base_url(self):
+        return gen_pvp_base_url("shared", self.region)
+
+    def warm_up(self):
+        """
+        Resolve the client version, tokens and region now, concurrently, instead of on first use.
+
+        The three lookups go to different services and don't depend on each other, so
+        startup takes as long as the slowest one rather than their sum.
+        """
+        steps = (lambda: self.client_version, self.tokens.get_tokens, lambda: self.region)
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            for future in [executor.submit(step) for step in steps]:
+                future.result()
+        return self.auth_headers
+
+    def is_ready(self):
+        """True when the version, region and fresh tokens are resolved, so building a request needs no lookup."""
+        return self._client_version is not None and self._region is not None and self.tokens.is_fresh()
 
 
     def get_glz_url(self):
@@ -101,42 +203,67 @@ class ValClient:
     def handle_local_request(self, suffix, method="GET", json_data=None):
         url = self.base_url + suffix
         session = self.local_session
+        # verify per request: a CA bundle in the environment overrides the session's verify=False
+        options = {"verify": False, "timeout": self.connections.local_timeout}
+        start = time.perf_counter()
         try:
             if method == "GET":
-                response = session.get(url)
+                response = session.get(url, **options)
             elif method == "POST":
-                response = session.post(url, json=json_data)
+                response = session.post(url, json=json_data, **options)
             elif method == "PUT":
-                response = session.put(url, json=json_data)
+                response = session.put(url, json=json_data, **options)
             elif method == "DELETE":
-                response = session.delete(url, json=json_data)
+                response = session.delete(url, json=json_data, **options)
             else:
                 raise ValueError(f"Invalid method {method}")
-            return response
+            log_request(method, url, response)
         except requests.exceptions.RequestException as e:
-            print(f"Error during local request to {url}: {e}")
-            return None
+            logger.warning("Error during local request to %s: %s", url, e)
+            response = None
+        if self.metrics is not None:
+            self.metrics.record(method, url, response, time.perf_counter() - start)
+        return response
 
     def get_region(self):
         response = self.handle_local_request("product-session/v1/external-sessions")
         if response and response.status_code == 200:
-            response_json = response.json()
-            for key, region_info in response_json.items():
-                if key != 'host_app':
-                    arguments = region_info.get("launchConfiguration", {}).get("arguments", [])
-                    for arg in arguments:
-                        if arg.startswith("-ares-deployment="):
-                            return arg.split('=')[1]
+            region = region_from_sessions(decode_response(response))
+            if region:
+                return region
             raise Exception("Valid region information not found in any non-host_app key.")
         else:
             raise Exception("Failed to get region information.")
 
+    def _fetch_version(self, headers):
+        return self.session.get(self.VERSION_URL, headers=headers, timeout=self.connections.timeout)
+
     def get_current_version(self):
-        response = requests.get("https://valorant-api.com/v1/version")
+        cache = self.content_cache
+        entry = cache.load("version") if cache else None
+        if cache and cache.is_fresh(entry):
+            return entry["data"]
+
+        try:
+            response = self._fetch_version(ContentCache.conditional_headers(entry))
+        except requests.exceptions.RequestException as e:
+            if entry:
+                logger.warning("Error getting client version: %s, using cached version.", e)
+                return entry["data"]
+            raise
+
+        if response.status_code == 304 and entry:
+            cache.touch("version", entry)
+            return entry["data"]
         if response.status_code == 200:
-            return response.json()["data"]
-        else:
-            raise Exception(f"Failed to get client version: {response.status_code}")
+            data = decode_response(response)["data"]
+            if cache:
+                cache.save("version", data, response.headers)
+            return data
+        if entry:
+            logger.warning("Failed to get client version: %s, using cached version.", response.status_code)
+            return entry["data"]
+        raise Exception(f"Failed to get client version: {response.status_code}")
 
     def get_client_platform(self):
         client_platform_info = {
@@ -147,6 +274,35 @@ class ValClient:
         }
         return base64.b64encode(json.dumps(client_platform_info).encode('utf-8')).decode('utf-8')
 
+    @property
+    def auth_headers(self):
+        """
+        PvP headers for the current tokens, rebuilt only when the tokens are refreshed.
+
+        The mapping is read-only and shared by every thread; use request_headers() to add headers.
+        """
+        self.tokens.get_tokens()
+        generation = self.tokens.generation
+        cached = self._auth_headers
+        if cached is None or cached[0] != generation:
+            cached = (generation, MappingProxyType(self.get_auth_headers()))
+            self._auth_headers = cached
+        return cached[1]
+
+    def request_headers(self, extra=None):
+        """
+        Headers for one PvP request: auth_headers with `extra` layered on top, without copying either.
+
+        Args:
+            extra (dict): Per-request headers, e.g. If-None-Match. They take precedence.
+        """
+        headers = self.auth_headers
+        return ChainMap(extra, headers) if extra else headers
+
+    @property
+    def base_pvp_header(self):
+        return self.auth_headers
+
     def get_auth_headers(self):
         auth_info = self.get_auth_info()
 
@@ -160,15 +316,45 @@ class ValClient:
         return headers
 
     def get_auth_info(self):
-        r = self.local_session.get(f'{self.base_url}entitlements/v1/token')
+        """Return [access_token, entitlements_token], refreshed ahead of expiry by the token manager."""
+        return list(self.tokens.get_tokens())
+
+    def fetch_auth_info(self):
+        r = self.local_session.get(f'{self.base_url}entitlements/v1/token', verify=False,
+                                   timeout=self.connections.local_timeout)
         if r.status_code == 200:
-            response_json = r.json()
+            response_json = decode_response(r)
             access_token = response_json['accessToken']
             entitlements_token = response_json['token']
             return [access_token, entitlements_token]
         else:
             raise Exception(f"Failed to get entitlements token: {r.status_code} {r.text}")
 
+    def _send_pvp_request(self, url, header, method, json_data):
+        session = self.session
+        timeout = self.connections.timeout
+        if method == "GET":
+            response = session.get(url, headers=header, timeout=timeout)
+        elif method == "POST":
+            response = session.post(url, headers=header, json=json_data, timeout=timeout)
+        elif method == "PUT":
+            response = session.put(url, headers=header, json=json_data, timeout=timeout)
+        elif method == "DELETE":
+            response = session.delete(url, headers=header, json=json_data, timeout=timeout)
+        elif method == "HEAD":
+            response = session.head(url, headers=header, timeout=timeout)
+        else:
+            raise ValueError(f"Invalid method {method}")
+        log_request(method, url, response)
+        return response
+
+    def _refresh_auth_header(self, header):
+        """Force a token refresh and return `header` with the new tokens layered on top (it isn't modified)."""
+        stale_access_token = header.get('Authorization', '').replace('Bearer ', '', 1)
+        access_token, entitlements_token = self.tokens.force_refresh(stale_access_token)
+        return ChainMap({'Authorization': f"Bearer {access_token}", 'X-Riot-Entitlements-JWT': entitlements_token},
+                        header)
+
     def handle_pvp_request(self, suffix, prefix=None, header=None, method="GET", json_data=None, retries=3):
         if header is None:
             header = self.auth_headers
@@ -178,55 +364,76 @@ class ValClient:
 
         url = f'{prefix}/{suffix}' if prefix else f'https://{self.pvp_base_url}/{suffix}'
 
-        session = self.session
-
-        for attempt in range(retries):
-            try:
-                # Handle different request methods
-                if method == "GET":
-                    response = session.get(url, headers=header)
-                elif method == "POST":
-                    response = session.post(url, headers=header, json=json_data)
-                elif method == "PUT":
-                    response = session.put(url, headers=header, json=json_data)
-                elif method == "DELETE":
-                    response = session.delete(url, headers=header, json=json_data)
-                else:
-                    raise ValueError(f"Invalid method {method}")
-
-                # Check for errors and return the response or raise exceptions as needed
-                if response.status_code == 200:
-                    return response
-                else:
-                    print(f"Request to {url} failed with status code {response.status_code}: {response.text}")
-                    return response  # Return the Response object even on failure
-
-            except requests.exceptions.ConnectionError as e:
-                print(f"Connection error on attempt {attempt + 1}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2)
-                    continue
-                else:
-                    raise
+        token_refreshed = False
+        # One metrics entry per call: its latency and retries cover every attempt
+        start = time.perf_counter()
+        attempts = 0
+        response = None
 
-    def get_current_player(self):
-        return Request("https://auth.riotgames.com/userinfo", self.base_pvp_header, session=self.session).get_json()
-
-    def get_current_player_puuid(self):
-        return self.get_current_player()["sub"]
+        try:
+            for attempt in range(retries):
+                try:
+                    self.rate_limiter.acquire(url)
+                    attempts += 1
+                    response = self._send_pvp_request(url, header, method, json_data)
+
+                    # An expired or revoked token gets exactly one forced refresh and retry
+                    if response.status_code == 401 and not token_refreshed:
+                        token_refreshed = True
+                        header = self._refresh_auth_header(header)
+                        self.rate_limiter.acquire(url)
+                        attempts += 1
+                        response = self._send_pvp_request(url, header, method, json_data)
+
+                    # Rate limited: hold back every caller of this host, then retry
+                    if response.status_code == 429 and attempt < retries - 1:
+                        delay = parse_retry_after(response.headers.get('Retry-After'))
+                        if delay is None:
+                            delay = backoff_delay(attempt)
+                        logger.info("Rate limited by %s, retrying in %.2fs", url, delay)
+                        self.rate_limiter.penalize(url, delay)
+                        continue
+
+                    # Check for errors and return the response or raise exceptions as needed
+                    if response.status_code < 400:
+                        return response
+                    else:
+                        logger.log(logging.INFO if response.status_code == 404 else logging.WARNING,
+                                   "Request to %s failed with status code %s: %s", url, response.status_code, body(response))
+                        return response  # Return the Response object even on failure
+
+                except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as e:
+                    # The server may have acted on a request whose response timed out, so only GETs are retried
+                    if isinstance(e, requests.exceptions.ReadTimeout) and method != "GET":
+                        raise
+                    logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
+                    if attempt < retries - 1:
+                        time.sleep(backoff_delay(attempt, base=1.0))
+                        continue
+                    else:
+                        raise
+        except BaseException:
+            response = None
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record(method, url, response, time.perf_counter() - start, attempts)
 
     @classmethod
-    def init_from_lockFile(cls):
-        lockFile = cls.parse_lockfile()
-        return ValClient("127.0.0.1", lockFile["port"], "riot", lockFile["password"])
+    def init_from_lockFile(cls, lockfile_path=None, **kwargs):
+        lockFile = cls.parse_lockfile(lockfile_path)
+        return cls("127.0.0.1", lockFile["port"], "riot", lockFile["password"], **kwargs)
 
     @classmethod
-    def parse_lockfile(cls):
-        path_ = path.expandvars(r'%LOCALAPPDATA%\\VALORANT\\Saved\\Lockfile')
-        if not os.path.exists(path_):
-            path_ = path.expandvars(r'%LOCALAPPDATA%\\Riot Games\\Riot Client\\Config\\lockfile')
+    def parse_lockfile(cls, lockfile_path=None):
+        """Read the Riot client lockfile, from `lockfile_path` or the default install locations."""
+        path_ = lockfile_path
+        if path_ is None:
+            path_ = path.expandvars(r'%LOCALAPPDATA%\\VALORANT\\Saved\\Lockfile')
             if not os.path.exists(path_):
-                raise FileNotFoundError(f"Lockfile not found at {path_}. Is Valorant running?")
+                path_ = path.expandvars(r'%LOCALAPPDATA%\\Riot Games\\Riot Client\\Config\\lockfile')
+        if not os.path.exists(path_):
+            raise FileNotFoundError(f"Lockfile not found at {path_}. Is Valorant running?")
 
         with open(path_, "r") as lockFile:
             lockFileContent = lockFile.read()
@@ -277,8 +484,14 @@ class ValClient:
     """
 
 
+    def fetch_current_player(self):
+        return Request("https://auth.riotgames.com/userinfo", self.base_pvp_header, session=self.session,
+                       timeout=self.connections.timeout).get_json()
+
     def get_current_player(self):
-        return Request("https://auth.riotgames.com/userinfo", self.base_pvp_header).get_json()
+        """Return the logged-in player's userinfo, cached until the token subject changes."""
+        return self.identity.get_player()
 
     def get_current_player_puuid(self):
-        return self.get_current_player()["sub"]
+        """Return the logged-in player's PUUID without a remote request when the token carries it."""
+        return self.identity.puuid
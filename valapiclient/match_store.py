@@ -0,0 +1,148 @@
+import abc
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from os import path
+
+from .cache import default_cache_dir
+from .json_decoder import loads
+
+
+class MatchStore(abc.ABC):
+    """
+    Interface for stores of immutable match-details responses, keyed by match ID.
+
+    PvPEndpoints.get_match_details consults the store before the network and
+    saves completed matches into it. Subclasses implement `get` and `put`.
+    """
+
+    @abc.abstractmethod
+    def get(self, match_id):
+        """Return the stored match details, or None."""
+
+    @abc.abstractmethod
+    def put(self, match_id, match_details):
+        """Store the match details of a completed match."""
+
+    def __contains__(self, match_id):
+        return self.get(match_id) is not None
+
+    def stats(self):
+        return {}
+
+
+class SQLiteMatchStore(MatchStore):
+    """
+    Match store backed by a single SQLite file with zlib-compressed payloads.
+
+    When the compressed payloads exceed `max_bytes`, the least recently read
+    matches are evicted.
+
+    Args:
+        directory (str): Cache directory. Defaults to default_cache_dir().
+        max_bytes (int): Size budget for the compressed payloads.
+        compression_level (int): zlib level, 1 (fastest) to 9 (smallest).
+    """
+
+    FILENAME = "match_details.sqlite3"
+
+    def __init__(self, directory=None, max_bytes=512 * 1024 * 1024, compression_level=6):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = path.join(self.directory, self.FILENAME)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "match_id TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS matches_accessed_at ON matches (accessed_at)")
+        self._db.commit()
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()[0]
+
+    def get(self, match_id):
+        with self._lock:
+            row = self._db.execute("SELECT payload FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute("UPDATE matches SET accessed_at = ? WHERE match_id = ?", (time.time(), match_id))
+            self._db.commit()
+        return loads(zlib.decompress(row[0]))
+
+    def put(self, match_id, match_details):
+        payload = zlib.compress(json.dumps(match_details, separators=(",", ":")).encode("utf-8"),
+                                self.compression_level)
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO matches (match_id, payload, size, accessed_at) VALUES (?, ?, ?, ?)",
+                (match_id, payload, len(payload), time.time())
+            )
+            self._total_bytes += len(payload) - (previous[0] if previous else 0)
+            self._evict()
+            self._db.commit()
+
+    def __contains__(self, match_id):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM matches WHERE match_id = ?", (match_id,)).fetchone() is not None
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            row = self._db.execute(
+                "SELECT match_id, size FROM matches ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM matches WHERE match_id = ?", (row[0],))
+            self._total_bytes -= row[1]
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM matches")
+            self._db.commit()
+            self._db.execute("VACUUM")
+            self._total_bytes = 0
+
+    def disk_usage(self):
+        """Bytes used on disk by the store's database, its write-ahead log included."""
+        total = 0
+        # The cache directory is shared with other caches, so only this database's files count
+        for filename in (self.path, self.path + "-wal", self.path + "-shm"):
+            try:
+                total += os.stat(filename).st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def stats(self):
+        """
+        Returns:
+            dict: Stored matches, compressed payload bytes, database size on disk,
+            hits, misses and hit rate since the store was opened.
+        """
+        with self._lock:
+            count = self._db.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "matches": count,
+                "payload_bytes": self._total_bytes,
+                "disk_bytes": self.disk_usage(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
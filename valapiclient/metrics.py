@@ -0,0 +1,196 @@
+"""
+Per-endpoint request metrics with a Prometheus text exposition.
+
+ValClient.handle_pvp_request and handle_local_request (and their async twins)
+record every call in `api.metrics`, keyed by method and endpoint template
+('mmr/v1/players/{puuid}', see instrumentation.endpoint_template), so ten
+thousand players' lookups are one series. A call is one entry however many
+attempts it took: its latency covers every attempt and its retries are counted
+separately.
+"""
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .instrumentation import url_endpoint
+
+# Upper bounds in seconds of the latency histogram buckets, plus an implicit +Inf
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class EndpointMetrics:
+    """Counters and latency histogram of one method and endpoint template."""
+
+    __slots__ = ("requests", "errors", "retries", "bytes_in", "bytes_out", "latency_sum", "latency_max", "buckets")
+
+    def __init__(self, bucket_count):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # Non-cumulative counts per bucket; the last one is +Inf
+        self.buckets = [0] * (bucket_count + 1)
+
+
+def _quantile(bounds, counts, total, q):
+    """Estimate a quantile from histogram counts, interpolating inside the bucket it falls in."""
+    if not total:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= rank:
+            lower = bounds[index - 1] if index else 0.0
+            if index == len(bounds):
+                return lower
+            return lower + (bounds[index] - lower) * (rank - seen) / count
+        seen += count
+    return bounds[-1]
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics:
+    """
+    Request counts, errors, retries, bytes and latency per endpoint, shared by every thread of a client.
+
+    Recording one call costs a dict lookup and a few additions under a lock (see
+    benchmarks/bench_metrics), so it can stay on in production.
+
+    Args:
+        buckets (tuple): Ascending upper bounds in seconds of the latency histogram.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, url, response, elapsed, attempts=1, bytes_out=None):
+        """
+        Record one call.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL requested; only its path's endpoint template is kept.
+            response: The final requests.Response, or None if the call raised or got no response.
+                Statuses of 400 and above count as errors.
+            elapsed (float): Seconds for the whole call, every attempt included.
+            attempts (int): Requests sent for the call; every one after the first is a retry.
+            bytes_out (int): Request body size; defaults to the size of `response.request.body`.
+        """
+        key = (method, url_endpoint(url))
+        error = response is None or response.status_code >= 400
+        bytes_in = len(response.content or b"") if response is not None else 0
+        if bytes_out is None:
+            body = getattr(getattr(response, "request", None), "body", None)
+            bytes_out = len(body) if body else 0
+        bucket = bisect_left(self.buckets, elapsed)
+
+        with self._lock:
+            entry = self._endpoints.get(key)
+            if entry is None:
+                entry = self._endpoints[key] = EndpointMetrics(len(self.buckets))
+            entry.requests += 1
+            entry.errors += error
+            entry.retries += max(0, attempts - 1)
+            entry.bytes_in += bytes_in
+            entry.bytes_out += bytes_out
+            entry.latency_sum += elapsed
+            if elapsed > entry.latency_max:
+                entry.latency_max = elapsed
+            entry.buckets[bucket] += 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def _copy(self):
+        with self._lock:
+            return [(key, entry.requests, entry.errors, entry.retries, entry.bytes_in, entry.bytes_out,
+                     entry.latency_sum, entry.latency_max, list(entry.buckets))
+                    for key, entry in sorted(self._endpoints.items())]
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: "<METHOD> <endpoint>" -> {"requests", "errors", "retries", "bytes_in", "bytes_out",
+                "latency"}, where "latency" holds "mean", "p50", "p90", "p99" and "max" in seconds
+                (the percentiles are estimated from the histogram) and "buckets", upper bound -> count.
+        """
+        result = {}
+        for (method, endpoint), requests, errors, retries, bytes_in, bytes_out, total, peak, counts in self._copy():
+            latency = {"mean": total / requests if requests else 0.0, "max": peak}
+            for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+                latency[name] = min(_quantile(self.buckets, counts, requests, q), peak)
+            latency["buckets"] = dict(zip(self.buckets + (float("inf"),), counts))
+            result[f"{method} {endpoint}"] = {"requests": requests, "errors": errors, "retries": retries,
+                                              "bytes_in": bytes_in, "bytes_out": bytes_out, "latency": latency}
+        return result
+
+    def to_prometheus(self, prefix="valapiclient"):
+        """Every series in the Prometheus text exposition format."""
+        counters = (
+            ("requests_total", "Requests by endpoint", 1),
+            ("request_errors_total", "Requests that failed or returned a status of 400 or above", 2),
+            ("request_retries_total", "Retried attempts (429, 401 and connection errors)", 3),
+            ("response_bytes_total", "Response body bytes received", 4),
+            ("request_bytes_total", "Request body bytes sent", 5),
+        )
+        rows = self._copy()
+        labels = [f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"' for (method, endpoint), *_ in rows]
+        lines = []
+        for name, help_text, column in counters:
+            lines.append(f"# HELP {prefix}_{name} {help_text}.")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(f"{prefix}_{name}{{{label}}} {row[column]}" for label, row in zip(labels, rows))
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Request latency, every attempt included.")
+        lines.append(f"# TYPE {name} histogram")
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        for label, row in zip(labels, rows):
+            cumulative = 0
+            for bound, count in zip(bounds, row[8]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{label}}} {row[6]!r}")
+            lines.append(f"{name}_count{{{label}}} {row[1]}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=9464, host="127.0.0.1"):
+        """
+        Serve `to_prometheus()` at http://host:port/metrics from a daemon thread.
+
+        Returns:
+            ThreadingHTTPServer: The server; call shutdown() to stop it. Pass port=0 for a
+            free port and read it from `server.server_address`.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                payload = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="valapiclient-metrics", daemon=True).start()
+        return server
@@ -0,0 +1,302 @@
+import base64
+import json
+
+# Cost key of Valorant Points in storefront offers
+VP_CURRENCY_ID = "85ad13f7-3d1b-5128-9eb2-7cd8ee0b5741"
+
+# Socket IDs in core-game loadouts
+SKIN_SOCKET = "bcef87d6-209b-46c6-8b19-fbe40bd95abc"
+SKIN_LEVEL_SOCKET = "e7c63390-eda7-46e0-bb7a-a6abdacd2433"
+CHROMA_SOCKET = "3ad1b2b2-acdb-4524-852f-954a76ddae0a"
+BUDDY_SOCKET = "77258665-71d1-4623-bc72-44db9bd5b3b3"
+
+
+class _Unparsed:
+    """Raw JSON of a section that hasn't been accessed yet."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class section:
+    """
+    A nested section of a model, parsed by `parse(raw)` on first access and cached.
+
+    Until then only the raw JSON value is kept, so callers that never read the
+    section don't pay for building its models.
+    """
+
+    def __init__(self, key, parse):
+        self.key = key
+        self.parse = parse
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if type(value) is _Unparsed:
+            value = self.parse(value.value)
+            setattr(instance, self.slot, value)
+        return value
+
+
+def list_of(model):
+    """Parser for a JSON list of `model` objects (None becomes an empty list)."""
+    return lambda items: [model(item) for item in items or ()]
+
+
+class Model:
+    """
+    Base class of the typed response models.
+
+    Subclasses list their scalar attributes in FIELDS (attribute -> JSON key), which
+    are copied on construction, and their nested sections as `section` attributes,
+    which are parsed lazily. Both need a matching entry in `__slots__` (sections as
+    `_<name>`). Keys that aren't declared are dropped; use the raw endpoint methods
+    when you need them.
+    """
+
+    __slots__ = ()
+    FIELDS = {}
+    SECTIONS = ()
+    _section_slots = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._section_slots = tuple((getattr(cls, name).slot, getattr(cls, name).key) for name in cls.SECTIONS)
+
+    def __init__(self, data):
+        data = data or {}
+        for attribute, key in self.FIELDS.items():
+            setattr(self, attribute, data.get(key))
+        for slot, key in self._section_slots:
+            setattr(self, slot, _Unparsed(data.get(key)))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build the model from a decoded response, or return None for a failed request's None."""
+        return None if data is None else cls(data)
+
+    def __repr__(self):
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute in list(self.FIELDS)[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+class PlayerIdentity(Model):
+    __slots__ = ("account_level", "player_card_id", "player_title_id", "incognito", "hide_account_level")
+    FIELDS = {
+        "account_level": "AccountLevel",
+        "player_card_id": "PlayerCardID",
+        "player_title_id": "PlayerTitleID",
+        "incognito": "Incognito",
+        "hide_account_level": "HideAccountLevel",
+    }
+
+
+class Player(Model):
+    """A player in a core-game or pregame match, or a party member."""
+
+    __slots__ = ("puuid", "team_id", "character_id", "character_selection_state", "competitive_tier",
+                 "is_owner", "is_ready", "_identity")
+    FIELDS = {
+        "puuid": "Subject",
+        "team_id": "TeamID",
+        "character_id": "CharacterID",
+        "character_selection_state": "CharacterSelectionState",
+        "competitive_tier": "CompetitiveTier",
+        "is_owner": "IsOwner",
+        "is_ready": "IsReady",
+    }
+    SECTIONS = ("identity",)
+    identity = section("PlayerIdentity", PlayerIdentity)
+
+
+class Match(Model):
+    """A `core-game/v1/matches/{match_id}` response."""
+
+    __slots__ = ("match_id", "version", "state", "map_id", "mode_id", "provisioning_flow", "game_pod_id",
+                 "_players")
+    FIELDS = {
+        "match_id": "MatchID",
+        "version": "Version",
+        "state": "State",
+        "map_id": "MapID",
+        "mode_id": "ModeID",
+        "provisioning_flow": "ProvisioningFlow",
+        "game_pod_id": "GamePodID",
+    }
+    SECTIONS = ("players",)
+    players = section("Players", list_of(Player))
+
+    def player(self, puuid):
+        """Return the Player with `puuid`, or None."""
+        return next((player for player in self.players if player.puuid == puuid), None)
+
+
+class Party(Model):
+    """A `parties/v1/parties/{party_id}` response."""
+
+    __slots__ = ("party_id", "version", "state", "accessibility", "eligible_queues", "_members", "_matchmaking")
+    FIELDS = {
+        "party_id": "ID",
+        "version": "Version",
+        "state": "State",
+        "accessibility": "Accessibility",
+        "eligible_queues": "EligibleQueues",
+    }
+    SECTIONS = ("members", "matchmaking")
+    members = section("Members", list_of(Player))
+    matchmaking = section("MatchmakingData", lambda data: data or {})
+
+    @property
+    def queue_id(self):
+        return self.matchmaking.get("QueueID")
+
+    @property
+    def owner(self):
+        return next((member for member in self.members if member.is_owner), None)
+
+
+class Offer(Model):
+    __slots__ = ("offer_id", "is_direct_purchase", "start_date", "_cost", "_rewards")
+    FIELDS = {"offer_id": "OfferID", "is_direct_purchase": "IsDirectPurchase", "start_date": "StartDate"}
+    SECTIONS = ("cost", "rewards")
+    cost = section("Cost", lambda data: data or {})
+    rewards = section("Rewards", lambda data: data or [])
+
+    @property
+    def vp_cost(self):
+        return self.cost.get(VP_CURRENCY_ID)
+
+    @property
+    def item_id(self):
+        return self.rewards[0].get("ItemID") if self.rewards else None
+
+
+class Storefront(Model):
+    """A `store/v2/storefront/{puuid}` response."""
+
+    __slots__ = ("_skins_panel", "_bundles", "_night_market")
+    SECTIONS = ("skins_panel", "bundles", "night_market")
+    skins_panel = section("SkinsPanelLayout", lambda data: data or {})
+    bundles = section("FeaturedBundle", lambda data: (data or {}).get("Bundles") or [])
+    night_market = section("BonusStore", lambda data: None if data is None else
+                           [Offer(offer.get("Offer")) for offer in data.get("BonusStoreOffers") or []])
+
+    @property
+    def daily_offers(self):
+        """The daily skin offers as Offer objects (built on each access; keep the list if you reuse it)."""
+        return [Offer(offer) for offer in self.skins_panel.get("SingleItemStoreOffers") or []]
+
+    @property
+    def daily_remaining_seconds(self):
+        return self.skins_panel.get("SingleItemOffersRemainingDurationInSeconds")
+
+
+class WeaponLoadout(Model):
+    __slots__ = ("weapon_id", "_sockets")
+    FIELDS = {"weapon_id": "ID"}
+    SECTIONS = ("sockets",)
+    sockets = section("Sockets", lambda data: {
+        socket_id: (socket.get("Item") or {}).get("ID") for socket_id, socket in (data or {}).items()
+    })
+
+    @property
+    def skin_id(self):
+        return self.sockets.get(SKIN_SOCKET)
+
+    @property
+    def skin_level_id(self):
+        return self.sockets.get(SKIN_LEVEL_SOCKET)
+
+    @property
+    def chroma_id(self):
+        return self.sockets.get(CHROMA_SOCKET)
+
+    @property
+    def buddy_id(self):
+        return self.sockets.get(BUDDY_SOCKET)
+
+
+class Loadout(Model):
+    """One player's entry of a `core-game/v1/matches/{match_id}/loadouts` response."""
+
+    __slots__ = ("character_id", "puuid", "_weapons")
+    FIELDS = {"character_id": "CharacterID"}
+    SECTIONS = ("weapons",)
+    weapons = section("Items", lambda data: {weapon_id: WeaponLoadout(item) for weapon_id, item in (data or {}).items()})
+
+    def __init__(self, data):
+        data = data or {}
+        loadout = data.get("Loadout") or {}
+        super().__init__(dict(loadout, CharacterID=data.get("CharacterID")))
+        self.puuid = loadout.get("Subject")
+
+    @classmethod
+    def list_from_dict(cls, data):
+        """Build the Loadout of every player in a loadouts response."""
+        return None if data is None else [cls(entry) for entry in data.get("Loadouts") or []]
+
+
+def decode_private(blob):
+    """Decode the base64 JSON `private` field of a presence. Returns {} for an empty or malformed blob."""
+    if not blob:
+        return {}
+    try:
+        return json.loads(base64.b64decode(blob))
+    except (ValueError, TypeError):
+        return {}
+
+
+class PresenceDetails(Model):
+    """
+    The decoded `private` blob of a Valorant presence.
+
+    Newer clients nest the fields under matchPresenceData, partyPresenceData and
+    playerPresenceData; older ones send them flat. Both are accepted.
+    """
+
+    __slots__ = ("session_loop_state", "queue_id", "match_map", "party_id", "party_size", "party_state",
+                 "party_accessibility", "is_idle", "competitive_tier", "account_level")
+    FIELDS = {
+        "session_loop_state": "sessionLoopState",
+        "queue_id": "queueId",
+        "match_map": "matchMap",
+        "party_id": "partyId",
+        "party_size": "partySize",
+        "party_state": "partyState",
+        "party_accessibility": "partyAccessibility",
+        "is_idle": "isIdle",
+        "competitive_tier": "competitiveTier",
+        "account_level": "accountLevel",
+    }
+
+    def __init__(self, data):
+        data = data or {}
+        flat = dict(data)
+        for nested in ("matchPresenceData", "partyPresenceData", "playerPresenceData"):
+            flat.update(data.get(nested) or {})
+        super().__init__(flat)
+
+
+class Presence(Model):
+    """An entry of `chat/v4/presences`; `details` decodes the private blob on first access."""
+
+    __slots__ = ("puuid", "game_name", "game_tag", "product", "state", "_details")
+    FIELDS = {"puuid": "puuid", "game_name": "game_name", "game_tag": "game_tag", "product": "product",
+              "state": "state"}
+    SECTIONS = ("details",)
+    details = section("private", lambda blob: PresenceDetails(decode_private(blob)))
+
+    @classmethod
+    def list_from_dict(cls, presences, product="valorant"):
+        """Build a Presence for every entry of `product` (all products if None)."""
+        if presences is None:
+            return None
+        return [cls(entry) for entry in presences if product is None or entry.get("product") == product]
@@ -0,0 +1,142 @@
+import threading
+from concurrent.futures import Future, wait
+
+from .batch import run_batch
+from .cache import MISSING, TTLCache
+
+
+class NameResolver:
+    """
+    Resolves PUUIDs to names through name-service/v2/players with batching and caching.
+
+    Lookups from any number of threads that arrive within `window` seconds are
+    coalesced into batched PUTs of at most `max_batch_size` PUUIDs. Results are kept
+    in an LRU cache for `ttl` seconds, and a PUUID that is already being looked up
+    is never requested twice.
+
+    Args:
+        pvp (PvPEndpoints): Endpoints used to send the name-service requests.
+        window (float): Seconds to wait for more lookups before sending a batch.
+        max_batch_size (int): Maximum PUUIDs per name-service request.
+        cache_size (int): Maximum cached names.
+        ttl (float): Seconds a cached name stays valid.
+    """
+
+    def __init__(self, pvp, window=0.02, max_batch_size=100, cache_size=10000, ttl=3600):
+        self.pvp = pvp
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.cache = TTLCache(maxsize=cache_size, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.batches = 0
+        self._queue = {}
+        self._in_flight = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Cache hits and misses, lookups coalesced into another caller's
+            request, name-service requests sent and the number of cached names.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "coalesced": self.coalesced,
+                "requests": self.batches,
+                "cached": len(self.cache),
+            }
+
+    def resolve(self, puuids, timeout=None):
+        """
+        Look up names for many PUUIDs.
+
+        Args:
+            puuids (iterable): Player UUIDs.
+            timeout (float): Seconds to wait for pending lookups, or None to wait indefinitely.
+
+        Returns:
+            dict: Maps each PUUID to its name-service entry ({"Subject", "GameName", "TagLine", ...}),
+            or None if the lookup failed or the player wasn't found.
+        """
+        results = {}
+        futures = {}
+        flush_now = False
+
+        with self._lock:
+            for puuid in dict.fromkeys(puuids):
+                entry = self.cache.get(puuid)
+                if entry is not MISSING:
+                    self.hits += 1
+                    results[puuid] = entry
+                    continue
+
+                self.misses += 1
+                future = self._queue.get(puuid) or self._in_flight.get(puuid)
+                if future is not None:
+                    self.coalesced += 1
+                else:
+                    future = self._queue[puuid] = Future()
+                futures[puuid] = future
+
+            if len(self._queue) >= self.max_batch_size:
+                flush_now = True
+            elif self._queue and self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self._flush()
+
+        wait(futures.values(), timeout=timeout)
+        for puuid, future in futures.items():
+            results[puuid] = future.result() if future.done() and not future.exception() else None
+        return results
+
+    def resolve_one(self, puuid, timeout=None):
+        """Look up the name-service entry of a single PUUID."""
+        return self.resolve([puuid], timeout=timeout).get(puuid)
+
+    def invalidate(self, puuid=None):
+        """Drop one PUUID, or every PUUID, from the cache."""
+        if puuid is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(puuid)
+
+    def _flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            queue, self._queue = self._queue, {}
+            self._in_flight.update(queue)
+            puuids = list(queue)
+            chunks = [puuids[i:i + self.max_batch_size] for i in range(0, len(puuids), self.max_batch_size)]
+            self.batches += len(chunks)
+
+        if not chunks:
+            return
+
+        for result in run_batch(self.pvp.fetch_player_names, chunks, max_workers=4):
+            entries = {} if result.error else {entry.get("Subject"): entry for entry in result.value or []}
+            for puuid in result.key:
+                future = queue[puuid]
+                if result.error:
+                    future.set_exception(result.error)
+                    continue
+                entry = entries.get(puuid)
+                if entry is not None:
+                    self.cache.set(puuid, entry)
+                future.set_result(entry)
+
+        with self._lock:
+            for puuid in queue:
+                self._in_flight.pop(puuid, None)
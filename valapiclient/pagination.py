@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_pages(fetch_page, items_key, page_size=20, start_index=0, total_key=None, until=None, prefetch=True):
+    """
+    Yield the items of a paged endpoint, one page request at a time.
+
+    Paging stops at the server-reported total (when `total_key` is given, otherwise
+    on a short page), on an empty page, or when `until` matches an item. While the caller works
+    through a page, the next one is already being fetched on a background worker.
+
+    Args:
+        fetch_page (callable): `fetch_page(start_index, end_index)` returning the page as a dict.
+            Exceptions it raises are re-raised to the caller.
+        items_key (str): Key of the item list in each page, e.g. "History".
+        page_size (int): Items requested per page.
+        start_index (int): Index of the first item.
+        total_key (str): Key of the total item count in each page, e.g. "Total", if the endpoint reports one.
+        until (callable): Predicate on an item; iteration stops before the first item it matches,
+            and the page after a matching one is never requested.
+        prefetch (bool): Fetch the next page in the background while the current one is consumed.
+
+    Yields:
+        dict: One item per iteration, in server order.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def request(start):
+        """Return a callable producing the page, started right away if prefetching."""
+        if executor is None:
+            return lambda: fetch_page(start, start + page_size)
+        return executor.submit(fetch_page, start, start + page_size).result
+
+    try:
+        start = start_index
+        pending = request(start)
+        while pending is not None:
+            page = pending()
+            items = page.get(items_key) or []
+            total = page.get(total_key) if total_key else None
+
+            # Check `until` before queueing the next page, so stopping never fetches one too many
+            stop = next((index for index, item in enumerate(items) if until(item)), None) if until else None
+            if stop is not None:
+                yield from items[:stop]
+                return
+
+            start += len(items)
+            more = bool(items) and (start < total if total is not None else len(items) >= page_size)
+            pending = request(start) if more else None
+            yield from items
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
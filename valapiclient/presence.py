@@ -0,0 +1,208 @@
+import logging
+import threading
+from collections import defaultdict
+
+from .cache import MISSING, TTLCache
+from .models import PresenceDetails, decode_private
+
+logger = logging.getLogger(__name__)
+
+# Change kind -> PresenceDetails attributes compared to detect it
+WATCHED_FIELDS = {
+    "state": ("session_loop_state",),
+    "party": ("party_id", "party_size", "party_state"),
+    "queue": ("queue_id",),
+    "rank": ("competitive_tier",),
+}
+
+
+class PresenceChange:
+    """
+    One player's presence change between two updates.
+
+    Attributes:
+        puuid (str): The player.
+        previous (PresenceDetails): Details before the change, or None if the player just came online.
+        current (PresenceDetails): Details after the change, or None if the player went offline.
+        changes (tuple): Kinds that changed: 'online', 'offline', or any of 'state', 'party',
+            'queue' and 'rank' (see WATCHED_FIELDS).
+    """
+
+    __slots__ = ("puuid", "previous", "current", "changes")
+
+    def __init__(self, puuid, previous, current, changes):
+        self.puuid = puuid
+        self.previous = previous
+        self.current = current
+        self.changes = changes
+
+    def __repr__(self):
+        return f"PresenceChange(puuid={self.puuid!r}, changes={self.changes!r})"
+
+
+def _changes(previous, current):
+    return tuple(kind for kind, attributes in WATCHED_FIELDS.items()
+                 if any(getattr(previous, attribute) != getattr(current, attribute) for attribute in attributes))
+
+
+class PresenceTracker:
+    """
+    Decoded Valorant presences of the player and their friends, reported as diffs.
+
+    Each update compares every entry's base64 `private` blob with the one seen last
+    for that player, so unchanged players cost a string comparison. Changed blobs
+    are decoded through an LRU cache keyed by the blob, so a blob that was seen
+    before (a friend flipping back to the menus, or the same party state shared
+    by several members) is decoded once. Only players whose state, party, queue or
+    rank changed, came online or went offline are reported.
+
+    Args:
+        api (ValClient): Client used to fetch `chat/v4/presences`.
+        cache_size (int): Maximum decoded blobs kept.
+    """
+
+    def __init__(self, api, cache_size=4096):
+        self.api = api
+        self.decoded = TTLCache(maxsize=cache_size)
+        # Counters: blobs decoded, blobs found in the cache, entries skipped because their blob didn't change
+        self.decodes = 0
+        self.cache_hits = 0
+        self.unchanged = 0
+        self._blobs = {}
+        self._details = {}
+        self._callbacks = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def stats(self):
+        with self._lock:
+            return {"players": len(self._details), "decodes": self.decodes, "cache_hits": self.cache_hits,
+                    "unchanged": self.unchanged, "cached": len(self.decoded)}
+
+    @property
+    def snapshot(self):
+        """PUUID -> PresenceDetails of every player in the last update."""
+        with self._lock:
+            return dict(self._details)
+
+    def get(self, puuid):
+        """Return the last PresenceDetails of `puuid`, or None if they are offline."""
+        return self._details.get(puuid)
+
+    def on(self, kind, callback):
+        """
+        Call `callback(change)` for changes of `kind` ('state', 'party', 'queue', 'rank',
+        'online', 'offline') or '*' for every change. A change is passed once per callback
+        even if several of its kinds match.
+        """
+        with self._lock:
+            self._callbacks[kind].append(callback)
+        return self
+
+    def off(self, kind, callback):
+        with self._lock:
+            if callback in self._callbacks.get(kind, ()):
+                self._callbacks[kind].remove(callback)
+        return self
+
+    def decode(self, blob):
+        """Decode a `private` blob to PresenceDetails, reusing the result for a blob seen before."""
+        details = self.decoded.get(blob)
+        if details is MISSING:
+            details = PresenceDetails(decode_private(blob))
+            self.decoded.set(blob, details)
+            self.decodes += 1
+        else:
+            self.cache_hits += 1
+        return details
+
+    def update(self, presences=None, complete=True):
+        """
+        Apply a list of presence entries and return what changed.
+
+        Args:
+            presences (list): Entries to apply instead of fetching `chat/v4/presences`.
+            complete (bool): The entries are every online player, so players missing from
+                them went offline. Pass False for partial updates such as presence events.
+
+        Returns:
+            list: PresenceChange for every player that changed, or None if the presences couldn't be fetched.
+        """
+        if presences is None:
+            presences = self.api.local.get_presence()
+            if presences is None:
+                return None
+
+        changes = []
+        with self._lock:
+            seen = set()
+            for entry in presences:
+                if entry.get("product") != "valorant":
+                    continue
+                puuid = entry.get("puuid")
+                blob = entry.get("private")
+                seen.add(puuid)
+                if puuid in self._blobs and self._blobs[puuid] == blob:
+                    self.unchanged += 1
+                    continue
+                self._blobs[puuid] = blob
+
+                current = self.decode(blob)
+                previous = self._details.get(puuid)
+                self._details[puuid] = current
+                kinds = ("online",) if previous is None else _changes(previous, current)
+                if kinds:
+                    changes.append(PresenceChange(puuid, previous, current, kinds))
+
+            if complete:
+                for puuid in [puuid for puuid in self._details if puuid not in seen]:
+                    changes.append(PresenceChange(puuid, self._details.pop(puuid), None, ("offline",)))
+                    self._blobs.pop(puuid, None)
+            callbacks = {kind: list(targets) for kind, targets in self._callbacks.items()}
+
+        self._notify(changes, callbacks)
+        return changes
+
+    def remove(self, puuids):
+        """Forget players that went offline; returns their PresenceChanges."""
+        with self._lock:
+            changes = [PresenceChange(puuid, self._details.pop(puuid), None, ("offline",))
+                       for puuid in puuids if puuid in self._details]
+            for puuid in puuids:
+                self._blobs.pop(puuid, None)
+            callbacks = {kind: list(targets) for kind, targets in self._callbacks.items()}
+        self._notify(changes, callbacks)
+        return changes
+
+    def _notify(self, changes, callbacks):
+        if not callbacks:
+            return
+        for change in changes:
+            targets = list(callbacks.get("*", ()))
+            for kind in change.changes:
+                targets.extend(callback for callback in callbacks.get(kind, ()) if callback not in targets)
+            for callback in targets:
+                try:
+                    callback(change)
+                except Exception:
+                    logger.exception("Error in presence callback %r", callback)
+
+    def _handle_event(self, event):
+        presences = (event.data or {}).get("presences") or []
+        if event.event_type == "Delete":
+            self.remove([entry.get("puuid") for entry in presences])
+        else:
+            self.update(presences, complete=False)
+
+    def follow_events(self):
+        """
+        Apply presence events from `api.events` as they arrive; starts the event stream.
+
+        Returns:
+            PresenceTracker: self, after one full update from `chat/v4/presences`.
+        """
+        self.api.events.subscribe("presences").on("presences", self._handle_event).start()
+        self.update()
+        return self
+
+    def stop(self):
+        self.api.events.off("presences", self._handle_event)
@@ -0,0 +1,142 @@
+import email.utils
+import math
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Longest Retry-After honoured, in seconds; also the cap of backoff_delay
+MAX_DELAY = 30.0
+
+# (requests per second, burst) per PvP host class. Hosts that match no class are not limited.
+DEFAULT_BUDGETS = {
+    "pd": (10.0, 20),
+    "glz": (10.0, 20),
+    "shared": (10.0, 20),
+}
+
+
+def host_class(url):
+    """
+    Classify a URL by the PvP host it targets.
+
+    Returns:
+        str: "pd", "glz" or "shared" for the Riot PvP hosts, "default" otherwise.
+    """
+    hostname = urlsplit(url).hostname or ""
+    if hostname.startswith("pd."):
+        return "pd"
+    if hostname.startswith("glz-"):
+        return "glz"
+    if hostname.startswith("shared."):
+        return "shared"
+    return "default"
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Returns:
+        float: Seconds to wait, at most MAX_DELAY, or None if the header is missing or
+            malformed ("inf" and "nan" included).
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        delay = retry_at.timestamp() - time.time()
+    if not math.isfinite(delay):
+        return None
+    return min(MAX_DELAY, max(0.0, delay))
+
+
+def backoff_delay(attempt, base=0.5, cap=MAX_DELAY):
+    """Exponential backoff with full jitter for the given zero-based attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so the bucket
+    works for both blocking and asyncio callers. A bucket with no rate never runs
+    out of tokens but still honours `block_for`.
+    """
+
+    def __init__(self, rate=None, capacity=1):
+        self.rate = float(rate) if rate else None
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.rate is None:
+            self._tokens = self.capacity
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def block_for(self, seconds):
+        """Hold back every caller for `seconds`, e.g. after a 429 response."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+class RateLimiter:
+    """
+    Per-host rate limiter shared by every thread using a ValClient.
+
+    Args:
+        budgets (dict): Maps a host class ("pd", "glz", "shared" or "default") to
+            (requests per second, burst), or None to leave it unlimited.
+            Missing classes use DEFAULT_BUDGETS.
+        classify (callable): Maps a URL to its host class; host_class by default.
+    """
+
+    def __init__(self, budgets=None, classify=host_class):
+        budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self.classify = classify
+        self.buckets = {"default": TokenBucket()}
+        for name, budget in budgets.items():
+            self.buckets[name] = TokenBucket(*budget) if budget else TokenBucket()
+
+    def _bucket(self, url):
+        # A class without a budget of its own (e.g. from a custom classify) shares "default"
+        return self.buckets.get(self.classify(url), self.buckets["default"])
+
+    def reserve(self, url):
+        """Reserve a request slot for `url` and return the seconds to wait before sending."""
+        return self._bucket(url).reserve()
+
+    def acquire(self, url):
+        """Block until a request to `url` fits in its host's budget."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, url, seconds):
+        """Pause all requests to the host of `url` for `seconds`."""
+        self._bucket(url).block_for(seconds)
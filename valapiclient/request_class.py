@@ -1,44 +1,89 @@
+import logging
+import threading
+
 import requests
 import json
 from urllib3.exceptions import InsecureRequestWarning
+from .connections import DEFAULT_TIMEOUT
+from .instrumentation import body
+from .json_decoder import decode_response
 
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
+logger = logging.getLogger(__name__)
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def default_session():
+    """
+    Session shared by every Request created without one, so they reuse connections.
+
+    Requests sent on it don't verify certificates, like the per-Request sessions it replaces.
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = requests.Session()
+    return _default_session
+
+
 class Request:
-    def __init__(self, url, access_token=None, session=None):
-        self.session = session if session else requests.Session()
-        self.session.verify = False  # Ensure SSL verification is disabled
+    """
+    One request to `url` with per-request headers.
+
+    The session is never modified, so one session can be shared by every thread:
+    `access_token` (a headers mapping) and `verify` are passed with each call.
+
+    Args:
+        url (str): The URL.
+        access_token (Mapping): Headers to send, e.g. ValClient.auth_headers.
+        session (requests.Session): Session to send with; defaults to one shared by all Requests,
+            on which certificates aren't verified unless `verify` says otherwise.
+        timeout: Seconds or (connect, read).
+        verify: Certificate verification for this request; None uses the session's setting.
+    """
+
+    def __init__(self, url, access_token=None, session=None, timeout=DEFAULT_TIMEOUT, verify=None):
+        if session is None:
+            session = default_session()
+            verify = False if verify is None else verify
+        self.session = session
         self.url = url
+        self.headers = access_token
+        self.timeout = timeout
+        self.verify = verify
 
-        if access_token:
-            self.session.headers.update(access_token)
+    def _send(self, method, **kwargs):
+        if self.verify is not None:
+            kwargs["verify"] = self.verify
+        return self.session.request(method, self.url, headers=self.headers, timeout=self.timeout, **kwargs)
 
     def get_json(self):
-        response = self.session.get(self.url)
+        response = self._send("GET")
 
-        # Log response status and content for debugging
-        print(f"Request URL: {self.url}")
-        print(f"Response Status Code: {response.status_code}")
-        print(f"Response Content: {response.text}")  # This will help you see what's coming back
+        logger.debug("GET %s -> %s: %s", self.url, response.status_code, body(response))
 
         # Check if the response is empty
-        if response.status_code == 200 and response.text.strip():  # Ensure the response is not empty
+        if response.status_code == 200 and response.content.strip():  # Raw bytes, so no charset detection
             try:
-                return response.json()  # Parse JSON if available
+                return decode_response(response)  # Parse JSON if available
             except ValueError:
-                print("Error: Response is not valid JSON.")
+                logger.warning("Response from %s is not valid JSON: %s", self.url, body(response))
                 return None  # Handle the case where the response isn't valid JSON
         else:
-            print(f"Error: Unexpected status code {response.status_code} or empty response.")
+            logger.warning("Unexpected status code %s or empty response from %s", response.status_code, self.url)
             return None  # Return None if the response is empty or the status code is not 200
 
     def post(self, value=None):
         if value:
-            return self.session.post(self.url, json=value).status_code
-        return self.session.post(self.url).status_code
+            return self._send("POST", json=value).status_code
+        return self._send("POST").status_code
 
     def put(self, value):
-        return self.session.put(self.url, json=value).status_code
+        return self._send("PUT", json=value).status_code
 
     def delete(self, value=None):
-        return self.session.delete(self.url, json=value).status_code
+        return self._send("DELETE", json=value).status_code
@@ -0,0 +1,107 @@
+import base64
+import json
+import threading
+import time
+
+
+def decode_jwt_claims(token):
+    """
+    Decode the claims of a JWT without verifying its signature.
+
+    Args:
+        token (str): The encoded JWT.
+
+    Returns:
+        dict: The token claims, or an empty dict if the token can't be decoded.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+class TokenManager:
+    """
+    Caches the access token and entitlements JWT of the local client.
+
+    Tokens are refreshed `refresh_margin` seconds before the earliest `exp`
+    claim of the two tokens. Refreshes are single-flight: concurrent callers
+    wait for the refresh already in progress instead of starting their own.
+    """
+
+    def __init__(self, fetch, refresh_margin=60, fallback_ttl=300):
+        """
+        Args:
+            fetch (callable): Returns [access_token, entitlements_token] from the local client.
+            refresh_margin (int): Seconds before expiry at which tokens are refreshed.
+            fallback_ttl (int): Lifetime assumed for tokens without an `exp` claim.
+        """
+        self._fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.fallback_ttl = fallback_ttl
+        self.generation = 0
+        self._tokens = None
+        self._subject = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def expires_at(self):
+        return self._expires_at
+
+    def is_fresh(self):
+        """True if tokens are cached and not within `refresh_margin` of expiring."""
+        return self._tokens is not None and time.time() < self._expires_at - self.refresh_margin
+
+    def _refresh_locked(self):
+        access_token, entitlements_token = self._fetch()
+        access_claims = decode_jwt_claims(access_token)
+        expiries = [
+            claims["exp"]
+            for claims in (access_claims, decode_jwt_claims(entitlements_token))
+            if isinstance(claims.get("exp"), (int, float))
+        ]
+        self._expires_at = min(expiries) if expiries else time.time() + self.fallback_ttl
+        self._tokens = (access_token, entitlements_token)
+        self._subject = access_claims.get("sub")
+        self.generation += 1
+
+    def get_tokens(self):
+        """
+        Return the cached tokens, refreshing them first if they are about to expire.
+
+        Returns:
+            tuple: (access_token, entitlements_token)
+        """
+        if self.is_fresh():
+            return self._tokens
+
+        with self._lock:
+            if not self.is_fresh():
+                self._refresh_locked()
+            return self._tokens
+
+    def force_refresh(self, stale_access_token=None):
+        """
+        Refresh the tokens regardless of their expiry.
+
+        Args:
+            stale_access_token (str): The access token that was rejected. If another
+                caller already replaced it, the newer tokens are returned without
+                refreshing again.
+
+        Returns:
+            tuple: (access_token, entitlements_token)
+        """
+        with self._lock:
+            if stale_access_token is None or self._tokens is None or self._tokens[0] == stale_access_token:
+                self._refresh_locked()
+            return self._tokens
+
+    def get_subject(self):
+        """Return the `sub` claim (the player's PUUID) of the current access token, or None."""
+        self.get_tokens()
+        return self._subject